@@ -9,11 +9,13 @@ Demonstrates TOON's handling of:
 - Complex real-world data
 """
 
-import toonverter as toon
+import argparse
 import json
 
+import toonverter as toon
+
 
-def example_nested_objects():
+def example_nested_objects(verbose=False):
     """Example with nested objects."""
     print("\n--- Nested Objects ---")
 
@@ -30,8 +32,9 @@ def example_nested_objects():
         }
     }
 
-    print("\nOriginal JSON:")
-    print(json.dumps(data, indent=2))
+    if verbose:
+        print("\nOriginal JSON:")
+        print(json.dumps(data, indent=2))
 
     # Encode to TOON
     toon_str = toon.encode(data)
@@ -43,7 +46,7 @@ def example_nested_objects():
     print("\nRoundtrip successful:", data == decoded)
 
 
-def example_nested_arrays():
+def example_nested_arrays(verbose=False):
     """Example with nested arrays."""
     print("\n--- Nested Arrays ---")
 
@@ -65,8 +68,9 @@ def example_nested_arrays():
         ]
     }
 
-    print("\nOriginal JSON:")
-    print(json.dumps(data, indent=2))
+    if verbose:
+        print("\nOriginal JSON:")
+        print(json.dumps(data, indent=2))
 
     # Encode to TOON
     toon_str = toon.encode(data)
@@ -78,7 +82,7 @@ def example_nested_arrays():
     print(f"\nToken savings: {report.max_savings_percentage:.1f}%")
 
 
-def example_complex_structure():
+def example_complex_structure(verbose=False):
     """Example with complex real-world structure."""
     print("\n--- Complex Real-World Structure ---")
 
@@ -119,8 +123,9 @@ def example_complex_structure():
         "metadata": {"created": "2025-01-15", "version": "1.0", "active": True},
     }
 
-    print("\nOriginal JSON:")
-    print(json.dumps(data, indent=2))
+    if verbose:
+        print("\nOriginal JSON:")
+        print(json.dumps(data, indent=2))
 
     # Encode to TOON
     toon_str = toon.encode(data)
@@ -143,7 +148,7 @@ def example_complex_structure():
     print(f"Savings: {((len(json_str) - len(toon_str)) / len(json_str) * 100):.1f}%")
 
 
-def example_array_forms():
+def example_array_forms(verbose=False):
     """Example showing different array forms in TOON."""
     print("\n--- Different Array Forms ---")
 
@@ -171,8 +176,9 @@ def example_array_forms():
         ],
     }
 
-    print("\nOriginal JSON:")
-    print(json.dumps(data, indent=2))
+    if verbose:
+        print("\nOriginal JSON:")
+        print(json.dumps(data, indent=2))
 
     # Encode to TOON
     toon_str = toon.encode(data)
@@ -186,14 +192,20 @@ def example_array_forms():
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="also print each input as indented JSON"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Example 3: Nested Structures")
     print("=" * 60)
 
-    example_nested_objects()
-    example_nested_arrays()
-    example_complex_structure()
-    example_array_forms()
+    example_nested_objects(args.verbose)
+    example_nested_arrays(args.verbose)
+    example_complex_structure(args.verbose)
+    example_array_forms(args.verbose)
 
 
 if __name__ == "__main__":
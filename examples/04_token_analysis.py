@@ -9,8 +9,70 @@ Demonstrates:
 - Understanding token savings
 """
 
-import toonverter as toon
 import json
+from functools import lru_cache
+
+# Compact JSON for size-only work and cache keys; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+
+try:
+    from toonverter import Analyzer, TiktokenCounter
+
+    ANALYZER_AVAILABLE = True
+except ImportError:
+    ANALYZER_AVAILABLE = False
+    print("Install tiktoken: pip install tiktoken")
+
+
+# One Analyzer per tiktoken encoding, shared by every demo below. Models that
+# map to the same encoding (gpt-4 and gpt-3.5-turbo both use cl100k_base)
+# share an entry, so each vocabulary is loaded once per run.
+_ANALYZERS = {}
+
+
+def _encoding_for(model):
+    return TiktokenCounter.MODEL_ENCODINGS.get(model, model)
+
+
+def _get_analyzer(encoding):
+    """Return the shared Analyzer for ``encoding``, creating it on first use."""
+    analyzer = _ANALYZERS.get(encoding)
+    if analyzer is None:
+        analyzer = _ANALYZERS[encoding] = Analyzer(model=encoding)
+    return analyzer
+
+
+@lru_cache(maxsize=128)
+def _analyze_canonical(canonical, formats, encoding):
+    return _get_analyzer(encoding).analyze_multi_format(
+        json.loads(canonical), formats=list(formats)
+    )
+
+
+def analyze(data, formats=("json", "yaml", "toon"), model="gpt-4"):
+    """Analyze ``data`` across ``formats``, memoized on its compact JSON form.
+
+    Key order is kept (no ``sort_keys``) so the cached report describes exactly
+    the document that was passed in.
+    """
+    canonical = _dumps(data)
+    return _analyze_canonical(canonical, tuple(formats), _encoding_for(model))
+
+
+# Bounded-cardinality text for the RAG demo, formatted once rather than per document
+_TOPIC_SUFFIXES = tuple(
+    f" containing important information about topic {k}." for k in range(5)
+)
 
 
 def analyze_simple_object():
@@ -20,7 +82,7 @@ def analyze_simple_object():
     data = {"name": "Alice", "age": 30, "city": "NYC", "active": True}
 
     # Analyze across all formats
-    report = toon.analyze(data, compare_formats=["json", "yaml", "toon"])
+    report = analyze(data, ["json", "yaml", "toon"])
 
     print("\nData:", data)
     print("\nToken counts by format:")
@@ -45,7 +107,7 @@ def analyze_tabular_data():
     print(f"\nDataset: {len(data['users'])} rows, 3 columns")
 
     # Analyze
-    report = toon.analyze(data, compare_formats=["json", "yaml", "toon"])
+    report = analyze(data, ["json", "yaml", "toon"])
 
     print("\nToken counts by format:")
     for fmt, result in report.format_results.items():
@@ -84,7 +146,7 @@ def analyze_nested_structure():
     }
 
     # Analyze
-    report = toon.analyze(data, compare_formats=["json", "yaml", "toon"])
+    report = analyze(data, ["json", "yaml", "toon"])
 
     print("\nToken counts by format:")
     for fmt, result in report.format_results.items():
@@ -107,13 +169,11 @@ def compare_with_different_tokenizers():
 
     print("\nData:", json.dumps(data))
 
-    # Try different tokenizer models
-    for model in ["gpt-4", "gpt-3.5-turbo"]:
+    # Try different tokenizer models (models sharing an encoding reuse one
+    # Analyzer and, for identical data, one cached report)
+    for model in ("gpt-4", "gpt-3.5-turbo"):
         try:
-            from toonverter import Analyzer
-
-            analyzer = Analyzer(model=model)
-            report = analyzer.analyze_multi_format(data, formats=["json", "toon"])
+            report = analyze(data, ["json", "toon"], model=model)
 
             print(f"\nTokenizer: {model}")
             print(f"  JSON: {report.format_results['json'].token_count} tokens")
@@ -132,7 +192,7 @@ def real_world_example():
         "documents": [
             {
                 "id": i,
-                "content": f"This is document {i} containing important information about topic {i % 5}.",
+                "content": "This is document " + str(i) + _TOPIC_SUFFIXES[i % 5],
                 "metadata": {"source": f"doc{i}.pdf", "page": i % 100},
             }
             for i in range(1, 51)  # 50 documents
@@ -142,7 +202,7 @@ def real_world_example():
     print(f"\nScenario: RAG system with {len(documents['documents'])} documents")
 
     # Analyze
-    report = toon.analyze(documents, compare_formats=["json", "toon"])
+    report = analyze(documents, ["json", "toon"])
 
     json_tokens = report.format_results["json"].token_count
     toon_tokens = report.format_results["toon"].token_count
@@ -170,6 +230,9 @@ def main():
     print("Example 4: Token Analysis and Comparison")
     print("=" * 60)
 
+    if not ANALYZER_AVAILABLE:
+        return
+
     analyze_simple_object()
     analyze_tabular_data()
     analyze_nested_structure()
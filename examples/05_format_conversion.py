@@ -9,9 +9,44 @@ Demonstrates:
 - Format detection
 """
 
-import toonverter as toon
-import tempfile
+import json
 import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import toonverter as toon
+
+
+# Compact JSON for size-only work and cache keys; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Large-dataset fixture (10,000 records), built once per process
+_CATS = tuple(sys.intern(f"Cat{k}") for k in range(10))
+_LARGE_RECS = [{"id": i, "value": f"Record {i}", "category": _CATS[i % 10]} for i in range(10000)]
+
+
+def _reported_size(result, key, path):
+    """Byte count ``convert()`` reported under ``key``, or the file size if it didn't.
+
+    A failed conversion (e.g. token counting without the tiktoken encoding)
+    carries no metadata, though the target file may already be written.
+    """
+    if not result.success:
+        print(f"Conversion reported an error: {result.error}")
+    size = result.metadata.get(key)
+    return os.path.getsize(path) if size is None else size
 
 
 def example_direct_conversion():
@@ -52,12 +87,15 @@ def example_file_conversion():
     with tempfile.TemporaryDirectory() as tmpdir:
         # Save as JSON
         json_file = os.path.join(tmpdir, "config.json")
-        toon.save(data, json_file, format="json")
+        json_size = toon.save(data, json_file, format="json")
         print(f"\nSaved JSON: {json_file}")
 
         # Convert JSON -> TOON
         toon_file = os.path.join(tmpdir, "config.toon")
-        toon.convert(source=json_file, target=toon_file, from_format="json", to_format="toon")
+        result = toon.convert(
+            source=json_file, target=toon_file, from_format="json", to_format="toon"
+        )
+        toon_size = _reported_size(result, "target_bytes", toon_file)
         print(f"Converted to TOON: {toon_file}")
 
         # Load TOON file
@@ -68,9 +106,7 @@ def example_file_conversion():
         # Verify roundtrip
         print(f"\nRoundtrip verification: {data == loaded_data}")
 
-        # Show file sizes
-        json_size = os.path.getsize(json_file)
-        toon_size = os.path.getsize(toon_file)
+        # Show file sizes (reported by save/convert)
         print(f"\nFile sizes:")
         print(f"  JSON: {json_size} bytes")
         print(f"  TOON: {toon_size} bytes")
@@ -101,16 +137,14 @@ def example_batch_conversion():
         print(f"\nConverting {len(datasets)} files...")
 
         for name, data in datasets.items():
-            # Save as JSON
-            json_file = os.path.join(tmpdir, f"{name}.json")
-            toon.save(data, json_file, format="json")
-
-            # Convert to TOON
-            toon_file = os.path.join(tmpdir, f"{name}.toon")
-            toon.convert(source=json_file, target=toon_file, from_format="json", to_format="toon")
-
-            json_size = os.path.getsize(json_file)
-            toon_size = os.path.getsize(toon_file)
+            # The data is already in memory, so encode it straight to TOON and
+            # write once instead of round-tripping through an intermediate JSON file
+            toon_bytes = toon.encode(data).encode("utf-8")
+            Path(tmpdir, f"{name}.toon").write_bytes(toon_bytes)
+
+            # Size the JSON the file would have held without writing it
+            json_size = len(toon.encode(data, to_format="json").encode("utf-8"))
+            toon_size = len(toon_bytes)
             savings = (json_size - toon_size) / json_size * 100
 
             print(
@@ -145,42 +179,42 @@ def example_streaming_large_files():
     """Handle large files efficiently."""
     print("\n--- Streaming Large Files ---")
 
-    # Create a large dataset
-    large_data = {
-        "records": [
-            {"id": i, "value": f"Record {i}", "category": f"Cat{i % 10}"}
-            for i in range(10000)  # 10,000 records
-        ]
-    }
+    # Large dataset, precomputed at import
+    records = _LARGE_RECS
 
-    print(f"\nDataset size: {len(large_data['records'])} records")
+    print(f"\nDataset size: {len(records)} records")
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        import time
-
-        # Save as JSON
-        json_file = os.path.join(tmpdir, "large.json")
-        start = time.time()
-        toon.save(large_data, json_file, format="json")
-        json_time = time.time() - start
-
-        # Convert to TOON
+        # Save as JSON Lines, one record per line, without building the whole document
+        jsonl_file = os.path.join(tmpdir, "large.jsonl")
+        start = time.perf_counter_ns()
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.writelines(_dumps(record) + "\n" for record in records)
+        json_time_ms = (time.perf_counter_ns() - start) / 1e6
+
+        # Stream JSON Lines -> TOON; peak memory stays at one record
         toon_file = os.path.join(tmpdir, "large.toon")
-        start = time.time()
-        toon.convert(source=json_file, target=toon_file, from_format="json", to_format="toon")
-        convert_time = time.time() - start
-
-        # Compare
-        json_size = os.path.getsize(json_file)
-        toon_size = os.path.getsize(toon_file)
+        start = time.perf_counter_ns()
+        result = toon.convert(
+            source=jsonl_file,
+            target=toon_file,
+            from_format="jsonl",
+            to_format="toon",
+            streaming=True,
+        )
+        convert_time_ms = (time.perf_counter_ns() - start) / 1e6
+
+        # Compare sizes as counted during the conversion
+        json_size = _reported_size(result, "source_bytes", jsonl_file)
+        toon_size = _reported_size(result, "target_bytes", toon_file)
 
         print(f"\nPerformance:")
-        print(f"  JSON save time: {json_time * 1000:.2f}ms")
-        print(f"  Convert time:   {convert_time * 1000:.2f}ms")
+        print(f"  JSONL save time: {json_time_ms:.2f}ms")
+        print(f"  Convert time:    {convert_time_ms:.2f}ms")
 
         print(f"\nFile sizes:")
-        print(f"  JSON: {json_size:,} bytes")
-        print(f"  TOON: {toon_size:,} bytes")
+        print(f"  JSONL: {json_size:,} bytes")
+        print(f"  TOON:  {toon_size:,} bytes")
         print(f"  Savings: {((json_size - toon_size) / json_size * 100):.1f}%")
 
 
@@ -9,6 +9,9 @@ Demonstrates:
 - Token savings in document chains
 """
 
+import json
+from functools import lru_cache
+
 try:
     from langchain.schema import Document, HumanMessage, AIMessage
     from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -25,6 +28,29 @@ except ImportError:
     print("Install langchain: pip install toonverter[langchain]")
 
 import toonverter as toon
+from toonverter import TiktokenCounter
+
+
+# Compact JSON bytes for size comparisons; orjson is used when installed
+try:
+    import orjson
+
+    def _json_bytes(obj):
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_bytes(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=4096)
+def _encode_chunk(content):
+    """Encode a metadata-free chunk to TOON; repeated chunks are encoded once.
+
+    The output matches ``langchain_to_toon(Document(page_content=content))``.
+    """
+    return toon.encode({"page_content": content, "metadata": {}})
 
 
 def example_document_conversion():
@@ -88,10 +114,12 @@ def example_message_conversion():
         AIMessage(content="TOON uses minimal syntax, tabular formats, and smart quoting rules."),
     ]
 
+    # Display role per exact message class
+    roles = {HumanMessage: "Human", AIMessage: "AI"}
+
     print("\nOriginal messages:")
     for msg in messages:
-        role = "Human" if isinstance(msg, HumanMessage) else "AI"
-        print(f"  {role}: {msg.content[:50]}...")
+        print(f"  {roles.get(type(msg), 'Other')}: {msg.content[:50]}...")
 
     # Convert to TOON (using specialized message converter)
     toon_str = messages_to_toon(messages)
@@ -128,30 +156,32 @@ def example_rag_pipeline():
 
     print(f"\nKnowledge base: {len(documents)} documents")
 
-    # Convert to TOON for storage
-    toon_docs = [langchain_to_toon(doc) for doc in documents]
+    # Build the storage payload once and encode it once per format
+    payload = {
+        "documents": [{"content": doc.page_content, "metadata": doc.metadata} for doc in documents]
+    }
+    toon_str = toon.encode(payload)
+    json_bytes = _json_bytes(payload)
 
     # Calculate storage savings
-    import json
-
-    json_size = sum(
-        len(json.dumps({"content": doc.page_content, "metadata": doc.metadata}))
-        for doc in documents
-    )
-    toon_size = sum(len(toon_str) for toon_str in toon_docs)
+    json_size = len(json_bytes)
+    toon_size = len(toon_str.encode("utf-8"))
 
     print(f"\nStorage comparison:")
     print(f"  JSON: {json_size} bytes")
     print(f"  TOON: {toon_size} bytes")
     print(f"  Savings: {((json_size - toon_size) / json_size * 100):.1f}%")
 
-    # Token analysis
-    all_docs_dict = [{"content": doc.page_content, "metadata": doc.metadata} for doc in documents]
-    report = toon.analyze({"documents": all_docs_dict}, compare_formats=["json", "toon"])
+    # Token analysis of the strings encoded above, tokenized in one batch
+    json_analysis, toon_analysis = TiktokenCounter().analyze_batch(
+        [json_bytes.decode("utf-8"), toon_str], ["json", "toon"]
+    )
+    json_tokens = json_analysis.token_count
+    toon_tokens = toon_analysis.token_count
 
-    print(f"\nToken savings: {report.max_savings_percentage:.1f}%")
-    print(f"  JSON: {report.format_results['json'].token_count} tokens")
-    print(f"  TOON: {report.format_results['toon'].token_count} tokens")
+    print(f"\nToken savings: {((json_tokens - toon_tokens) / json_tokens * 100):.1f}%")
+    print(f"  JSON: {json_tokens} tokens")
+    print(f"  TOON: {toon_tokens} tokens")
 
 
 def example_document_splitting():
@@ -172,30 +202,36 @@ def example_document_splitting():
         * 5
     )  # Repeat to make it longer
 
-    # Split into chunks
+    # Split into chunks and process them one at a time: each chunk is encoded
+    # and sized in a single pass, and only the first is kept as a sample.
+    # split_text yields plain strings, so no Document wrappers are built, and
+    # chunks repeated verbatim (common with overlapping windows over repetitive
+    # text) are served from the encode cache.
     splitter = RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=50)
-    chunks = splitter.create_documents([long_text])
 
-    print(f"\nDocument split into {len(chunks)} chunks")
+    # Module-level helpers bound to locals for the per-chunk loop
+    encode_chunk, json_bytes = _encode_chunk, _json_bytes
+
+    num_chunks = json_size = toon_size = 0
+    sample = None
+    for chunk in splitter.split_text(long_text):
+        toon_str = encode_chunk(chunk)
+        json_size += len(json_bytes({"content": chunk, "metadata": {}}))
+        toon_size += len(toon_str.encode("utf-8"))
+        num_chunks += 1
+        if sample is None:
+            sample = (chunk, toon_str)
 
-    # Convert chunks to TOON
-    toon_chunks = [langchain_to_toon(chunk) for chunk in chunks]
+    print(f"\nDocument split into {num_chunks} chunks")
+    print(f"Repeated chunks served from cache: {_encode_chunk.cache_info().hits}")
 
     # Show sample
+    sample_text, sample_toon = sample
     print("\nSample chunk (original):")
-    print(chunks[0].page_content[:100] + "...")
+    print(sample_text[:100] + "...")
 
     print("\nSample chunk (TOON):")
-    print(toon_chunks[0][:150] + "...")
-
-    # Calculate savings
-    import json
-
-    json_size = sum(
-        len(json.dumps({"content": chunk.page_content, "metadata": chunk.metadata}))
-        for chunk in chunks
-    )
-    toon_size = sum(len(toon_str) for toon_str in toon_chunks)
+    print(sample_toon[:150] + "...")
 
     print(f"\nTotal chunks storage:")
     print(f"  JSON: {json_size} bytes")
@@ -9,11 +9,26 @@ Demonstrates:
 - Plugin development
 """
 
+import re
+from io import StringIO
+
 import toonverter as toon
 from toonverter.core.interfaces import FormatAdapter
 from toonverter.core.registry import registry
 from typing import Any, Dict
 
+# One INI line: a "[section]" header or a "key = value" pair, with the
+# surrounding blanks matched outside the groups. Comment lines ("#...") and
+# anything else simply don't match.
+_INI_LINE = re.compile(
+    r"^(?![^\S\n]*#)[^\S\n]*(?:\[(?P<section>.*)\]|(?P<key>[^=\n]*?)[^\S\n]*=[^\S\n]*(?P<value>.*?))"
+    r"[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Cell separator in a Markdown table row, swallowing the padding around it
+_PIPE = re.compile(r"\s*\|\s*")
+
 
 class INIAdapter(FormatAdapter):
     """Custom adapter for INI format."""
@@ -23,31 +38,30 @@ class INIAdapter(FormatAdapter):
         if not isinstance(data, dict):
             raise ValueError("INI format requires dict at root")
 
-        lines = []
+        buf = StringIO()
+        write = buf.write
+        sep = ""
         for section, values in data.items():
-            lines.append(f"[{section}]")
+            # Blank line between sections, none after the last one
+            write(f"{sep}[{section}]\n")
+            sep = "\n"
             if isinstance(values, dict):
                 for key, value in values.items():
-                    lines.append(f"{key} = {value}")
-            lines.append("")
-        return "\n".join(lines)
+                    write(f"{key} = {value}\n")
+        return buf.getvalue()
 
     def decode(self, data_str: str, options: dict[str, Any]) -> Any:
         """Decode INI format to data."""
         result = {}
         current_section = None
 
-        for line in data_str.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            if line.startswith("[") and line.endswith("]"):
-                current_section = line[1:-1]
+        for match in _INI_LINE.finditer(data_str):
+            section = match["section"]
+            if section is not None:
+                current_section = section
                 result[current_section] = {}
-            elif "=" in line and current_section:
-                key, value = line.split("=", 1)
-                result[current_section][key.strip()] = value.strip()
+            elif current_section:
+                result[current_section][match["key"]] = match["value"]
 
         return result
 
@@ -65,19 +79,28 @@ class MarkdownTableAdapter(FormatAdapter):
             return ""
 
         # Get headers from first row
-        headers = list(rows[0].keys())
+        headers = tuple(rows[0])
+
+        # One row template, built once and filled per row
+        fmt = "| " + " | ".join(["{}"] * len(headers)) + " |"
 
-        # Create header row
-        lines = []
-        lines.append("| " + " | ".join(headers) + " |")
-        lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+        # Create header row; every later row starts with its own newline
+        buf = StringIO()
+        write = buf.write
+        write(fmt.format(*headers))
+        fmt = "\n" + fmt
+        write(fmt.format(*["---"] * len(headers)))
 
-        # Create data rows
-        for row in rows:
-            values = [str(row.get(h, "")) for h in headers]
-            lines.append("| " + " | ".join(values) + " |")
+        # Create data rows; when every row has the header keys in header order
+        # (the common case) the values can be used as they are
+        if all(tuple(row) == headers for row in rows):
+            for row in rows:
+                write(fmt.format(*row.values()))
+        else:
+            for row in rows:
+                write(fmt.format(*[row.get(h, "") for h in headers]))
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def decode(self, data_str: str, options: dict[str, Any]) -> Any:
         """Decode Markdown table to data."""
@@ -86,15 +109,13 @@ class MarkdownTableAdapter(FormatAdapter):
         if len(lines) < 3:
             return {"rows": []}
 
-        # Parse headers
-        headers = [h.strip() for h in lines[0].split("|")[1:-1]]
+        # Parse headers; lines are stripped, so the split has an empty first
+        # and last item for the outer pipes
+        split = _PIPE.split
+        headers = split(lines[0])[1:-1]
 
         # Parse data rows (skip header and separator)
-        rows = []
-        for line in lines[2:]:
-            values = [v.strip() for v in line.split("|")[1:-1]]
-            row = dict(zip(headers, values))
-            rows.append(row)
+        rows = [dict(zip(headers, split(line)[1:-1])) for line in lines[2:]]
 
         return {"rows": rows}
 
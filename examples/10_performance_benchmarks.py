@@ -3,15 +3,55 @@
 Example 10: Performance Benchmarks
 
 Demonstrates:
-- Encoding/decoding speed
+- Encoding/decoding speed (best of 5 runs, monotonic clock)
 - Memory usage
 - Scalability with large datasets
 - Performance comparison across formats
 """
 
-import toonverter as toon
-import time
 import json
+import time
+
+import toonverter as toon
+
+
+# JSON baseline: orjson when installed (it returns bytes), else compact stdlib json
+try:
+    import orjson
+
+    JSON_LIB = "orjson"
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    JSON_LIB = "json"
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+
+def _bench(fn, *args, repeat=5):
+    """Run ``fn(*args)`` ``repeat`` times on the monotonic clock.
+
+    Returns:
+        Tuple of (fastest run in milliseconds, result of the last run). The
+        minimum is the least noisy statistic for CPU-bound work.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = fn(*args)
+        timings.append(time.perf_counter_ns() - start)
+    return min(timings) / 1e6, result
+
+
+def _toon_roundtrip(data):
+    return toon.decode(toon.encode(data))
+
+
+def _json_roundtrip(data):
+    return _json_loads(_json_dumps(data))
 
 
 def benchmark_encoding():
@@ -26,19 +66,18 @@ def benchmark_encoding():
         }
 
         # Benchmark TOON encoding
-        start = time.time()
-        toon_str = toon.encode(data)
-        toon_time = (time.time() - start) * 1000
+        toon_time, toon_str = _bench(toon.encode, data)
 
         # Benchmark JSON encoding
-        start = time.time()
-        json_str = json.dumps(data)
-        json_time = (time.time() - start) * 1000
+        json_time, json_bytes = _bench(_json_dumps, data)
+
+        toon_size = len(toon_str.encode("utf-8"))
+        json_size = len(json_bytes)
 
         print(f"\n{size:,} records:")
-        print(f"  TOON: {toon_time:6.2f}ms ({len(toon_str):,} bytes)")
-        print(f"  JSON: {json_time:6.2f}ms ({len(json_str):,} bytes)")
-        print(f"  Size savings: {((len(json_str) - len(toon_str)) / len(json_str) * 100):.1f}%")
+        print(f"  TOON: {toon_time:6.2f}ms ({toon_size:,} bytes)")
+        print(f"  JSON: {json_time:6.2f}ms ({json_size:,} bytes, {JSON_LIB})")
+        print(f"  Size savings: {((json_size - toon_size) / json_size * 100):.1f}%")
 
 
 def benchmark_decoding():
@@ -51,21 +90,17 @@ def benchmark_decoding():
         data = {"records": [{"id": i, "name": f"Item{i}"} for i in range(size)]}
 
         toon_str = toon.encode(data)
-        json_str = json.dumps(data)
+        json_bytes = _json_dumps(data)
 
         # Benchmark TOON decoding
-        start = time.time()
-        toon_decoded = toon.decode(toon_str)
-        toon_time = (time.time() - start) * 1000
+        toon_time, _ = _bench(toon.decode, toon_str)
 
         # Benchmark JSON decoding
-        start = time.time()
-        json_decoded = json.loads(json_str)
-        json_time = (time.time() - start) * 1000
+        json_time, _ = _bench(_json_loads, json_bytes)
 
         print(f"\n{size:,} records:")
         print(f"  TOON decode: {toon_time:6.2f}ms")
-        print(f"  JSON decode: {json_time:6.2f}ms")
+        print(f"  JSON decode: {json_time:6.2f}ms ({JSON_LIB})")
 
 
 def benchmark_roundtrip():
@@ -78,20 +113,14 @@ def benchmark_roundtrip():
         data = {"items": [{"id": i, "data": f"Data{i}", "value": i * 10} for i in range(size)]}
 
         # TOON roundtrip
-        start = time.time()
-        toon_str = toon.encode(data)
-        decoded = toon.decode(toon_str)
-        toon_time = (time.time() - start) * 1000
+        toon_time, _ = _bench(_toon_roundtrip, data)
 
         # JSON roundtrip
-        start = time.time()
-        json_str = json.dumps(data)
-        decoded = json.loads(json_str)
-        json_time = (time.time() - start) * 1000
+        json_time, _ = _bench(_json_roundtrip, data)
 
         print(f"\n{size:,} records roundtrip:")
         print(f"  TOON: {toon_time:6.2f}ms")
-        print(f"  JSON: {json_time:6.2f}ms")
+        print(f"  JSON: {json_time:6.2f}ms ({JSON_LIB})")
 
 
 def main():
@@ -11,9 +11,14 @@ Install dependencies:
     pip install toonverter[dspy]
 """
 
+import os
+from functools import cache, lru_cache
+from itertools import islice
+
 import dspy
 from dspy import Example, Prediction
 
+from toonverter.analysis import count_tokens as _count_tokens, count_tokens_batch
 from toonverter.integrations.dspy import (
     dspy_to_toon,
     toon_to_dspy,
@@ -28,6 +33,59 @@ from toonverter.integrations.dspy import (
 )
 
 
+# JSON baseline for token comparisons; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj, indent=False, default=None):
+        # Dataclasses go through ``default`` too, as with the stdlib encoder
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj, indent=False, default=None):
+        if indent:
+            return json.dumps(obj, indent=2, default=default)
+        return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text):
+    """Count tokens in ``text``; repeated strings are tokenized once."""
+    return _count_tokens(text)
+
+
+def count_tokens_streaming(chunks, batch_size=256):
+    """Total the token counts of text chunks, tokenizing a batch at a time."""
+    chunks = iter(chunks)
+    total = 0
+    while batch := list(islice(chunks, batch_size)):
+        total += sum(count_tokens_batch(batch))
+    return total
+
+
+def size_metric(chunks, metric="tokens"):
+    """Total size of text chunks in tokens, or in UTF-8 bytes for ``"bytes"``.
+
+    Byte counts track token counts closely for ASCII data and skip
+    tokenization entirely.
+    """
+    if metric == "bytes":
+        return sum(len(chunk.encode("utf-8")) for chunk in chunks)
+    return count_tokens_streaming(chunks)
+
+
+def _iter_json_array(items, default=None):
+    """Yield a compact JSON array one element at a time."""
+    separator = "["
+    for item in items:
+        yield separator + _dumps(item, default=default)
+        separator = ","
+    yield "]" if separator == "," else "[]"
+
+
 # =============================================================================
 # 1. EXAMPLE CONVERSION
 # =============================================================================
@@ -108,9 +166,7 @@ def example_dataset_serialization():
         for i in range(1000)
     ]
 
-    chunk_count = 0
-    for chunk_toon in stream_dataset_to_toon(large_dataset, chunk_size=200):
-        chunk_count += 1
+    chunk_count = sum(1 for _ in stream_dataset_to_toon(large_dataset, chunk_size=200))
 
     print(f"✅ Streamed 1000 examples in {chunk_count} chunks (200 examples/chunk)")
 
@@ -282,15 +338,58 @@ def example_optimization_traces():
 # =============================================================================
 
 
-def example_token_savings():
-    """Example: Analyze token savings for DSPy workflows."""
+def _example_json(obj):
+    """JSON ``default`` hook serializing an Example straight from its fields."""
+    if isinstance(obj, Example):
+        return {
+            "question": obj.question,
+            "context": obj.context,
+            "answer": obj.answer,
+            "reasoning": obj.reasoning,
+        }
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+@cache
+def _build_examples(count):
+    """Build ``count`` benchmark examples once; repeated runs reuse the tuple."""
+    return tuple(
+        Example(
+            question=f"What is the result of calculation {i}?",
+            context=f"Given the numbers {i} and {i + 1}, perform the operation.",
+            answer=f"The answer is {i * 2}",
+            reasoning=f"By calculating {i} * 2, we get {i * 2}",
+        )
+        for i in range(count)
+    )
+
+
+# Sizes are measured chunk by chunk instead of building whole documents, and
+# cached per case so re-running the example does not re-encode anything
+@cache
+def _toon_size(fixture_count, count, metric):
+    """Size of the first ``count`` fixture examples encoded as TOON."""
+    examples = _build_examples(fixture_count)[:count]
+    return size_metric(stream_dataset_to_toon(examples, chunk_size=200), metric)
+
+
+@cache
+def _json_size(fixture_count, count, metric):
+    """Size of the first ``count`` fixture examples encoded as JSON."""
+    examples = _build_examples(fixture_count)[:count]
+    return size_metric(_iter_json_array(examples, default=_example_json), metric)
+
+
+def example_token_savings(metric="tokens"):
+    """Example: Analyze token savings for DSPy workflows.
+
+    Pass ``metric="bytes"`` to compare UTF-8 sizes instead of tokenizing.
+    """
     print("\n" + "=" * 70)
     print("7. TOKEN SAVINGS ANALYSIS")
     print("=" * 70)
 
-    import json
-    from toonverter.analysis import count_tokens
-
     test_cases = [
         ("Small Dataset (10 examples)", 10),
         ("Medium Dataset (50 examples)", 50),
@@ -298,44 +397,26 @@ def example_token_savings():
         ("Very Large Dataset (1000 examples)", 1000),
     ]
 
-    print("\n📊 Token Savings by Dataset Size:\n")
+    print(f"\n📊 Savings by Dataset Size ({metric}):\n")
     print(f"{'Dataset Size':<30} {'JSON':<12} {'TOON':<12} {'Savings':<15}")
     print("-" * 70)
 
+    # Build the largest fixture once; smaller cases use a prefix of it
+    max_count = max(count for _, count in test_cases)
+    # TOON_SKIP_JSON_BENCH=1 reports TOON sizes only
+    skip_json = bool(os.getenv("TOON_SKIP_JSON_BENCH"))
+
     for label, count in test_cases:
-        # Create examples
-        examples = [
-            Example(
-                question=f"What is the result of calculation {i}?",
-                context=f"Given the numbers {i} and {i + 1}, perform the operation.",
-                answer=f"The answer is {i * 2}",
-                reasoning=f"By calculating {i} * 2, we get {i * 2}",
-            )
-            for i in range(count)
-        ]
-
-        # Convert to TOON
-        toon = dataset_to_toon(examples)
-
-        # Convert to JSON
-        json_data = [
-            {
-                "question": ex.question,
-                "context": ex.context,
-                "answer": ex.answer,
-                "reasoning": ex.reasoning,
-            }
-            for ex in examples
-        ]
-        json_str = json.dumps(json_data)
-
-        # Count tokens
-        toon_tokens = count_tokens(toon)
-        json_tokens = count_tokens(json_str)
-        savings = json_tokens - toon_tokens
-        savings_pct = savings / json_tokens * 100
-
-        print(f"{label:<30} {json_tokens:<12} {toon_tokens:<12} {savings} ({savings_pct:.1f}%)")
+        toon_size = _toon_size(max_count, count, metric)
+        if skip_json:
+            print(f"{label:<30} {'N/A':<12} {toon_size:<12} N/A")
+            continue
+
+        json_size = _json_size(max_count, count, metric)
+        savings = json_size - toon_size
+        savings_pct = savings / json_size * 100
+
+        print(f"{label:<30} {json_size:<12} {toon_size:<12} {savings} ({savings_pct:.1f}%)")
 
 
 # =============================================================================
@@ -360,13 +441,10 @@ def example_prompt_optimization():
         Example(text="Complete waste of money.", label="negative"),
     ]
 
-    # Compare JSON vs TOON for prompt inclusion
-    import json
-    from toonverter.analysis import count_tokens
-
-    # JSON representation
+    # Compare JSON vs TOON for prompt inclusion: compact JSON is what a prompt
+    # would carry, the indented form is only for display
     json_examples = [{"text": ex.text, "label": ex.label} for ex in examples]
-    json_str = json.dumps(json_examples, indent=2)
+    json_str = _dumps(json_examples)
 
     # TOON representation
     toon_str = few_shot_to_toon(examples)
@@ -377,7 +455,7 @@ def example_prompt_optimization():
     savings_pct = savings / json_tokens * 100
 
     print(f"\n📋 JSON Format ({json_tokens} tokens):")
-    print(json_str[:200] + "...")
+    print(_dumps(json_examples, indent=True)[:200] + "...")
 
     print(f"\n📋 TOON Format ({toon_tokens} tokens):")
     print(toon_str[:200] + "...")
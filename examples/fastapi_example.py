@@ -2,30 +2,40 @@
 
 try:
     from fastapi import FastAPI
+
+    import toonverter as toon
     from toonverter.integrations import TOONResponse
 
     app = FastAPI(title="TOON Converter API Example")
 
-    @app.get("/users", response_class=TOONResponse)
-    async def get_users():
-        """Return users in TOON format (token-optimized)."""
-        users = [
+    # These payloads never change, so they are encoded once at import time;
+    # TOONResponse sends already-encoded TOON text as-is
+    USERS_TOON = toon.encode(
+        [
             {"id": 1, "name": "Alice", "email": "alice@example.com", "active": True},
             {"id": 2, "name": "Bob", "email": "bob@example.com", "active": True},
             {"id": 3, "name": "Charlie", "email": "charlie@example.com", "active": False},
         ]
-        # Automatically encoded as TOON with proper content-type
-        return users
-
-    @app.get("/stats", response_class=TOONResponse)
-    async def get_stats():
-        """Return statistics in TOON format."""
-        return {
+    )
+    STATS_TOON = toon.encode(
+        {
             "total_users": 1000,
             "active_users": 750,
             "requests_today": 5432,
             "average_response_time_ms": 45.7,
         }
+    )
+
+    @app.get("/users", response_class=TOONResponse)
+    async def get_users():
+        """Return users in TOON format (token-optimized)."""
+        # Served with the TOON content-type, without re-encoding per request
+        return TOONResponse(USERS_TOON)
+
+    @app.get("/stats", response_class=TOONResponse)
+    async def get_stats():
+        """Return statistics in TOON format."""
+        return TOONResponse(STATS_TOON)
 
     if __name__ == "__main__":
         import uvicorn
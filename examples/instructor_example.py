@@ -12,9 +12,13 @@ Install dependencies:
     pip install toonverter[instructor]
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from collections.abc import Sequence
+from functools import cache
+from itertools import islice
 
+from pydantic import BaseModel, Field, TypeAdapter
+
+from toonverter.analysis import count_tokens_batch
 from toonverter.integrations.instructor_integration import (
     response_to_toon,
     toon_to_response,
@@ -70,6 +74,31 @@ class QAPair(BaseModel):
     confidence: float = Field(default=1.0, description="Answer confidence")
 
 
+# Serializes a whole list (or tuple) of users in one call instead of one
+# model_dump() each
+USER_LIST_ADAPTER = TypeAdapter(Sequence[User])
+
+
+def count_tokens_streaming(chunks, batch_size=256):
+    """Total the token counts of text chunks, tokenizing a batch at a time."""
+    chunks = iter(chunks)
+    total = 0
+    while batch := list(islice(chunks, batch_size)):
+        total += sum(count_tokens_batch(batch))
+    return total
+
+
+def _iter_json_users(users, batch_size=200):
+    """Yield a compact JSON array of ``users``, serialized a batch at a time."""
+    yield "["
+    for start in range(0, len(users), batch_size):
+        if start:
+            yield ","
+        # Strip the brackets so the batches join into one array
+        yield USER_LIST_ADAPTER.dump_json(users[start : start + batch_size]).decode()[1:-1]
+    yield "]"
+
+
 # =============================================================================
 # 1. RESPONSE MODEL CONVERSION
 # =============================================================================
@@ -142,13 +171,12 @@ def example_bulk_operations():
 
     # Streaming for large collections
     print("\n📤 Streaming Large Collection (1000 responses):")
-    large_responses = [
+    # A generator: each chunk of users is created only when it is encoded
+    large_responses = (
         User(name=f"User {i}", age=20 + (i % 50), email=f"user{i}@example.com") for i in range(1000)
-    ]
+    )
 
-    chunk_count = 0
-    for chunk_toon in stream_responses_to_toon(large_responses, chunk_size=200):
-        chunk_count += 1
+    chunk_count = sum(1 for _ in stream_responses_to_toon(large_responses, chunk_size=200))
 
     print(f"✅ Streamed 1000 responses in {chunk_count} chunks (200 responses/chunk)")
 
@@ -347,15 +375,26 @@ def example_qa_extraction():
 # =============================================================================
 
 
+@cache
+def _build_users(count):
+    """Build ``count`` benchmark users once; repeated runs reuse the tuple."""
+    return tuple(
+        User(
+            name=f"User {i}",
+            age=20 + (i % 50),
+            email=f"user{i}@example.com",
+            bio=f"Bio for user {i} with some additional information.",
+        )
+        for i in range(count)
+    )
+
+
 def example_token_savings():
     """Example: Analyze token savings for Instructor responses."""
     print("\n" + "=" * 70)
     print("8. TOKEN SAVINGS ANALYSIS")
     print("=" * 70)
 
-    import json
-    from toonverter.analysis import count_tokens
-
     test_cases = [
         ("Small (10 responses)", 10),
         ("Medium (50 responses)", 50),
@@ -367,28 +406,15 @@ def example_token_savings():
     print(f"{'Response Count':<25} {'JSON':<12} {'TOON':<12} {'Savings':<15}")
     print("-" * 70)
 
+    # Build the largest fixture once; smaller cases use a prefix of it
+    max_count = max(count for _, count in test_cases)
+
     for label, count in test_cases:
-        # Create responses
-        users = [
-            User(
-                name=f"User {i}",
-                age=20 + (i % 50),
-                email=f"user{i}@example.com",
-                bio=f"Bio for user {i} with some additional information.",
-            )
-            for i in range(count)
-        ]
-
-        # Convert to TOON
-        toon = bulk_responses_to_toon(users)
-
-        # Convert to JSON
-        json_data = [user.model_dump() for user in users]
-        json_str = json.dumps(json_data)
-
-        # Count tokens
-        toon_tokens = count_tokens(toon)
-        json_tokens = count_tokens(json_str)
+        users = _build_users(max_count)[:count]
+
+        # Count tokens chunk by chunk instead of building whole documents
+        toon_tokens = count_tokens_streaming(stream_responses_to_toon(users, chunk_size=200))
+        json_tokens = count_tokens_streaming(_iter_json_users(users))
         savings = json_tokens - toon_tokens
         savings_pct = savings / json_tokens * 100
 
@@ -11,9 +11,14 @@ Install dependencies:
     pip install toonverter[llamaindex]
 """
 
+from functools import cache, lru_cache
+from itertools import islice
+from operator import attrgetter
+
 from llama_index.core import Document
-from llama_index.core.schema import TextNode, ImageNode, IndexNode, NodeRelationship
+from llama_index.core.schema import TextNode, ImageNode, IndexNode
 
+from toonverter.analysis import count_tokens as _count_tokens, count_tokens_batch
 from toonverter.integrations.llamaindex import (
     llamaindex_to_toon,
     toon_to_llamaindex,
@@ -24,6 +29,58 @@ from toonverter.integrations.llamaindex import (
 )
 
 
+# JSON baseline for token comparisons; orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj, default=None):
+        # Dataclasses go through ``default`` too, as with the stdlib encoder
+        return orjson.dumps(obj, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj, default=None):
+        return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+# Document fields in the JSON baseline, read with one C-level attrgetter call
+_JSON_FIELDS = ("text", "metadata")
+_get_json_fields = attrgetter(*_JSON_FIELDS)
+
+
+def _document_json(obj):
+    """JSON ``default`` hook serializing a Document straight from its fields."""
+    if isinstance(obj, Document):
+        return dict(zip(_JSON_FIELDS, _get_json_fields(obj)))
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text):
+    """Count tokens in ``text``; repeated strings are tokenized once."""
+    return _count_tokens(text)
+
+
+def count_tokens_streaming(chunks, batch_size=256):
+    """Total the token counts of text chunks, tokenizing a batch at a time."""
+    chunks = iter(chunks)
+    total = 0
+    while batch := list(islice(chunks, batch_size)):
+        total += sum(count_tokens_batch(batch))
+    return total
+
+
+def _iter_json_array(items, default=None):
+    """Yield a compact JSON array one element at a time."""
+    separator = "["
+    for item in items:
+        yield separator + _dumps(item, default=default)
+        separator = ","
+    yield "]" if separator == "," else "[]"
+
+
 # =============================================================================
 # 1. DOCUMENT CONVERSION
 # =============================================================================
@@ -269,12 +326,8 @@ def example_rag_pipeline():
 
     # Compare with JSON
     print("\n📊 Step 3: Compare token usage")
-    import json
-    from toonverter.analysis import count_tokens
-
-    # Create JSON equivalent
-    json_data = [{"text": doc.text, "metadata": doc.metadata} for doc in retrieved_docs]
-    json_str = json.dumps(json_data, indent=2)
+    # Compact JSON equivalent, as it would be sent to the LLM
+    json_str = _dumps(retrieved_docs, default=_document_json)
 
     toon_tokens = count_tokens(toon)
     json_tokens = count_tokens(json_str)
@@ -349,15 +402,24 @@ def example_document_chunking():
 # =============================================================================
 
 
+@cache
+def _build_documents(count):
+    """Build ``count`` benchmark documents once; repeated runs reuse the tuple."""
+    return tuple(
+        Document(
+            text=f"This is document {i} with some content about topic {i % 5}.",
+            metadata={"doc_id": i, "category": f"cat_{i % 5}", "priority": i % 3},
+        )
+        for i in range(count)
+    )
+
+
 def example_token_savings():
     """Example: Analyze token savings for different document sizes."""
     print("\n" + "=" * 70)
     print("7. TOKEN SAVINGS ANALYSIS")
     print("=" * 70)
 
-    import json
-    from toonverter.analysis import count_tokens
-
     test_cases = [
         ("Small (1 doc)", 1),
         ("Medium (10 docs)", 10),
@@ -369,26 +431,15 @@ def example_token_savings():
     print(f"{'Collection Size':<20} {'JSON':<12} {'TOON':<12} {'Savings':<15}")
     print("-" * 70)
 
+    # Build the largest fixture once; smaller cases use a prefix of it
+    max_count = max(count for _, count in test_cases)
+
     for label, count in test_cases:
-        # Create documents
-        docs = [
-            Document(
-                text=f"This is document {i} with some content about topic {i % 5}.",
-                metadata={"doc_id": i, "category": f"cat_{i % 5}", "priority": i % 3},
-            )
-            for i in range(count)
-        ]
-
-        # Convert to TOON
-        toon = bulk_documents_to_toon(docs)
-
-        # Convert to JSON
-        json_data = [{"text": d.text, "metadata": d.metadata} for d in docs]
-        json_str = json.dumps(json_data)
-
-        # Count tokens
-        toon_tokens = count_tokens(toon)
-        json_tokens = count_tokens(json_str)
+        docs = _build_documents(max_count)[:count]
+
+        # Count tokens chunk by chunk instead of building whole documents
+        toon_tokens = count_tokens_streaming(stream_documents_to_toon(docs, chunk_size=200))
+        json_tokens = count_tokens_streaming(_iter_json_array(docs, default=_document_json))
         savings = json_tokens - toon_tokens
         savings_pct = savings / json_tokens * 100
 
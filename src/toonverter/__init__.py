@@ -10,14 +10,18 @@ Quick Start:
     >>> decoded = toon.decode(toon_str)
 """
 
-from collections.abc import Callable
-from typing import Any, Optional, cast
+import copy
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, Optional, cast
 
 from toonverter.core.spec import ToonEncodeOptions
 
 from .__version__ import __author__, __license__, __version__
 from .analysis import FormatComparator, TiktokenCounter, compare, count_tokens
 from .analysis.deduplication import SemanticDeduplicator
+from .analysis.size import json_encoded_size
 from .core import (
     ComparisonReport,
     ConversionError,
@@ -36,17 +40,33 @@ from .core.registry import get_registry
 from .decoders import ToonDecoder
 from .differ import DiffResult
 from .encoders import ToonEncoder
+from .encoders.stream_encoder import StreamList, ToonStreamEncoder, buffered
 from .encoders.toon_encoder import _convert_options  # Added import
 from .formats import register_default_formats
-from .integrations.redis_integration import RedisToonWrapper
+from .formats.json_format import json_loads
 from .plugins import load_plugins
 from .schema import SchemaField, SchemaInferrer, SchemaValidator
-from .utils import read_file, write_file
+from .utils import iter_json_array, read_file, write_file
 
 
 # Initialize package
 register_default_formats()
 
+
+def __getattr__(name: str) -> Any:
+    """Import optional integrations on first attribute access (PEP 562).
+
+    Keeps ``import toonverter`` from importing integration packages (and the
+    frameworks they load) that the caller may never use.
+    """
+    if name == "RedisToonWrapper":
+        from .integrations.redis_integration import RedisToonWrapper
+
+        return RedisToonWrapper
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 # Level 1 Facade API - Simple functions for 90% of users
 
 
@@ -55,6 +75,7 @@ def convert(
     target: str,
     from_format: str,
     to_format: str,
+    streaming: bool = False,
     **options: Any,
 ) -> ConversionResult:
     """Convert data from one format to another.
@@ -64,10 +85,16 @@ def convert(
         target: Path to target file
         from_format: Source format (e.g., 'json', 'yaml')
         to_format: Target format (e.g., 'toon')
+        streaming: Stream records from a JSON Lines source (``from_format='jsonl'``)
+            or the items of a root-level JSON array (``from_format='json'``) into a
+            TOON root array without loading the whole file. Token counts are not
+            computed in this mode.
         **options: Additional conversion options
 
     Returns:
-        ConversionResult with conversion details
+        ConversionResult with conversion details. ``metadata["target_bytes"]``
+        holds the size of the written file (streaming mode also sets
+        ``"source_bytes"``).
 
     Raises:
         FormatNotSupportedError: If format not supported
@@ -75,7 +102,12 @@ def convert(
 
     Examples:
         >>> convert('data.json', 'data.toon', 'json', 'toon')
+        >>> convert('data.jsonl', 'data.toon', 'jsonl', 'toon', streaming=True)
+        >>> convert('rows.json', 'rows.toon', 'json', 'toon', streaming=True)
     """
+    if streaming:
+        return _convert_streaming(source, target, from_format, to_format, **options)
+
     try:
         # Read source file
         source_data_str = read_file(source)
@@ -89,7 +121,7 @@ def convert(
         target_data_str = target_adapter.encode(data)
 
         # Write target file
-        write_file(target, target_data_str)
+        target_bytes = write_file(target, target_data_str)
 
         # Count tokens for comparison
         counter = TiktokenCounter()
@@ -103,6 +135,7 @@ def convert(
             source_tokens=source_tokens,
             target_tokens=target_tokens,
             data=data,
+            metadata={"target_bytes": target_bytes},
         )
     except Exception as e:
         return ConversionResult(
@@ -110,6 +143,95 @@ def convert(
         )
 
 
+def _convert_streaming(
+    source: str,
+    target: str,
+    from_format: str,
+    to_format: str,
+    **options: Any,
+) -> ConversionResult:
+    """Convert a JSON Lines file or a JSON array file to TOON one record at a time.
+
+    The source is read twice: once to count records (and check whether they
+    share one flat schema) for the array header, and once to encode them, so
+    peak memory stays at a single record. Uniform records are written in
+    tabular form, anything else in list form.
+    """
+    try:
+        if from_format not in ("jsonl", "json") or to_format != "toon":
+            msg = (
+                f"Streaming conversion from '{from_format}' to '{to_format}' is not "
+                "supported (only 'jsonl' or 'json' -> 'toon')"
+            )
+            raise FormatNotSupportedError(msg)
+
+        source_path = Path(source)
+        target_path = Path(target)
+
+        length = 0
+        fields: list[str] | None = None
+        for record in _iter_stream_records(source_path, from_format):
+            if length == 0:
+                fields = list(record) if isinstance(record, dict) else None
+            if fields is not None and not _is_flat_record(record, fields):
+                fields = None
+            length += 1
+
+        encoder = ToonStreamEncoder(_convert_options(EncodeOptions(**options)) if options else None)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        target_bytes = 0
+        with target_path.open("wb") as dst:
+            records = _iter_stream_records(source_path, from_format)
+            if fields:
+                chunks = encoder.iterencode_tabular(records, length, fields)
+            else:
+                chunks = encoder.iterencode(StreamList(iterator=records, length=length))
+            for block in buffered(chunks):
+                dst.write(block)
+                target_bytes += len(block)
+
+        return ConversionResult(
+            success=True,
+            source_format=from_format,
+            target_format=to_format,
+            metadata={
+                "streamed": True,
+                "records": length,
+                "source_bytes": source_path.stat().st_size,
+                "target_bytes": target_bytes,
+            },
+        )
+    except Exception as e:
+        return ConversionResult(
+            success=False, source_format=from_format, target_format=to_format, error=str(e)
+        )
+
+
+def _iter_stream_records(path: Path, from_format: str) -> Iterator[Any]:
+    """Yield the records of a JSON Lines file or the items of a JSON array file."""
+    if from_format == "json":
+        yield from iter_json_array(str(path))
+        return
+
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
+
+
+def _is_flat_record(record: Any, fields: list[str]) -> bool:
+    """Check a record has exactly ``fields`` as keys and only primitive values."""
+    return (
+        isinstance(record, dict)
+        and len(record) == len(fields)
+        and all(
+            field in record and isinstance(record[field], (str, int, float, bool, type(None)))
+            for field in fields
+        )
+    )
+
+
 def encode(data: Any, to_format: str = "toon", **options: Any) -> str:
     """Encode data to specified format.
 
@@ -131,21 +253,75 @@ def encode(data: Any, to_format: str = "toon", **options: Any) -> str:
     """
     adapter = registry.get(to_format)
 
-    # Construct options object based on the target format
     encode_opts: EncodeOptions | ToonEncodeOptions | None = None
     if options:
-        if to_format == "toon":
-            # First, create a temporary EncodeOptions to correctly parse generic kwargs
-            temp_generic_options = EncodeOptions(**options)
-            # Then, convert to ToonEncodeOptions using the dedicated converter
-            encode_opts = _convert_options(temp_generic_options)
+        # The value's type is part of the key so that e.g. True and 1 stay distinct
+        try:
+            key = frozenset((name, type(value), value) for name, value in options.items())
+        except TypeError:
+            # Unhashable option values (e.g. an OptimizationPolicy) can't be cached
+            encode_opts = _build_encode_options(to_format, options)
         else:
-            # For other formats, use the generic EncodeOptions directly
-            encode_opts = EncodeOptions(**options)
+            # A copy, so an adapter mutating its options can't affect later calls
+            encode_opts = copy.copy(_cached_encode_options(to_format, key))
 
     return adapter.encode(data, cast("Any", encode_opts))
 
 
+def _build_encode_options(
+    to_format: str, options: dict[str, Any]
+) -> EncodeOptions | ToonEncodeOptions:
+    """Construct the options object for the target format from keyword options."""
+    if to_format == "toon":
+        # First, create a temporary EncodeOptions to correctly parse generic kwargs
+        temp_generic_options = EncodeOptions(**options)
+        # Then, convert to ToonEncodeOptions using the dedicated converter
+        return cast("ToonEncodeOptions", _convert_options(temp_generic_options))
+    # For other formats, use the generic EncodeOptions directly
+    return EncodeOptions(**options)
+
+
+@lru_cache(maxsize=32)
+def _cached_encode_options(
+    to_format: str, options: frozenset[tuple[str, type, Any]]
+) -> EncodeOptions | ToonEncodeOptions:
+    """Memoized :func:`_build_encode_options` for repeated option sets."""
+    return _build_encode_options(to_format, {name: value for name, _, value in options})
+
+
+def encoded_size(data: Any, to_format: str = "json", **options: Any) -> int:
+    """Return the length of ``encode(data, to_format, **options)``.
+
+    Single-line JSON (no options, or ``compact=True``) is measured by walking the
+    data without building the encoded string, keeping memory flat for large
+    inputs. Other formats and options are measured by encoding.
+
+    Args:
+        data: Data to measure
+        to_format: Target format (default: 'json')
+        **options: Encoding options
+
+    Returns:
+        Number of characters in the encoded output
+
+    Raises:
+        FormatNotSupportedError: If format not supported
+        EncodingError: If encoding fails
+
+    Examples:
+        >>> encoded_size([{"id": 1}, {"id": 2}])
+        22
+    """
+    if to_format == "json":
+        if not options:
+            return json_encoded_size(data)
+        if options.get("compact") and options.keys() <= {"compact", "sort_keys", "ensure_ascii"}:
+            return json_encoded_size(
+                data, separators=(",", ":"), ensure_ascii=options.get("ensure_ascii", False)
+            )
+    return len(encode(data, to_format=to_format, **options))
+
+
 def decode(data_str: str, from_format: str = "toon", **options: Any) -> Any:
     """Decode data from specified format.
 
@@ -171,7 +347,10 @@ def decode(data_str: str, from_format: str = "toon", **options: Any) -> Any:
 
 
 def analyze(
-    data: Any, from_format: str = "json", compare_formats: list[str] | None = None
+    data: Any,
+    from_format: str = "json",
+    compare_formats: list[str] | None = None,
+    precomputed_encodings: dict[str, str] | None = None,
 ) -> ComparisonReport:
     """Analyze token usage across formats.
 
@@ -179,6 +358,8 @@ def analyze(
         data: Data to analyze
         from_format: Source format
         compare_formats: Formats to compare (default: ['json', 'yaml', 'toon'])
+        precomputed_encodings: Text the caller already encoded, keyed by format
+            name; those formats are tokenized as given instead of re-encoded
 
     Returns:
         ComparisonReport with analysis
@@ -186,12 +367,20 @@ def analyze(
     Examples:
         >>> report = analyze({"name": "Alice"}, compare_formats=['json', 'toon'])
         >>> print(f"Best: {report.best_format}")
+        >>> toon_str = encode({"name": "Alice"})
+        >>> report = analyze(
+        ...     {"name": "Alice"},
+        ...     compare_formats=['json', 'toon'],
+        ...     precomputed_encodings={'toon': toon_str},
+        ... )
     """
     if compare_formats is None:
         compare_formats = ["json", "yaml", "toon"]
 
     comparator = FormatComparator()
-    return comparator.compare_formats(data, compare_formats)
+    return comparator.compare_formats(
+        data, compare_formats, precomputed_encodings=precomputed_encodings
+    )
 
 
 def load(path: str, format: str) -> Any:
@@ -211,7 +400,7 @@ def load(path: str, format: str) -> Any:
     return decode(content, from_format=format)
 
 
-def save(data: Any, path: str, format: str, **options: Any) -> None:
+def save(data: Any, path: str, format: str, **options: Any) -> int:
     """Save data to file.
 
     Args:
@@ -220,11 +409,14 @@ def save(data: Any, path: str, format: str, **options: Any) -> None:
         format: File format
         **options: Encoding options
 
+    Returns:
+        Number of bytes written
+
     Examples:
-        >>> save({"key": "value"}, 'data.toon', format='toon')
+        >>> size = save({"key": "value"}, 'data.toon', format='toon')
     """
     content = encode(data, to_format=format, **options)
-    write_file(path, content)
+    return write_file(path, content)
 
 
 def list_formats() -> list[str]:
@@ -424,6 +616,7 @@ __all__ = [
     "count_tokens",
     "decode",
     "encode",
+    "encoded_size",
     "get_registry",
     "is_supported",
     "list_formats",
@@ -558,6 +751,8 @@ def deduplicate(
     embedding_batch_size: int = 32,
     text_extraction_func: Callable[[Any], str | None] | None = None,
     spec: ToonEncodeOptions | None = None,
+    *,
+    mode: Literal["embedding", "minhash"] = "embedding",
 ) -> Any:
     """
     Detects and eliminates semantically duplicate items within lists in the data structure.
@@ -571,6 +766,8 @@ def deduplicate(
         text_extraction_func: A callable that extracts a string for embedding from an item.
                               If None, a default extraction logic is used.
         spec: The TOON specification to use.
+        mode: "embedding" compares sentence embeddings; "minhash" estimates
+              character 3-gram Jaccard similarity without loading a model.
 
     Returns:
         The optimized data structure with duplicates removed.
@@ -585,5 +782,6 @@ def deduplicate(
         embedding_batch_size=embedding_batch_size,
         text_extraction_func=text_extraction_func,
         spec=spec,
+        mode=mode,
     )
     return deduplicator.optimize(data)
@@ -1,8 +1,9 @@
 """Analysis module for token counting and format comparison."""
 
-from .analyzer import TiktokenCounter, analyze_text, count_tokens
+from .analyzer import TiktokenCounter, analyze_text, count_tokens, count_tokens_batch
 from .comparator import FormatComparator, compare
 from .reporter import ReportFormatter, format_report
+from .size import json_encoded_size
 
 
 __all__ = [
@@ -12,5 +13,7 @@ __all__ = [
     "analyze_text",
     "compare",
     "count_tokens",
+    "count_tokens_batch",
     "format_report",
+    "json_encoded_size",
 ]
@@ -1,5 +1,6 @@
 """Token analysis module using tiktoken."""
 
+from functools import lru_cache
 from typing import ClassVar
 
 import tiktoken
@@ -95,6 +96,29 @@ class TiktokenCounter(TokenCounter):
             msg = f"Failed to count tokens: {e}"
             raise TokenCountError(msg) from e
 
+    def count_tokens_batch(self, texts: list[str], num_threads: int = 8) -> list[int]:
+        """Count tokens in several texts with a single tokenizer call.
+
+        Args:
+            texts: Texts to analyze
+            num_threads: Threads tiktoken spreads the batch over
+
+        Returns:
+            Number of tokens for each text, in order
+
+        Raises:
+            TokenCountError: If counting fails
+        """
+        if not texts:
+            return []
+
+        try:
+            batch = self._encoding.encode_batch(texts, num_threads=num_threads)
+            return [len(tokens) for tokens in batch]
+        except Exception as e:
+            msg = f"Failed to count tokens: {e}"
+            raise TokenCountError(msg) from e
+
     def analyze(self, text: str, format_name: str) -> TokenAnalysis:
         """Analyze token usage for text.
 
@@ -108,13 +132,37 @@ class TiktokenCounter(TokenCounter):
         Raises:
             TokenCountError: If analysis fails
         """
-        token_count = self.count_tokens(text)
+        return self._build_analysis(text, format_name, self.count_tokens(text))
 
+    def analyze_batch(self, texts: list[str], format_names: list[str]) -> list[TokenAnalysis]:
+        """Analyze token usage for several texts, tokenizing them in one batch.
+
+        Args:
+            texts: Texts to analyze
+            format_names: Format of each text, parallel to ``texts``
+
+        Returns:
+            TokenAnalysis for each text, in order
+
+        Raises:
+            TokenCountError: If analysis fails
+        """
+        token_counts = self.count_tokens_batch(texts)
+        return [
+            self._build_analysis(text, format_name, token_count)
+            for text, format_name, token_count in zip(
+                texts, format_names, token_counts, strict=True
+            )
+        ]
+
+    def _build_analysis(self, text: str, format_name: str, token_count: int) -> TokenAnalysis:
+        """Build the TokenAnalysis for text whose tokens are already counted."""
         return TokenAnalysis(
             format=format_name,
             token_count=token_count,
             model=self._model,
             encoding=self._encoding_name,
+            byte_size=len(text.encode("utf-8")),
             metadata={
                 "text_length": len(text),
                 "text_lines": text.count("\n") + 1,
@@ -123,6 +171,12 @@ class TiktokenCounter(TokenCounter):
         )
 
 
+@lru_cache(maxsize=16)
+def _get_counter(model: str) -> TiktokenCounter:
+    """Return the shared counter for ``model``, loading its encoding once."""
+    return TiktokenCounter(model)
+
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """Convenience function to count tokens.
 
@@ -137,10 +191,32 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
         >>> count_tokens("Hello, world!")
         4
     """
-    counter = TiktokenCounter(model)
+    counter = _get_counter(model)
     return counter.count_tokens(text)
 
 
+def count_tokens_batch(texts: list[str], model: str = "gpt-4", num_threads: int = 8) -> list[int]:
+    """Convenience function to count tokens in several texts at once.
+
+    The texts are tokenized in one tiktoken call, spread over
+    ``num_threads`` threads, instead of one call per text.
+
+    Args:
+        texts: Texts to analyze
+        model: Model name or encoding
+        num_threads: Threads tiktoken spreads the batch over
+
+    Returns:
+        Number of tokens for each text, in order
+
+    Examples:
+        >>> count_tokens_batch(["Hello, world!", "name: Alice"])
+        [4, 3]
+    """
+    counter = _get_counter(model)
+    return counter.count_tokens_batch(texts, num_threads=num_threads)
+
+
 def analyze_text(text: str, format_name: str, model: str = "gpt-4") -> TokenAnalysis:
     """Convenience function to analyze text.
 
@@ -157,5 +233,5 @@ def analyze_text(text: str, format_name: str, model: str = "gpt-4") -> TokenAnal
         >>> print(analysis.token_count)
         7
     """
-    counter = TiktokenCounter(model)
+    counter = _get_counter(model)
     return counter.analyze(text, format_name)
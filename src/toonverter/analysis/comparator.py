@@ -26,6 +26,7 @@ class FormatComparator:
         data: Any,
         formats: list[str],
         encode_options: dict[str, EncodeOptions] | None = None,
+        precomputed_encodings: dict[str, str] | None = None,
     ) -> ComparisonReport:
         """Compare token usage across formats.
 
@@ -33,6 +34,9 @@ class FormatComparator:
             data: Data to encode and analyze
             formats: List of format names to compare
             encode_options: Optional format-specific encoding options
+            precomputed_encodings: Already-encoded text keyed by format name.
+                These formats are tokenized as given instead of re-encoding
+                ``data``.
 
         Returns:
             ComparisonReport with analysis for each format
@@ -41,9 +45,14 @@ class FormatComparator:
             FormatNotSupportedError: If a format is not supported
         """
         encode_options = encode_options or {}
-        analyses: list[TokenAnalysis] = []
+        precomputed_encodings = precomputed_encodings or {}
+        encoded_texts: list[str] = []
 
         for format_name in formats:
+            if format_name in precomputed_encodings:
+                encoded_texts.append(precomputed_encodings[format_name])
+                continue
+
             if not registry.is_supported(format_name):
                 msg = f"Format '{format_name}' is not supported"
                 raise FormatNotSupportedError(msg)
@@ -52,11 +61,13 @@ class FormatComparator:
             options = encode_options.get(format_name)
 
             # Encode data to format
-            encoded_text = adapter.encode(data, options)
+            encoded_texts.append(adapter.encode(data, options))
 
-            # Analyze token usage
-            analysis = self.counter.analyze(encoded_text, format_name)
-            analyses.append(analysis)
+        # Tokenize every serialization in one batch, keeping the encoded text
+        # on each analysis so callers can reuse it
+        analyses: list[TokenAnalysis] = self.counter.analyze_batch(encoded_texts, list(formats))
+        for analysis, encoded_text in zip(analyses, encoded_texts, strict=True):
+            analysis.serialized = encoded_text
 
         # Find best and worst formats
         best_format = min(analyses, key=lambda a: a.token_count).format
@@ -7,19 +7,41 @@ import hashlib
 import json
 import logging
 from collections.abc import Callable, Generator, Iterable  # noqa: TC003
-from typing import Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+import numpy as np
 
 from toonverter.core.registry import get_registry
 from toonverter.core.spec import ToonEncodeOptions
 from toonverter.core.types import DeduplicationResult, DuplicateItem
 
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve the embedding dependencies on first access (PEP 562).
+
+    sentence-transformers (and torch behind it) and scikit-learn are imported
+    where they are used, so importing this module stays cheap; these names
+    remain available as module attributes for existing callers.
+    """
+    if name == "SentenceTransformer":
+        from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+
+        return SentenceTransformer
+    if name == "cosine_similarity":
+        from sklearn.metrics.pairwise import cosine_similarity  # noqa: PLC0415
+
+        return cosine_similarity
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 class ExactDeduplicator:
     """Detects and eliminates semantic duplicates in data.
 
@@ -157,28 +179,25 @@ class ExactDeduplicator:
         to_remove_indices = set()
         duplicates = []
 
-        # Iterate upper triangle
-        for i in range(len(valid_texts)):
-            if valid_indices[i] in to_remove_indices:
+        # Each surviving item claims the later items it matches
+        removed = np.zeros(len(valid_texts), dtype=bool)
+        for i, row in _similar_pairs(sim_matrix, self.threshold):
+            if removed[i]:
                 continue
+            new = row & ~removed
+            removed |= new
 
-            for j in range(i + 1, len(valid_texts)):
-                if valid_indices[j] in to_remove_indices:
-                    continue
-
-                similarity = sim_matrix[i][j]
-                if similarity >= self.threshold:
-                    dup_real_idx = valid_indices[j]
-                    orig_real_idx = valid_indices[i]
-
-                    to_remove_indices.add(dup_real_idx)
-                    duplicates.append(
-                        DuplicateItem(
-                            original_index=orig_real_idx,  # Index in candidates list
-                            duplicate_index=dup_real_idx,  # Index in candidates list
-                            item=candidates[dup_real_idx],
-                        )
+            orig_real_idx = valid_indices[i]
+            for j in np.flatnonzero(new):
+                dup_real_idx = valid_indices[j]
+                to_remove_indices.add(dup_real_idx)
+                duplicates.append(
+                    DuplicateItem(
+                        original_index=orig_real_idx,  # Index in candidates list
+                        duplicate_index=dup_real_idx,  # Index in candidates list
+                        item=candidates[dup_real_idx],
                     )
+                )
 
         # Reconstruct final list
         final_unique = []
@@ -242,6 +261,104 @@ class ExactDeduplicator:
         return str(target)
 
 
+def _similar_pairs(
+    similarity_matrix: Any, threshold: float
+) -> Generator[tuple[int, np.ndarray], None, None]:
+    """Yield ``(i, mask)`` for rows with at least one later item at or above threshold.
+
+    ``mask`` flags the items ``j > i`` whose similarity to item ``i`` reaches the
+    threshold; the comparison is done for the whole matrix in one vectorized pass.
+    """
+    dup_mask = np.triu(np.asarray(similarity_matrix) >= threshold, k=1)
+    for i in np.flatnonzero(dup_mask.any(axis=1)):
+        yield int(i), dup_mask[i]
+
+
+def _similar_pairs_torch(
+    embeddings: np.ndarray, threshold: float, device: str, block_rows: int = 4096
+) -> Generator[tuple[int, np.ndarray], None, None]:
+    """Like :func:`_similar_pairs`, but computes cosine similarities with torch on ``device``.
+
+    Similarities are computed ``block_rows`` rows at a time as a matrix product of
+    normalized embeddings, and only rows containing a match are copied back to
+    the host.
+    """
+    import torch  # noqa: PLC0415
+
+    with torch.no_grad():
+        vectors = torch.nn.functional.normalize(torch.from_numpy(embeddings).to(device), dim=1)
+        columns = torch.arange(len(vectors), device=device)
+        for start in range(0, len(vectors), block_rows):
+            block = vectors[start : start + block_rows]
+            rows = columns[start : start + len(block), None]
+            dup_mask = (block @ vectors.T >= threshold) & (columns > rows)
+            hits = torch.nonzero(dup_mask.any(dim=1)).flatten()
+            for i, row in zip(hits.tolist(), dup_mask[hits].cpu().numpy(), strict=True):
+                yield start + i, row
+
+
+def _default_device() -> str:
+    """Pick the torch device for embedding: CUDA, then Apple MPS, then CPU."""
+    import torch  # noqa: PLC0415
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+# MinHash parameters: shingle width and the minimum chance that a pair at the
+# threshold shares an LSH bucket
+MINHASH_SHINGLE_SIZE = 3
+_LSH_RECALL = 0.95
+# Shingles hashed per block when computing signatures (bounds temporary memory)
+_MINHASH_BLOCK = 1 << 15
+
+
+def _shingle_ids(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Return the character 3-grams of every text (lowercased) as 63-bit integer ids.
+
+    Each id packs the three code points (21 bits each), so distinct shingles never
+    collide. Texts shorter than three characters are padded with NUL and form a
+    single shingle.
+
+    Returns:
+        Tuple of (ids of all texts' shingles, concatenated; start offset of each
+        text's shingles in that array)
+    """
+    size = MINHASH_SHINGLE_SIZE
+    padded = [text.lower().ljust(size, "\0") for text in texts]
+    codes = np.frombuffer(
+        "".join(padded).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    ).astype(np.uint64)
+    ids = (codes[:-2] << np.uint64(42)) | (codes[1:-1] << np.uint64(21)) | codes[2:]
+
+    # Drop the shingles that straddle two texts
+    lengths = np.fromiter(map(len, padded), dtype=np.intp, count=len(padded))
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(padded)), lengths)[: len(ids)]
+    ids = ids[np.arange(len(ids)) <= ends[owner] - size]
+
+    counts = lengths - (size - 1)
+    return ids, np.cumsum(counts) - counts
+
+
+def _lsh_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Pick ``(bands, rows)`` so pairs at ``threshold`` share a bucket with high probability.
+
+    Uses the most rows per band (fewest spurious candidates) for which a pair
+    with Jaccard similarity ``threshold`` still collides in at least one band
+    with probability ``_LSH_RECALL``. Bands use the first ``bands * rows``
+    permutations; candidates are verified against the full signature.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= _LSH_RECALL:
+            return bands, rows
+    return num_perm, 1
+
+
 _T = TypeVar("_T")
 
 
@@ -260,6 +377,13 @@ class SemanticDeduplicator:
         embedding_batch_size: int = 32,
         text_extraction_func: Callable[[Any], str | None] | None = None,
         spec: ToonEncodeOptions | None = None,
+        *,
+        ann_min_items: int = 2000,
+        ann_neighbors: int = 10,
+        embedding_dtype: str = "float16",
+        mode: Literal["embedding", "minhash"] = "embedding",
+        minhash_permutations: int = 128,
+        device: str | None = None,
     ) -> None:
         """
         Initializes the SemanticDeduplicator.
@@ -272,9 +396,32 @@ class SemanticDeduplicator:
             text_extraction_func: A callable that extracts a string for embedding from an item.
                                   If None, a default extraction logic is used.
             spec: The TOON specification to use.
+            ann_min_items: Lists with more embeddable items than this are compared through
+                           a FAISS inner-product index instead of a dense similarity matrix
+                           (requires faiss; falls back to the dense matrix otherwise).
+            ann_neighbors: Number of nearest neighbours checked per item in FAISS mode.
+            embedding_dtype: NumPy dtype used to store cached embeddings. Half precision
+                             halves their memory; similarities are always computed in
+                             float32.
+            mode: 'embedding' compares sentence embeddings by cosine similarity.
+                  'minhash' compares character 3-gram sets by estimated Jaccard
+                  similarity using MinHash signatures and LSH banding; it needs no
+                  model and suits exact and near-exact duplicates.
+            minhash_permutations: Number of hash permutations per MinHash signature.
+            device: Torch device for embedding and similarity ('cuda', 'mps', 'cpu').
+                    Defaults to a GPU when one is available. On a GPU the similarity
+                    matrix is computed on the device, and a larger
+                    embedding_batch_size (e.g. 256) keeps it busy.
         """
 
-        self.model = SentenceTransformer(model_name)
+        self.mode = mode
+        self.device = "cpu"
+        self.model: SentenceTransformer | None = None
+        if mode == "embedding":
+            from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+
+            self.device = device or _default_device()
+            self.model = SentenceTransformer(model_name, device=self.device)
         self.threshold = threshold
         self.language_key = language_key
         self.embedding_batch_size = embedding_batch_size
@@ -282,6 +429,15 @@ class SemanticDeduplicator:
         self.spec = spec if spec is not None else ToonEncodeOptions()  # Default to an instance
         self.registry = get_registry()  # To get access to format adapters if needed
         self._embedding_cache: dict[str, Any] = {}  # Cache for embeddings
+        self.ann_min_items = ann_min_items
+        self.ann_neighbors = ann_neighbors
+        self.embedding_dtype = np.dtype(embedding_dtype)
+        self.minhash_permutations = minhash_permutations
+        # Multiply-shift hash parameters (odd multipliers); a fixed seed keeps
+        # signatures, and therefore results, reproducible
+        rng = np.random.default_rng(1)
+        self._minhash_a = rng.integers(0, 1 << 64, size=minhash_permutations, dtype=np.uint64) | 1
+        self._minhash_b = rng.integers(0, 1 << 64, size=minhash_permutations, dtype=np.uint64)
 
     def optimize(self, data: _T) -> _T:
         """
@@ -340,6 +496,29 @@ class SemanticDeduplicator:
         if not valid_texts or len(valid_texts) < 2:
             return  # Not enough valid texts to deduplicate
 
+        if self.mode == "minhash":
+            removed = self._find_duplicates_minhash(valid_texts)
+        else:
+            removed = self._find_duplicates_embedding(valid_texts)
+
+        # Reconstruct the list, keeping only unique items
+        new_items = []
+        original_indices_to_keep = [valid_items_indices[i] for i in np.flatnonzero(~removed)]
+
+        # Add items that were not considered for embedding (e.g., non-textual data)
+        # and the unique semantic items.
+        kept_indices_set = set(original_indices_to_keep)
+        for i, item in enumerate(items):
+            if i in kept_indices_set or texts[i] is None:
+                new_items.append(item)
+
+        items[:] = new_items  # Modify the list in place
+
+    def _find_duplicates_embedding(self, valid_texts: list[str]) -> np.ndarray:
+        """
+        Flags items whose embedding is at least ``threshold`` cosine-similar to an
+        earlier kept item.
+        """
         # Check cache for existing embeddings
         # Get unique uncached texts while preserving order
         unique_valid_texts = list(dict.fromkeys(valid_texts))
@@ -349,49 +528,134 @@ class SemanticDeduplicator:
 
         # Encode new texts in batches if needed
         if uncached_texts:
-            new_embeddings = self.model.encode(
+            new_embeddings = self.model.encode(  # type: ignore[union-attr]
                 uncached_texts,
                 batch_size=self.embedding_batch_size,
                 show_progress_bar=False,
+                convert_to_numpy=True,
             )
+            new_embeddings = np.asarray(new_embeddings, dtype=self.embedding_dtype)
             for text, emb in zip(uncached_texts, new_embeddings, strict=True):
                 self._embedding_cache[text] = emb
 
-        # Retrieve all embeddings from cache (now guaranteed to exist)
-        embeddings = [self._embedding_cache[t] for t in valid_texts]
+        # Retrieve all embeddings from cache (now guaranteed to exist), widened
+        # to float32 for the similarity computation
+        embeddings = np.array([self._embedding_cache[t] for t in valid_texts], dtype=np.float32)
 
-        # Calculate similarity matrix
-        similarity_matrix = cosine_similarity(embeddings)
+        # Identify duplicates: a later item is dropped when it matches an item
+        # that is itself kept
+        removed = None
+        if len(valid_texts) > self.ann_min_items:
+            removed = self._find_duplicates_ann(embeddings)
 
-        # Identify duplicates
-        to_remove_indices_in_valid_items = set()
-        for i in range(len(valid_texts)):
-            if i in to_remove_indices_in_valid_items:
-                continue
-            for j in range(i + 1, len(valid_texts)):
-                if j in to_remove_indices_in_valid_items:
-                    continue
-                if similarity_matrix[i][j] >= self.threshold:
-                    to_remove_indices_in_valid_items.add(j)  # Mark as duplicate
+        if removed is None:
+            if self.device == "cpu":
+                from sklearn.metrics.pairwise import cosine_similarity  # noqa: PLC0415
 
-        # Reconstruct the list, keeping only unique items
-        new_items = []
-        original_indices_to_keep = sorted(
-            [
-                valid_items_indices[i]
-                for i in range(len(valid_texts))
-                if i not in to_remove_indices_in_valid_items
-            ]
-        )
+                pairs = _similar_pairs(cosine_similarity(embeddings), self.threshold)
+            else:
+                pairs = _similar_pairs_torch(embeddings, self.threshold, self.device)
 
-        # Add items that were not considered for embedding (e.g., non-textual data)
-        # and the unique semantic items.
-        kept_indices_set = set(original_indices_to_keep)
-        for i, item in enumerate(items):
-            if i in kept_indices_set or texts[i] is None:
-                new_items.append(item)
+            removed = np.zeros(len(valid_texts), dtype=bool)
+            for i, row in pairs:
+                if not removed[i]:
+                    removed |= row
 
-        items[:] = new_items  # Modify the list in place
+        return removed
+
+    def _find_duplicates_minhash(self, valid_texts: list[str]) -> np.ndarray:
+        """
+        Flags items whose estimated Jaccard similarity to an earlier kept item is at
+        least ``threshold``, without an embedding model.
+
+        Each text gets a MinHash signature over its character 3-grams. Signatures
+        are split into LSH bands, and only items sharing a band bucket are
+        compared, so the cost grows with the number of candidate pairs rather
+        than with N^2.
+        """
+        n = len(valid_texts)
+        a = self._minhash_a[:, None]
+        b = self._minhash_b[:, None]
+        ids, starts = _shingle_ids(valid_texts)
+
+        # Signatures are computed for blocks of whole texts. Each permutation is a
+        # multiply-shift hash: (a * id + b) mod 2**64, keeping the high 32 bits
+        signatures = np.empty((n, self.minhash_permutations), dtype=np.uint64)
+        first = 0
+        while first < n:
+            last = max(int(np.searchsorted(starts, starts[first] + _MINHASH_BLOCK)), first + 1)
+            stop = starts[last] if last < n else len(ids)
+            hashed = (a * ids[starts[first] : stop] + b) >> np.uint64(32)
+            signatures[first:last] = np.minimum.reduceat(
+                hashed, starts[first:last] - starts[first], axis=1
+            ).T
+            first = last
+
+        # Group items sharing a bucket in any band
+        bands, rows = _lsh_bands(self.minhash_permutations, self.threshold)
+        bucket_key = np.dtype((np.void, rows * signatures.itemsize))
+        groups: list[np.ndarray] = []
+        memberships: dict[int, list[int]] = {}
+        for band in range(bands):
+            keys = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+            _, bucket = np.unique(keys.view(bucket_key).ravel(), return_inverse=True)
+            order = np.argsort(bucket, kind="stable")
+            sorted_bucket = bucket[order]
+            group_starts = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+            group_sizes = np.diff(np.r_[group_starts, n])
+            shared = group_sizes > 1
+            for start, size in zip(
+                group_starts[shared].tolist(), group_sizes[shared].tolist(), strict=True
+            ):
+                members = order[start : start + size]
+                for i in members.tolist():
+                    memberships.setdefault(i, []).append(len(groups))
+                groups.append(members)
+
+        # Each kept item claims the later candidates whose signatures agree enough
+        removed = np.zeros(n, dtype=bool)
+        for i in sorted(memberships):
+            if removed[i]:
+                continue
+            others = np.unique(np.concatenate([groups[g] for g in memberships[i]]))
+            others = others[(others > i) & ~removed[others]]
+            if len(others):
+                similarity = (signatures[others] == signatures[i]).mean(axis=1)
+                removed[others[similarity >= self.threshold]] = True
+        return removed
+
+    def _find_duplicates_ann(self, embeddings: np.ndarray) -> np.ndarray | None:
+        """
+        Flags duplicates by querying a FAISS inner-product index for each item's
+        nearest neighbours, avoiding the N x N similarity matrix for large lists.
+
+        Only the ``ann_neighbors`` closest items are compared, so a similar item
+        ranked beyond them is not detected. Returns None if faiss is not installed.
+        """
+        try:
+            import faiss  # noqa: PLC0415
+        except ImportError:
+            logger.warning("faiss not found. Using the dense similarity matrix.")
+            return None
+
+        # L2-normalize so the inner product equals cosine similarity
+        vectors = embeddings.copy()
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+
+        index = faiss.IndexFlatIP(vectors.shape[1])
+        index.add(vectors)
+        # One extra neighbour because every item also finds itself
+        k = min(self.ann_neighbors + 1, len(vectors))
+        scores, neighbours = index.search(vectors, k)
+
+        removed = np.zeros(len(vectors), dtype=bool)
+        for i in range(len(vectors)):
+            if not removed[i]:
+                # Later items only; FAISS pads missing neighbours with -1
+                later = (neighbours[i] > i) & (scores[i] >= self.threshold)
+                removed[neighbours[i][later]] = True
+        return removed
 
     def _extract_text_for_embedding(self, item: Any) -> str | None:
         """
@@ -0,0 +1,84 @@
+"""Encoded size calculation without building the encoded string."""
+
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii
+from math import isfinite
+from typing import Any
+
+from toonverter.core.exceptions import EncodingError
+from toonverter.formats.json_format import DateTimeEncoder
+
+
+def json_encoded_size(
+    data: Any,
+    *,
+    separators: tuple[str, str] = (", ", ": "),
+    ensure_ascii: bool = True,
+) -> int:
+    """Compute the length of ``data`` serialized as single-line JSON.
+
+    The structure is walked once, summing the length of each token, so the
+    result equals ``len(json.dumps(data, separators=..., ensure_ascii=...))``
+    while memory stays flat instead of growing with the output. Values other
+    than plain str/int/float/bool/None/list/dict (datetimes, subclasses,
+    NaN/Infinity) are measured by serializing that value alone.
+
+    Args:
+        data: Data to measure
+        separators: Item and key separators, as for ``json.dumps``
+        ensure_ascii: Whether non-ASCII characters are escaped
+
+    Returns:
+        Number of characters in the JSON text
+
+    Raises:
+        EncodingError: If the data cannot be encoded as JSON
+    """
+    item_sep = len(separators[0])
+    key_sep = len(separators[1])
+    encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+
+    def dumped_size(value: Any) -> int:
+        return len(
+            json.dumps(value, cls=DateTimeEncoder, separators=separators, ensure_ascii=ensure_ascii)
+        )
+
+    def key_size(key: Any) -> int:
+        if key.__class__ is str:
+            return len(encode_str(key))
+        # json coerces int/float/bool/None keys to strings; measure "{key: null}"
+        return dumped_size({key: None}) - 6 - key_sep
+
+    def size(value: Any) -> int:
+        cls = value.__class__
+        if cls is str:
+            return len(encode_str(value))
+        if cls is int:
+            return len(int.__repr__(value))
+        if value is None or value is True:
+            return 4
+        if value is False:
+            return 5
+        if cls is float and isfinite(value):
+            return len(float.__repr__(value))
+        if cls is list:
+            if not value:
+                return 2
+            return 2 + (len(value) - 1) * item_sep + sum(map(size, value))
+        if cls is dict:
+            if not value:
+                return 2
+            return (
+                2
+                + (len(value) - 1) * item_sep
+                + len(value) * key_sep
+                + sum(map(key_size, value))
+                + sum(map(size, value.values()))
+            )
+        return dumped_size(value)
+
+    try:
+        return size(data)
+    except (TypeError, ValueError, RecursionError) as e:
+        msg = f"Failed to encode to JSON: {e}"
+        raise EncodingError(msg) from e
@@ -134,6 +134,8 @@ class TokenAnalysis:
         model: Tokenizer model used
         encoding: Specific encoding method
         metadata: Additional analysis metadata
+        byte_size: Size of the encoded text in UTF-8 bytes
+        serialized: Encoded text the analysis was computed from (if retained)
     """
 
     format: str
@@ -141,6 +143,8 @@ class TokenAnalysis:
     model: str = "cl100k_base"
     encoding: str = "utf-8"
     metadata: dict[str, Any] = field(default_factory=dict)
+    byte_size: int = 0
+    serialized: str | None = None
 
 
 @dataclass
@@ -159,6 +163,15 @@ class ComparisonReport:
     worst_format: str
     recommendations: list[str] = field(default_factory=list)
 
+    @property
+    def format_results(self) -> dict[str, TokenAnalysis]:
+        """Map each analyzed format to its analysis.
+
+        Returns:
+            Dictionary of format name to TokenAnalysis
+        """
+        return {analysis.format: analysis for analysis in self.analyses}
+
     @property
     def max_savings_percentage(self) -> float:
         """Calculate maximum possible token savings.
@@ -4,6 +4,7 @@ Tokenizes TOON input into structured tokens for parsing.
 Handles indentation tracking, line-by-line scanning, and token classification.
 """
 
+import string
 from dataclasses import dataclass
 from enum import Enum
 
@@ -55,6 +56,28 @@ class Token:
         return f"Token({self.type.name}, {self.value!r}, L{self.line}:C{self.column})"
 
 
+_WHITESPACE = frozenset(" \t")
+
+# Single-character tokens, keyed by the character
+_SYMBOL_TOKENS = {
+    ":": TokenType.COLON,
+    ",": TokenType.COMMA,
+    "[": TokenType.ARRAY_START,
+    "]": TokenType.ARRAY_END,
+    "{": TokenType.BRACE_START,
+    "}": TokenType.BRACE_END,
+}
+
+# Characters that end an unquoted identifier or value
+_IDENTIFIER_DELIMITERS = frozenset(":,[]{} \t")
+
+# Characters no int() or float() literal starts with
+_IDENTIFIER_START = frozenset(string.ascii_letters + "_")
+
+# Escape sequences allowed in quoted strings, mapped to the character they produce
+_ESCAPES = {"\\": "\\", '"': '"', "n": "\n", "r": "\r", "t": "\t"}
+
+
 class ToonLexer:
     """Lexer for tokenizing TOON format strings.
 
@@ -178,124 +201,45 @@ class ToonLexer:
             List of tokens for this line
         """
         tokens: list[Token] = []
+        append = tokens.append
+        n = len(line)
         i = 0
 
-        while i < len(line):
+        while i < n:
             char = line[i]
 
             # Skip whitespace
-            if char in (" ", "\t"):
+            if char in _WHITESPACE:
                 i += 1
                 continue
 
-            # Colon
-            if char == ":":
-                tokens.append(
-                    Token(
-                        type=TokenType.COLON,
-                        value=":",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
+            # Colon, comma and array/brace markers
+            symbol = _SYMBOL_TOKENS.get(char)
+            if symbol is not None:
+                append(Token(symbol, char, line_num, i, indent_level))
                 i += 1
                 continue
 
-            # Comma
-            if char == ",":
-                tokens.append(
-                    Token(
-                        type=TokenType.COMMA,
-                        value=",",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
-                i += 1
-                continue
-
-            # Dash (list marker)
-            if char == "-" and (i == 0 or line[i - 1] in (" ", "\t")):
-                # Check if it's a list marker (followed by space)
-                if i + 1 < len(line) and line[i + 1] == " ":
-                    tokens.append(
-                        Token(
-                            type=TokenType.DASH,
-                            value="-",
-                            line=line_num,
-                            column=i,
-                            indent_level=indent_level,
-                        )
-                    )
-                    i += 2  # Skip dash and space
-                    continue
-
-            # Array/brace markers
-            if char == "[":
-                tokens.append(
-                    Token(
-                        type=TokenType.ARRAY_START,
-                        value="[",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
-                i += 1
-                continue
-
-            if char == "]":
-                tokens.append(
-                    Token(
-                        type=TokenType.ARRAY_END,
-                        value="]",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
-                i += 1
-                continue
-
-            if char == "{":
-                tokens.append(
-                    Token(
-                        type=TokenType.BRACE_START,
-                        value="{",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
-                i += 1
-                continue
-
-            if char == "}":
-                tokens.append(
-                    Token(
-                        type=TokenType.BRACE_END,
-                        value="}",
-                        line=line_num,
-                        column=i,
-                        indent_level=indent_level,
-                    )
-                )
-                i += 1
+            # Dash (list marker): at line start or after whitespace, followed by a space
+            if (
+                char == "-"
+                and (i == 0 or line[i - 1] in _WHITESPACE)
+                and i + 1 < n
+                and line[i + 1] == " "
+            ):
+                append(Token(TokenType.DASH, "-", line_num, i, indent_level))
+                i += 2  # Skip dash and space
                 continue
 
             # Quoted string
             if char == '"':
-                string_token, new_i = self._scan_quoted_string(line, i, line_num, indent_level)
-                tokens.append(string_token)
-                i = new_i
+                string_token, i = self._scan_quoted_string(line, i, line_num, indent_level)
+                append(string_token)
                 continue
 
             # Identifier or unquoted value
-            token, new_i = self._scan_identifier(line, i, line_num, indent_level)
-            tokens.append(token)
-            i = new_i
+            token, i = self._scan_identifier(line, i, line_num, indent_level)
+            append(token)
 
         return tokens
 
@@ -304,6 +248,9 @@ class ToonLexer:
     ) -> tuple[Token, int]:
         """Scan a quoted string.
 
+        Unescaped runs are located with ``str.find`` and sliced out whole, so
+        only escape sequences are handled one at a time.
+
         Args:
             line: Line content
             start: Start position (at opening quote)
@@ -314,52 +261,43 @@ class ToonLexer:
             Tuple of (token, next_position)
         """
         i = start + 1  # Skip opening quote
-        chars: list[str] = []
+        parts: list[str] = []
 
-        while i < len(line):
-            char = line[i]
+        while True:
+            quote = line.find('"', i)
+            backslash = line.find("\\", i, None if quote == -1 else quote)
 
-            if char == "\\":
+            if backslash != -1:
                 # Escape sequence
-                if i + 1 < len(line):
-                    next_char = line[i + 1]
-                    if next_char == "\\":
-                        chars.append("\\")
-                    elif next_char == '"':
-                        chars.append('"')
-                    elif next_char == "n":
-                        chars.append("\n")
-                    elif next_char == "r":
-                        chars.append("\r")
-                    elif next_char == "t":
-                        chars.append("\t")
-                    else:
-                        msg = f"Invalid escape sequence: \\{next_char}"
-                        raise ValueError(msg)
-                    i += 2
-                else:
+                parts.append(line[i:backslash])
+                if backslash + 1 >= len(line):
                     msg = "Unterminated escape sequence"
                     raise ValueError(msg)
+                next_char = line[backslash + 1]
+                escaped = _ESCAPES.get(next_char)
+                if escaped is None:
+                    msg = f"Invalid escape sequence: \\{next_char}"
+                    raise ValueError(msg)
+                parts.append(escaped)
+                i = backslash + 2
+                continue
 
-            elif char == '"':
-                # End of string
-                value = "".join(chars)
-                return (
-                    Token(
-                        type=TokenType.QUOTED_STRING,
-                        value=value,
-                        line=line_num,
-                        column=start,
-                        indent_level=indent_level,
-                    ),
-                    i + 1,
-                )
-            else:
-                chars.append(char)
-                i += 1
+            if quote == -1:
+                msg = f"Unterminated quoted string at line {line_num}"
+                raise ValueError(msg)
 
-        msg = f"Unterminated quoted string at line {line_num}"
-        raise ValueError(msg)
+            # End of string
+            parts.append(line[i:quote])
+            return (
+                Token(
+                    type=TokenType.QUOTED_STRING,
+                    value="".join(parts),
+                    line=line_num,
+                    column=start,
+                    indent_level=indent_level,
+                ),
+                quote + 1,
+            )
 
     def _scan_identifier(
         self, line: str, start: int, line_num: int, indent_level: int
@@ -376,17 +314,13 @@ class ToonLexer:
             Tuple of (token, next_position)
         """
         i = start
-        chars: list[str] = []
+        n = len(line)
 
         # Scan until delimiter or special character
-        while i < len(line):
-            char = line[i]
-            if char in (":", ",", "[", "]", "{", "}", " ", "\t"):
-                break
-            chars.append(char)
+        while i < n and line[i] not in _IDENTIFIER_DELIMITERS:
             i += 1
 
-        value_str = "".join(chars)
+        value_str = line[start:i]
 
         # Determine token type
         if value_str == "true":
@@ -398,6 +332,10 @@ class ToonLexer:
         elif value_str == "null":
             token_type = TokenType.NULL
             value = None
+        elif value_str[0] in _IDENTIFIER_START:
+            # Cannot be a number; skip the failing int()/float() attempt
+            token_type = TokenType.IDENTIFIER
+            value = value_str
         else:
             # Try to parse as number
             try:
@@ -43,9 +43,10 @@ class StreamLexer:
         for line in self.source:
             # Handle potential trailing newlines from file reading
             line_content = line.rstrip("\n")
+            stripped = line_content.strip()
 
             # Skip empty lines (whitespace only)
-            if not line_content.strip():
+            if not stripped:
                 self.current_line += 1
                 continue
 
@@ -84,7 +85,6 @@ class StreamLexer:
             # ToonLexer._tokenize_line is stateless regarding the Lexer instance
             # (it uses args for line_num etc).
             # So we can reuse it.
-            stripped = line_content.strip()
             if stripped == "-":
                 stripped = "- "
 
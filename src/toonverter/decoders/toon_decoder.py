@@ -325,6 +325,8 @@ class ToonDecoder:
             Dictionary
         """
         result: dict[str, Any] = {}
+        # Whether the INDENT opening the remaining fields has been consumed
+        in_body = False
 
         # Parse first field on the current line
         token = self.tokens[self.pos]
@@ -332,31 +334,49 @@ class ToonDecoder:
             key = str(token.value)
             self.pos += 1
 
-            # Expect colon
-            if self.pos >= len(self.tokens) or self.tokens[self.pos].type != TokenType.COLON:
-                msg = f"Expected ':' after key '{key}' in inline object"
-                raise DecodingError(msg)
-            self.pos += 1
-
-            # Parse value (primitive only on dash line)
-            if self.pos >= len(self.tokens) or self.tokens[self.pos].type in (
-                TokenType.NEWLINE,
-                TokenType.EOF,
-            ):
-                result[key] = None
+            if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.ARRAY_START:
+                # Array first field: - key[N]: ... with any items at depth +2
+                header = self._parse_array_header()
+                in_body = self._skip_item_body_indent()
+                if header["form"] == ArrayForm.INLINE:
+                    result[key] = self._parse_inline_array(header)
+                elif header["form"] == ArrayForm.TABULAR:
+                    result[key] = self._parse_tabular_array(header)
+                else:
+                    result[key] = self._parse_list_array(header, depth + 1)
             else:
-                value = self._token_to_value(self.tokens[self.pos])
-                result[key] = value
+                # Expect colon
+                if self.pos >= len(self.tokens) or self.tokens[self.pos].type != TokenType.COLON:
+                    msg = f"Expected ':' after key '{key}' in inline object"
+                    raise DecodingError(msg)
                 self.pos += 1
 
-        # Skip newline if present
-        if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.NEWLINE:
-            self.pos += 1
+                if self.pos >= len(self.tokens) or self.tokens[self.pos].type in (
+                    TokenType.NEWLINE,
+                    TokenType.EOF,
+                ):
+                    if self._skip_item_body_indent():
+                        # Nested object first field: its fields are at depth +2
+                        in_body = True
+                        result[key] = self._parse_nested_object(depth + 1)
+                    else:
+                        result[key] = None
+                else:
+                    value = self._token_to_value(self.tokens[self.pos])
+                    result[key] = value
+                    self.pos += 1
 
-        # Check for additional fields at depth+1 (INDENT)
-        if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.INDENT:
-            self.pos += 1  # Skip INDENT
+        if not in_body:
+            # Skip newline if present
+            if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.NEWLINE:
+                self.pos += 1
 
+            # Check for additional fields at depth+1 (INDENT)
+            if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.INDENT:
+                self.pos += 1  # Skip INDENT
+                in_body = True
+
+        if in_body:
             # Parse remaining fields at this indentation level
             while self.pos < len(self.tokens):
                 token = self.tokens[self.pos]
@@ -409,6 +429,26 @@ class ToonDecoder:
 
         return result
 
+    def _skip_item_body_indent(self) -> bool:
+        """Skip the newline and body INDENT before a list item's depth +2 content.
+
+        A nested value of a list item's first field is indented two levels below
+        the hyphen, so the lexer emits two INDENT tokens; the first one opens the
+        item's remaining fields at depth +1.
+
+        Returns:
+            True if the tokens were skipped, leaving the second INDENT next
+        """
+        if (
+            self.pos + 2 < len(self.tokens)
+            and self.tokens[self.pos].type == TokenType.NEWLINE
+            and self.tokens[self.pos + 1].type == TokenType.INDENT
+            and self.tokens[self.pos + 2].type == TokenType.INDENT
+        ):
+            self.pos += 2
+            return True
+        return False
+
     def _parse_array_header(self) -> dict[str, Any]:
         """Parse array header: [N] or [N]{fields}
 
@@ -600,6 +640,8 @@ class ToonDecoder:
             List of values
         """
         values: list[Any] = []
+        # INDENT tokens opening the item block, closed by as many DEDENTs
+        indents = 0
 
         # Skip newline after header
         if self.pos < len(self.tokens) and self.tokens[self.pos].type == TokenType.NEWLINE:
@@ -613,7 +655,11 @@ class ToonDecoder:
                 break
 
             # Skip indents/dedents/newlines
-            if token.type in (TokenType.INDENT, TokenType.NEWLINE):
+            if token.type == TokenType.INDENT:
+                indents += 1
+                self.pos += 1
+                continue
+            if token.type == TokenType.NEWLINE:
                 self.pos += 1
                 continue
 
@@ -624,12 +670,34 @@ class ToonDecoder:
             if token.type == TokenType.DASH:
                 self.pos += 1
 
-                # Parse item value
-                item_value = self._parse_value(depth + 1)
+                # Parse item value; "- key[N]: ..." is an object whose first field is an array
+                if (
+                    self.pos + 1 < len(self.tokens)
+                    and self.tokens[self.pos].type
+                    in (TokenType.IDENTIFIER, TokenType.QUOTED_STRING)
+                    and self.tokens[self.pos + 1].type == TokenType.ARRAY_START
+                ):
+                    item_value = self._parse_inline_object(depth + 1)
+                else:
+                    item_value = self._parse_value(depth + 1)
                 values.append(item_value)
+            elif token.type == TokenType.IDENTIFIER and token.value == "-":
+                # A bare hyphen is an empty object item
+                self.pos += 1
+                values.append({})
             else:
                 self.pos += 1
 
+        # Close the item block so the enclosing object continues after it
+        while (
+            indents
+            and self.pos < len(self.tokens)
+            and self.tokens[self.pos].type in (TokenType.NEWLINE, TokenType.DEDENT)
+        ):
+            if self.tokens[self.pos].type == TokenType.DEDENT:
+                indents -= 1
+            self.pos += 1
+
         # Validate length in strict mode
         if self.options.strict and len(values) != header["length"]:
             msg = f"Array length mismatch: declared {header['length']}, got {len(values)}"
@@ -1,12 +1,40 @@
 """Core engine for ToonDiff."""
 
+import marshal
 from typing import Any
 
 from .models import ChangeType, DiffChange, DiffResult
 
 
+# A pending comparison (old, new, path) or a change to emit once the items before it are done
+_Task = tuple[Any, Any, str] | DiffChange
+
+
+def _unchanged(obj1: Any, obj2: Any) -> bool:
+    """Return True if two containers are known to hold no differences.
+
+    ``==`` runs in C and stops at the first mismatch, so it is cheap for subtrees
+    that differ. It treats 1, 1.0 and True as equal, so equal subtrees are
+    confirmed by comparing their ``marshal`` serializations, which keep those
+    types apart. Data that marshal cannot handle (custom types, nesting too deep
+    to serialize) is simply walked instead.
+    """
+    if obj1 is obj2:
+        return True
+    try:
+        # Format version 2 writes no back-references, so equal data gives equal bytes
+        return bool(obj1 == obj2 and marshal.dumps(obj1, 2) == marshal.dumps(obj2, 2))
+    except (ValueError, RecursionError):
+        return False
+
+
 class ToonDiffer:
-    """Recursive difference engine for structured data."""
+    """Difference engine for structured data.
+
+    Walks both objects with an explicit worklist instead of recursion, so deeply
+    nested data cannot hit the interpreter's recursion limit, and skips
+    containers whose contents are unchanged without descending into them.
+    """
 
     def diff(self, obj1: Any, obj2: Any) -> DiffResult:
         """Compute the difference between two objects.
@@ -19,10 +47,20 @@ class ToonDiffer:
             DiffResult containing list of changes
         """
         changes: list[DiffChange] = []
-        self._diff_recursive(obj1, obj2, "$", changes)
+        stack: list[_Task] = [(obj1, obj2, "$")]
+        while stack:
+            task = stack.pop()
+            if isinstance(task, DiffChange):
+                changes.append(task)
+            else:
+                self._diff_node(*task, changes, stack)
         return DiffResult(changes=changes)
 
-    def _diff_recursive(self, obj1: Any, obj2: Any, path: str, changes: list[DiffChange]) -> None:
+    def _diff_node(
+        self, obj1: Any, obj2: Any, path: str, changes: list[DiffChange], stack: list[_Task]
+    ) -> None:
+        # Tasks are pushed in reverse so they pop in document order.
+
         # 1. Type Mismatch
         if type(obj1) is not type(obj2):
             changes.append(
@@ -37,6 +75,9 @@ class ToonDiffer:
 
         # 2. Dictionaries (Objects)
         if isinstance(obj1, dict):
+            if _unchanged(obj1, obj2):
+                return
+
             keys1 = set(obj1.keys())
             keys2 = set(obj2.keys())
 
@@ -60,42 +101,45 @@ class ToonDiffer:
                     )
                 )
 
-            # Common keys - recursive check
-            for key in keys1 & keys2:
-                self._diff_recursive(obj1[key], obj2[key], f"{path}.{key}", changes)
+            # Common keys - queued for comparison
+            common = list(keys1 & keys2)
+            for key in reversed(common):
+                stack.append((obj1[key], obj2[key], f"{path}.{key}"))
 
             return
 
         # 3. Lists (Arrays)
         if isinstance(obj1, list):
+            if _unchanged(obj1, obj2):
+                return
+
             len1 = len(obj1)
             len2 = len(obj2)
 
-            # Compare common items
-            for i in range(min(len1, len2)):
-                self._diff_recursive(obj1[i], obj2[i], f"{path}[{i}]", changes)
-
-            # Removed items (obj1 was longer)
-            if len1 > len2:
-                for i in range(len2, len1):
-                    changes.append(
-                        DiffChange(
-                            path=f"{path}[{i}]",
-                            type=ChangeType.REMOVE,
-                            old_value=obj1[i],
-                        )
+            # Added items (obj2 is longer), reported after the common items
+            for i in range(len2 - 1, len1 - 1, -1):
+                stack.append(
+                    DiffChange(
+                        path=f"{path}[{i}]",
+                        type=ChangeType.ADD,
+                        new_value=obj2[i],
                     )
+                )
 
-            # Added items (obj2 is longer)
-            if len2 > len1:
-                for i in range(len1, len2):
-                    changes.append(
-                        DiffChange(
-                            path=f"{path}[{i}]",
-                            type=ChangeType.ADD,
-                            new_value=obj2[i],
-                        )
+            # Removed items (obj1 was longer), reported after the common items
+            for i in range(len1 - 1, len2 - 1, -1):
+                stack.append(
+                    DiffChange(
+                        path=f"{path}[{i}]",
+                        type=ChangeType.REMOVE,
+                        old_value=obj1[i],
                     )
+                )
+
+            # Compare common items
+            for i in range(min(len1, len2) - 1, -1, -1):
+                stack.append((obj1[i], obj2[i], f"{path}[{i}]"))
+
             return
 
         # 4. Primitives (Values)
@@ -6,6 +6,9 @@ Implements the three array forms from TOON v2.0 specification:
 3. List: key[N]:\n  - item1\n  - item2
 """
 
+from collections.abc import Callable, KeysView
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from toonverter.core.spec import ArrayForm
@@ -15,6 +18,53 @@ from .number_encoder import NumberEncoder
 from .string_encoder import StringEncoder
 
 
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+# Inline encodings for the column types seen in a tabular array's first row. Each
+# checks the value's exact class and otherwise defers to the generic encoder, so a
+# column whose type changes part-way through still encodes correctly.
+_COLUMN_TEMPLATES: dict[type, str] = {
+    int: "(str({v}) if {v}.__class__ is int else encode_value({v}))",
+    bool: "(('true' if {v} else 'false') if {v}.__class__ is bool else encode_value({v}))",
+    type(None): "('null' if {v} is None else encode_value({v}))",
+    str: "(encode_str({v}) if {v}.__class__ is str else encode_value({v}))",
+    float: "(encode_number({v}) if {v}.__class__ is float else encode_value({v}))",
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_row_encoder(column_types: tuple[type, ...]) -> Callable[..., Callable[[Any], str]]:
+    """Generate a row-encoder factory specialized on a tabular schema's column types.
+
+    The generated row function unpacks all fields with one ``itemgetter`` call
+    and encodes each column inline, avoiding the per-field lookup loop and the
+    type dispatch in ``ArrayEncoder._encode_value``.
+
+    Args:
+        column_types: Class of each column's value in the first row
+
+    Returns:
+        Factory taking (get, encode_value, encode_str, encode_number, delimiter,
+        prefix) and returning a function that encodes one row dict to a line
+    """
+    names = [f"v{i}" for i in range(len(column_types))]
+    columns = " + delimiter + ".join(
+        _COLUMN_TEMPLATES.get(column_type, "encode_value({v})").format(v=name)
+        for name, column_type in zip(names, column_types, strict=True)
+    )
+    unpack = ", ".join(names) + ("," if len(names) == 1 else "")
+    source = (
+        "def factory(get, encode_value, encode_str, encode_number, delimiter, prefix):\n"
+        "    def encode_row(item):\n"
+        f"        {unpack} = get(item)\n"
+        f"        return prefix + {columns}\n"
+        "    return encode_row\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<toon-tabular-row>", "exec"), namespace)
+    return namespace["factory"]
+
+
 class ArrayEncoder:
     """Encoder for arrays in TOON format.
 
@@ -63,12 +113,12 @@ class ArrayEncoder:
 
         is_inline = True
         is_tabular = True
-        tabular_keys: tuple[str, ...] | None = None
+        tabular_keys: KeysView[str] | None = None
 
         for i, item in enumerate(arr):
             # Check Primitive (for Inline)
             if is_inline:
-                if not self._is_primitive(item):
+                if not isinstance(item, _PRIMITIVE_TYPES):
                     is_inline = False
 
             # Check Dict & Uniform Keys & Primitive Values (for Tabular)
@@ -77,17 +127,16 @@ class ArrayEncoder:
                     is_tabular = False
                 else:
                     # Check keys consistency
-                    # Use tuple of sorted keys for stable comparison
-                    current_keys = tuple(sorted(item.keys()))
+                    # Key views compare as sets, so key order does not matter
                     if i == 0:
-                        tabular_keys = current_keys
-                    elif current_keys != tabular_keys:
+                        tabular_keys = item.keys()
+                    elif item.keys() != tabular_keys:
                         is_tabular = False
 
                     # Check values are primitive (required for tabular)
                     if is_tabular:
                         for val in item.values():
-                            if not self._is_primitive(val):
+                            if not isinstance(val, _PRIMITIVE_TYPES):
                                 is_tabular = False
                                 break
 
@@ -110,7 +159,7 @@ class ArrayEncoder:
         Returns:
             True if primitive (str, int, float, bool, None)
         """
-        return isinstance(val, (str, int, float, bool, type(None)))
+        return isinstance(val, _PRIMITIVE_TYPES)
 
     def encode_inline(self, key: str, arr: list[Any], depth: int) -> str:
         """Encode inline array: key[N]: val1,val2,val3
@@ -167,13 +216,39 @@ class ArrayEncoder:
         lines = [header]
 
         # Data rows
-        for item in arr:
-            values = [self._encode_value(item[field]) for field in fields]
-            row = self.delimiter.join(values)
-            lines.append(f"{row_indent}{row}")
+        lines.extend(self._encode_tabular_rows(arr, fields, row_indent))
 
         return lines
 
+    def _encode_tabular_rows(
+        self, arr: list[dict[str, Any]], fields: list[str], row_indent: str
+    ) -> list[str]:
+        """Encode the data rows of a tabular array with a schema-specialized function.
+
+        Args:
+            arr: Array of dicts with uniform keys
+            fields: Field names, in output order
+            row_indent: Indentation prefix for each row
+
+        Returns:
+            One line per row
+        """
+        if not fields:
+            return [row_indent] * len(arr)
+
+        first = arr[0]
+        factory = _compile_row_encoder(tuple(first[field].__class__ for field in fields))
+        get = itemgetter(*fields) if len(fields) > 1 else lambda item: (item[fields[0]],)
+        encode_row = factory(
+            get,
+            self._encode_value,
+            self.str_enc.encode,
+            self.num_enc.encode,
+            self.delimiter,
+            row_indent,
+        )
+        return [encode_row(item) for item in arr]
+
     def encode_list(self, key: str, arr: list[Any], depth: int, value_encoder: Any) -> list[str]:
         """Encode list array with - notation.
 
@@ -279,10 +354,7 @@ class ArrayEncoder:
         lines = [header]
 
         # Data rows
-        for item in arr:
-            values = [self._encode_value(item[field]) for field in fields]
-            row = self.delimiter.join(values)
-            lines.append(f"{row_indent}{row}")
+        lines.extend(self._encode_tabular_rows(arr, fields, row_indent))
 
         return lines
 
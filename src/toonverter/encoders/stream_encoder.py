@@ -5,7 +5,7 @@ avoiding recursion limits and memory overhead of building full strings.
 """
 
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any
@@ -17,6 +17,10 @@ from toonverter.encoders.number_encoder import NumberEncoder
 from toonverter.encoders.string_encoder import StringEncoder
 
 
+# Default size of the blocks produced by ``buffered``
+DEFAULT_FLUSH_SIZE = 65536
+
+
 @dataclass
 class StreamList:
     """Helper class for streaming iterators with known length."""
@@ -24,6 +28,13 @@ class StreamList:
     iterator: Iterator[Any]
     length: int
 
+    def __iter__(self) -> Iterator[Any]:
+        return self.iterator
+
+    def __length_hint__(self) -> int:
+        # Lets list() and other consumers allocate for all items up front
+        return self.length
+
 
 class ContextType(Enum):
     """Type of current encoding context."""
@@ -44,6 +55,9 @@ class EncoderContext:
     # For Lists, we need to know if we are in a Root Array List form or nested
     is_root_array: bool = False
 
+    # For Dicts that are list items: the first field goes on the hyphen line
+    is_list_item: bool = False
+
 
 class ToonStreamEncoder:
     """Advanced Iterative Streaming Encoder for TOON format.
@@ -77,6 +91,11 @@ class ToonStreamEncoder:
 
             stack: deque[EncoderContext] = deque()
 
+            # We maintain a 'first_yield' state to strictly emulate "\n".join()
+            # The first line yielded never has a prefix \n.
+            # All subsequent lines get a prefix \n.
+            first_yield = True
+
             # 2. Initialize Root Context
             if isinstance(data, dict):
                 if not data:
@@ -94,10 +113,11 @@ class ToonStreamEncoder:
 
                 # Default to LIST form for streaming root arrays
                 yield f"[{len(data)}]:"
+                first_yield = False
 
                 stack.append(
                     EncoderContext(
-                        type=ContextType.LIST, iterator=iter(data), depth=0, is_root_array=True
+                        type=ContextType.LIST, iterator=iter(data), depth=1, is_root_array=True
                     )
                 )
             elif isinstance(data, StreamList):
@@ -106,10 +126,11 @@ class ToonStreamEncoder:
                     return
 
                 yield f"[{data.length}]:"
+                first_yield = False
 
                 stack.append(
                     EncoderContext(
-                        type=ContextType.LIST, iterator=data.iterator, depth=0, is_root_array=True
+                        type=ContextType.LIST, iterator=data.iterator, depth=1, is_root_array=True
                     )
                 )
 
@@ -118,11 +139,6 @@ class ToonStreamEncoder:
                 raise EncodingError(msg)
 
             # 3. Process Stack
-            # We maintain a 'pending_newline' state to strictly emulate "\n".join()
-            # The first line yielded never has a prefix \n.
-            # All subsequent lines get a prefix \n.
-            first_yield = True
-
             while stack:
                 ctx = stack[-1]
 
@@ -132,7 +148,13 @@ class ToonStreamEncoder:
 
                         # Prepare prefix
                         prefix = "" if first_yield else "\n"
-                        indent = self.indent_mgr.indent(ctx.depth)
+                        if ctx.is_list_item and ctx.is_first:
+                            # First field of a list item object: "- key: value",
+                            # its remaining fields continue one level deeper
+                            indent = self.indent_mgr.indent(ctx.depth - 1) + "- "
+                        else:
+                            indent = self.indent_mgr.indent(ctx.depth)
+                        ctx.is_first = False
 
                         if isinstance(value, dict):
                             yield f"{prefix}{indent}{key}:"
@@ -193,17 +215,18 @@ class ToonStreamEncoder:
 
                         if isinstance(item, dict):
                             # Object in list
-                            yield f"{prefix}{indent}-"
-                            first_yield = False
-
                             if item:
                                 stack.append(
                                     EncoderContext(
                                         type=ContextType.DICT,
                                         iterator=iter(item.items()),
                                         depth=ctx.depth + 1,
+                                        is_list_item=True,
                                     )
                                 )
+                            else:
+                                yield f"{prefix}{indent}-"
+                                first_yield = False
 
                         elif isinstance(item, list):
                             # List in list
@@ -252,6 +275,54 @@ class ToonStreamEncoder:
             msg = f"Streaming encoding failed: {e}"
             raise EncodingError(msg) from e
 
+    def iterencode_bytes(
+        self, data: ToonValue | StreamList, flush_size: int = DEFAULT_FLUSH_SIZE
+    ) -> Iterator[bytes]:
+        """Encode data to UTF-8 TOON in blocks of about ``flush_size`` bytes.
+
+        Same output as :meth:`iterencode`, regrouped by :func:`buffered` for
+        writing to files or sockets.
+
+        Args:
+            data: Data to encode
+            flush_size: Minimum block size (the last block may be smaller)
+
+        Yields:
+            Encoded bytes blocks.
+        """
+        return buffered(self.iterencode(data), flush_size)
+
+    def iterencode_tabular(
+        self, rows: Iterator[dict[str, Any]], length: int, fields: list[str]
+    ) -> Iterator[str]:
+        """Encode a root array of uniform objects in tabular form, one row at a time.
+
+        Every row must have exactly ``fields`` as keys with primitive values; this
+        mirrors ``ArrayEncoder.encode_root_array_tabular`` without materializing
+        the rows.
+
+        Args:
+            rows: Iterator of row dictionaries
+            length: Number of rows the iterator will produce
+            fields: Column names, in output order
+
+        Yields:
+            Header line, then one line per row (each prefixed with a newline).
+        """
+        delimiter = self.str_enc.delimiter
+        delimiter_marker = "" if delimiter == "," else delimiter
+        row_prefix = "\n" + self.indent_mgr.indent(1)
+
+        try:
+            yield f"[{length}{delimiter_marker}]{{{delimiter.join(fields)}}}:"
+            for row in rows:
+                yield row_prefix + delimiter.join(
+                    [self._encode_value(row[field]) for field in fields]
+                )
+        except Exception as e:
+            msg = f"Streaming encoding failed: {e}"
+            raise EncodingError(msg) from e
+
     def _is_primitive(self, data: Any) -> bool:
         return not isinstance(data, (dict, list, StreamList))
 
@@ -267,3 +338,32 @@ class ToonStreamEncoder:
             return self.str_enc.encode(val)
         msg = f"Unsupported type: {type(val)}"
         raise EncodingError(msg)
+
+
+def buffered(chunks: Iterable[str], flush_size: int = DEFAULT_FLUSH_SIZE) -> Iterator[bytes]:
+    """Regroup small string chunks into UTF-8 blocks of at least ``flush_size`` bytes.
+
+    The streaming encoders yield one short string per line; writing each one
+    separately costs a write call per line. Chunks are collected until they hold
+    ``flush_size`` characters, then joined and encoded once, so each block is
+    allocated at its final size instead of growing a buffer chunk by chunk.
+
+    Args:
+        chunks: String chunks, e.g. from :meth:`ToonStreamEncoder.iterencode`
+        flush_size: Minimum block size (the last block may be smaller)
+
+    Yields:
+        Encoded bytes blocks.
+    """
+    parts: list[str] = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        # A UTF-8 block is at least as many bytes as it has characters
+        if size >= flush_size:
+            yield "".join(parts).encode("utf-8")
+            parts.clear()
+            size = 0
+    if size:
+        yield "".join(parts).encode("utf-8")
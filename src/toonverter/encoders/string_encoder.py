@@ -35,6 +35,8 @@ class StringEncoder:
             delimiter: Active delimiter for arrays/fields
         """
         self.delimiter = delimiter.value
+        # Characters that force quoting, checked in one C-level pass per string
+        self._quote_chars = frozenset(QUOTE_REQUIRED_CHARS) | {self.delimiter}
 
     def encode(self, s: str) -> str:
         """Encode string, adding quotes if necessary.
@@ -75,24 +77,24 @@ class StringEncoder:
 
         # Equals dash or starts with dash (could be confused with list item)
         # Per TOON v2.0 spec: always quote strings equal to or starting with "-"
-        if s.startswith("-"):
+        first = s[0]
+        if first == "-":
             return True
 
         # Leading or trailing whitespace
-        if s[0].isspace() or s[-1].isspace():
+        if first.isspace() or s[-1].isspace():
             return True
 
         # Contains structural characters that need quoting or delimiter
-        # Combined check for efficiency
-        if any(c in QUOTE_REQUIRED_CHARS or c == self.delimiter for c in s):
+        if not self._quote_chars.isdisjoint(s):
             return True
 
-        # Reserved words (case-insensitive)
-        if s.lower() in RESERVED_WORDS:
+        # Reserved words (case-insensitive); all are at most 5 characters
+        if len(s) <= 5 and s.lower() in RESERVED_WORDS:
             return True
 
-        # Looks like a number
-        return bool(NUMBER_PATTERN.match(s))
+        # Looks like a number (a leading "-" was handled above)
+        return first.isdigit() and NUMBER_PATTERN.match(s) is not None
 
     def _quote_and_escape(self, s: str) -> str:
         """Add quotes and escape special characters.
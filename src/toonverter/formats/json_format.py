@@ -10,6 +10,47 @@ from toonverter.core.types import DecodeOptions, EncodeOptions
 from .base import BaseFormatAdapter
 
 
+try:
+    import orjson
+
+    # orjson releases that read integers beyond 64 bits as lossy floats instead of
+    # rejecting them are not used, so json.loads keeps such integers exact
+    try:
+        orjson.loads("18446744073709551616")
+    except orjson.JSONDecodeError:
+        ORJSON_AVAILABLE = True
+    else:
+        ORJSON_AVAILABLE = False
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    orjson reads ``bytes`` without decoding them to ``str`` first. Documents it
+    rejects but the standard library accepts (``NaN``/``Infinity``, integers
+    beyond 64 bits, lone surrogates) are re-parsed with ``json.loads``, which
+    also produces the error for invalid input. orjson versions that accept
+    integers beyond 64 bits as floats are not used at all.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Decoded Python data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects."""
 
@@ -73,7 +114,7 @@ class JsonFormatAdapter(BaseFormatAdapter):
             DecodingError: If decoding fails
         """
         try:
-            return json.loads(data_str)
+            return json_loads(data_str)
         except json.JSONDecodeError as e:
             if options and not options.strict:
                 return data_str
@@ -90,7 +131,7 @@ class JsonFormatAdapter(BaseFormatAdapter):
             True if valid JSON
         """
         try:
-            json.loads(data_str)
+            json_loads(data_str)
             return True
         except json.JSONDecodeError:
             return False
@@ -1,196 +1,114 @@
-"""Integrations module for third-party libraries."""
-
-# Pandas integration
-try:
-    from .pandas_integration import pandas_to_toon, pandas_to_toon_stream, toon_to_pandas
-
-    __all_pandas__ = ["pandas_to_toon", "pandas_to_toon_stream", "toon_to_pandas"]
-except ImportError:
-    __all_pandas__ = []
-
-# Pydantic integration
-try:
-    from .pydantic_integration import pydantic_to_toon, toon_to_pydantic
-
-    __all_pydantic__ = ["pydantic_to_toon", "toon_to_pydantic"]
-except ImportError:
-    __all_pydantic__ = []
-
-# LangChain integration
-try:
-    from .langchain_integration import langchain_to_toon, toon_to_langchain
-
-    __all_langchain__ = ["langchain_to_toon", "toon_to_langchain"]
-except ImportError:
-    __all_langchain__ = []
-
-# FastAPI integration
-try:
-    from .fastapi_integration import TOONResponse, TOONStreamingResponse
-
-    __all_fastapi__ = ["TOONResponse", "TOONStreamingResponse"]
-except ImportError:
-    __all_fastapi__ = []
-
-# SQLAlchemy integration
-try:
-    from .sqlalchemy_integration import (
-        bulk_insert_from_toon,
-        bulk_query_to_toon,
-        export_table_to_toon,
-        query_to_toon,
-        schema_to_toon,
-        sqlalchemy_to_toon,
-        stream_query_to_toon,
-        table_to_toon,
-        toon_to_sqlalchemy,
-    )
-
-    __all_sqlalchemy__ = [
-        "sqlalchemy_to_toon",
-        "toon_to_sqlalchemy",
-        "query_to_toon",
-        "bulk_query_to_toon",
-        "stream_query_to_toon",
-        "schema_to_toon",
-        "table_to_toon",
-        "bulk_insert_from_toon",
-        "export_table_to_toon",
-    ]
-except ImportError:
-    __all_sqlalchemy__ = []
-
-# MCP Server integration
-try:
-    from .mcp_server import ToonverterMCPServer
-
-    __all_mcp__ = ["ToonverterMCPServer"]
-except ImportError:
-    __all_mcp__ = []
-
-# LlamaIndex integration
-try:
-    from .llamaindex_integration import (
-        bulk_documents_to_toon,
-        bulk_toon_to_documents,
-        extract_metadata_to_toon,
-        index_to_toon,
-        llamaindex_to_toon,
-        stream_documents_to_toon,
-        toon_to_llamaindex,
-    )
-
-    __all_llamaindex__ = [
-        "llamaindex_to_toon",
-        "toon_to_llamaindex",
-        "bulk_documents_to_toon",
-        "bulk_toon_to_documents",
-        "stream_documents_to_toon",
-        "index_to_toon",
-        "extract_metadata_to_toon",
-    ]
-except ImportError:
-    __all_llamaindex__ = []
-
-# Haystack integration
-try:
-    from .haystack_integration import (
-        answers_to_toon,
-        haystack_to_toon,
-        toon_to_answers,
-        toon_to_haystack,
-    )
-
-    # Note: Avoid name conflicts with LlamaIndex by using module-qualified imports
-    __all_haystack__ = [
-        "haystack_to_toon",
-        "toon_to_haystack",
-        "answers_to_toon",
-        "toon_to_answers",
-    ]
-except ImportError:
-    __all_haystack__ = []
-
-# DSPy integration
-try:
-    from .dspy_integration import (
-        dataset_to_toon,
-        dspy_to_toon,
-        few_shot_to_toon,
-        optimization_trace_to_toon,
-        predictions_to_toon,
-        signature_examples_to_toon,
-        stream_dataset_to_toon,
-        toon_to_dataset,
-        toon_to_dspy,
-        toon_to_predictions,
-    )
-
-    __all_dspy__ = [
-        "dspy_to_toon",
-        "toon_to_dspy",
-        "dataset_to_toon",
-        "toon_to_dataset",
-        "stream_dataset_to_toon",
-        "predictions_to_toon",
-        "toon_to_predictions",
-        "few_shot_to_toon",
-        "signature_examples_to_toon",
-        "optimization_trace_to_toon",
-    ]
-except ImportError:
-    __all_dspy__ = []
-
-# Instructor integration
-try:
-    from .instructor_integration import (
-        bulk_responses_to_toon,
-        bulk_toon_to_responses,
-        cache_response,
-        extraction_batch_to_toon,
-        response_to_toon,
-        stream_responses_to_toon,
-        toon_to_extraction_batch,
-        toon_to_response,
-        validation_results_to_toon,
-    )
-    from .instructor_integration import (
-        schema_to_toon as instructor_schema_to_toon,  # Renamed to avoid conflict
-    )
-
-    __all_instructor__ = [
-        "response_to_toon",
-        "toon_to_response",
-        "bulk_responses_to_toon",
-        "bulk_toon_to_responses",
-        "stream_responses_to_toon",
-        "instructor_schema_to_toon",  # Use the aliased name
-        "validation_results_to_toon",
-        "extraction_batch_to_toon",
-        "toon_to_extraction_batch",
-        "cache_response",
-    ]
-except ImportError:
-    __all_instructor__ = []
-
-# Redis integration
-try:
-    from .redis_integration import RedisToonWrapper
-
-    __all_redis__ = ["RedisToonWrapper"]
-except ImportError:
-    __all_redis__ = []
-
-__all__ = (
-    __all_pandas__
-    + __all_pydantic__
-    + __all_langchain__
-    + __all_fastapi__
-    + __all_sqlalchemy__
-    + __all_mcp__
-    + __all_llamaindex__
-    + __all_haystack__
-    + __all_dspy__
-    + __all_instructor__
-    + __all_redis__
-)
+"""Integrations module for third-party libraries.
+
+Integrations are imported on first attribute access (PEP 562), so importing
+this package does not pull in pandas, FastAPI, SQLAlchemy, redis or any other
+framework. A name whose integration cannot be imported (missing optional
+dependency) is reported as missing, as if it had never been exported.
+"""
+
+import importlib
+from typing import Any
+
+
+# Public name -> (integration submodule, attribute in that submodule)
+_EXPORTS: dict[str, tuple[str, str]] = {
+    # Pandas integration
+    "pandas_to_toon": ("pandas_integration", "pandas_to_toon"),
+    "pandas_to_toon_stream": ("pandas_integration", "pandas_to_toon_stream"),
+    "toon_to_pandas": ("pandas_integration", "toon_to_pandas"),
+    # Pydantic integration
+    "pydantic_to_toon": ("pydantic_integration", "pydantic_to_toon"),
+    "toon_to_pydantic": ("pydantic_integration", "toon_to_pydantic"),
+    # LangChain integration
+    "langchain_to_toon": ("langchain_integration", "langchain_to_toon"),
+    "toon_to_langchain": ("langchain_integration", "toon_to_langchain"),
+    # FastAPI integration
+    "TOONResponse": ("fastapi_integration", "TOONResponse"),
+    "TOONStreamingResponse": ("fastapi_integration", "TOONStreamingResponse"),
+    # SQLAlchemy integration
+    "sqlalchemy_to_toon": ("sqlalchemy_integration", "sqlalchemy_to_toon"),
+    "toon_to_sqlalchemy": ("sqlalchemy_integration", "toon_to_sqlalchemy"),
+    "query_to_toon": ("sqlalchemy_integration", "query_to_toon"),
+    "bulk_query_to_toon": ("sqlalchemy_integration", "bulk_query_to_toon"),
+    "stream_query_to_toon": ("sqlalchemy_integration", "stream_query_to_toon"),
+    "schema_to_toon": ("sqlalchemy_integration", "schema_to_toon"),
+    "table_to_toon": ("sqlalchemy_integration", "table_to_toon"),
+    "bulk_insert_from_toon": ("sqlalchemy_integration", "bulk_insert_from_toon"),
+    "export_table_to_toon": ("sqlalchemy_integration", "export_table_to_toon"),
+    # MCP Server integration
+    "ToonverterMCPServer": ("mcp_server", "ToonverterMCPServer"),
+    # LlamaIndex integration
+    "llamaindex_to_toon": ("llamaindex_integration", "llamaindex_to_toon"),
+    "toon_to_llamaindex": ("llamaindex_integration", "toon_to_llamaindex"),
+    "bulk_documents_to_toon": ("llamaindex_integration", "bulk_documents_to_toon"),
+    "bulk_toon_to_documents": ("llamaindex_integration", "bulk_toon_to_documents"),
+    "stream_documents_to_toon": ("llamaindex_integration", "stream_documents_to_toon"),
+    "index_to_toon": ("llamaindex_integration", "index_to_toon"),
+    "extract_metadata_to_toon": ("llamaindex_integration", "extract_metadata_to_toon"),
+    # Haystack integration
+    "haystack_to_toon": ("haystack_integration", "haystack_to_toon"),
+    "toon_to_haystack": ("haystack_integration", "toon_to_haystack"),
+    "answers_to_toon": ("haystack_integration", "answers_to_toon"),
+    "toon_to_answers": ("haystack_integration", "toon_to_answers"),
+    # DSPy integration
+    "dspy_to_toon": ("dspy_integration", "dspy_to_toon"),
+    "toon_to_dspy": ("dspy_integration", "toon_to_dspy"),
+    "dataset_to_toon": ("dspy_integration", "dataset_to_toon"),
+    "toon_to_dataset": ("dspy_integration", "toon_to_dataset"),
+    "stream_dataset_to_toon": ("dspy_integration", "stream_dataset_to_toon"),
+    "predictions_to_toon": ("dspy_integration", "predictions_to_toon"),
+    "toon_to_predictions": ("dspy_integration", "toon_to_predictions"),
+    "few_shot_to_toon": ("dspy_integration", "few_shot_to_toon"),
+    "signature_examples_to_toon": ("dspy_integration", "signature_examples_to_toon"),
+    "optimization_trace_to_toon": ("dspy_integration", "optimization_trace_to_toon"),
+    # Instructor integration
+    "response_to_toon": ("instructor_integration", "response_to_toon"),
+    "toon_to_response": ("instructor_integration", "toon_to_response"),
+    "bulk_responses_to_toon": ("instructor_integration", "bulk_responses_to_toon"),
+    "bulk_toon_to_responses": ("instructor_integration", "bulk_toon_to_responses"),
+    "stream_responses_to_toon": ("instructor_integration", "stream_responses_to_toon"),
+    # Renamed to avoid conflict with the SQLAlchemy schema_to_toon
+    "instructor_schema_to_toon": ("instructor_integration", "schema_to_toon"),
+    "validation_results_to_toon": ("instructor_integration", "validation_results_to_toon"),
+    "extraction_batch_to_toon": ("instructor_integration", "extraction_batch_to_toon"),
+    "toon_to_extraction_batch": ("instructor_integration", "toon_to_extraction_batch"),
+    "cache_response": ("instructor_integration", "cache_response"),
+    # Redis integration
+    "RedisToonWrapper": ("redis_integration", "RedisToonWrapper"),
+}
+
+
+def _load(name: str) -> Any:
+    """Import the integration providing ``name`` and cache the attribute."""
+    module_name, attribute = _EXPORTS[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        # Like the former eager imports, export only the integrations that load
+        available = []
+        for export in _EXPORTS:
+            try:
+                _load(export)
+            except ImportError:
+                continue
+            available.append(export)
+        globals()["__all__"] = available
+        return available
+
+    if name not in _EXPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    try:
+        return _load(name)
+    except ImportError as e:
+        msg = f"{name!r} is unavailable: {e}"
+        raise AttributeError(msg) from e
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
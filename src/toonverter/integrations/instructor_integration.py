@@ -22,7 +22,8 @@ Basic usage:
     response = toon_to_response(toon_str, ResponseModel)
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from typing import TYPE_CHECKING, Any, cast
 
 
@@ -193,7 +194,10 @@ def bulk_responses_to_toon(
 
 
 def bulk_toon_to_responses(
-    toon_str: str, model_class: type["BaseModel"], options: ToonDecodeOptions | None = None
+    toon_str: str,
+    model_class: type["BaseModel"],
+    options: ToonDecodeOptions | None = None,
+    validate: bool = True,
 ) -> list["BaseModel"]:
     """Convert TOON array format to multiple Instructor responses.
 
@@ -201,6 +205,10 @@ def bulk_toon_to_responses(
         toon_str: TOON formatted string (array)
         model_class: Pydantic model class to instantiate
         options: TOON decoding options
+        validate: Validate each response against ``model_class``. Pass False
+            for trusted data that was validated before it was encoded: the
+            responses are then built with ``model_construct``, which skips
+            field constraints and validators (defaults are still filled in)
 
     Returns:
         List of Pydantic BaseModel instances
@@ -221,6 +229,8 @@ def bulk_toon_to_responses(
             msg = "Expected TOON array format"
             raise ConversionError(msg)
 
+        # Validated by default; model_construct trusts the data and skips validation
+        build: Callable[..., BaseModel] = model_class if validate else model_class.model_construct
         responses = []
         for data in data_list:
             # Extract data if metadata wrapper exists
@@ -229,7 +239,7 @@ def bulk_toon_to_responses(
             if not isinstance(data, dict):
                 msg = "Decoded TOON data must be an object for model conversion in bulk responses"
                 raise ConversionError(msg)
-            responses.append(model_class(**data))
+            responses.append(build(**data))
 
         return responses
 
@@ -242,17 +252,19 @@ def bulk_toon_to_responses(
 
 
 def stream_responses_to_toon(
-    responses: list["BaseModel"],
+    responses: Iterable["BaseModel"],
     chunk_size: int = 100,
     include_metadata: bool = False,
     options: ToonEncodeOptions | None = None,
 ) -> Iterator[str]:
     """Stream large response collections to TOON in chunks.
 
-    Memory-efficient for processing large datasets.
+    Memory-efficient for processing large datasets: responses are pulled
+    from ``responses`` one chunk at a time, so it can be a generator that
+    produces them lazily.
 
     Args:
-        responses: List of Pydantic BaseModel instances
+        responses: Iterable of Pydantic BaseModel instances
         chunk_size: Number of responses per chunk
         include_metadata: Include model metadata
         options: TOON encoding options
@@ -270,9 +282,8 @@ def stream_responses_to_toon(
     try:
         encoder = ToonEncoder(options)
 
-        for i in range(0, len(responses), chunk_size):
-            chunk = responses[i : i + chunk_size]
-
+        iterator = iter(responses)
+        while chunk := list(islice(iterator, chunk_size)):
             if include_metadata:
                 data_list = [
                     {"_model": r.__class__.__name__, "_data": r.model_dump()} for r in chunk
@@ -23,6 +23,7 @@ Basic usage:
 """
 
 from collections.abc import Iterator
+from itertools import chain
 from typing import Any, Union, cast
 
 from toonverter.core.exceptions import ConversionError
@@ -54,6 +55,10 @@ def _check_llamaindex():
         raise ImportError(msg)
 
 
+# Metadata values of these exact types are encoded as-is by extract_metadata_to_toon
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 # =============================================================================
 # DOCUMENT CONVERSION
 # =============================================================================
@@ -305,7 +310,9 @@ def extract_metadata_to_toon(
 ) -> str:
     """Extract only metadata from documents to TOON format.
 
-    Useful for analyzing document collections without full text.
+    Useful for analyzing document collections without full text. Metadata
+    holding only str/int/float/bool/None values is encoded without copying;
+    other values are converted with ``str()``.
 
     Args:
         documents: List of Document or Node instances
@@ -331,18 +338,20 @@ def extract_metadata_to_toon(
 
     try:
         encoder = ToonEncoder(options)
-        processed_metadata_list = []
-        for doc in documents:
-            meta_dict = doc.metadata or {}
+        metadata_list = [doc.metadata or {} for doc in documents]
+        value_types = set(map(type, chain.from_iterable(meta.values() for meta in metadata_list)))
+        if not value_types <= _SCALAR_TYPES:
             # Convert potentially non-serializable values to strings for robust encoding
-            serializable_meta = {
-                k: str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v
-                for k, v in meta_dict.items()
-            }
-            processed_metadata_list.append(serializable_meta)
-
-        # Encode the list of processed metadata dictionaries
-        return encoder.encode(cast("Any", processed_metadata_list))
+            metadata_list = [
+                {
+                    k: str(v) if not isinstance(v, (str, int, float, bool, type(None))) else v
+                    for k, v in meta_dict.items()
+                }
+                for meta_dict in metadata_list
+            ]
+
+        # Encode the list of metadata dictionaries
+        return encoder.encode(cast("Any", metadata_list))
 
     except Exception as e:
         msg = f"Failed to extract metadata to TOON: {e}"
@@ -5,7 +5,8 @@ particularly for RAG (Retrieval Augmented Generation) scenarios where
 metadata overhead is high. It supports Redis JSON and Hash types.
 """
 
-from typing import Any, cast
+import gzip
+from typing import Any, Literal, cast
 
 from toonverter.core import registry
 
@@ -15,6 +16,19 @@ try:
 except ImportError:
     Redis = Any  # type: ignore
 
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Payloads smaller than this are returned uncompressed: the framing overhead
+# outweighs the savings
+COMPRESSION_MIN_BYTES = 1024
+
+Compression = Literal["gzip", "br"]
+
 
 class RedisToonWrapper:
     """Wrapper for Redis client to retrieve data in TOON format.
@@ -62,24 +76,58 @@ class RedisToonWrapper:
         Returns:
             TOON-encoded string representing the list of documents
         """
-        # Fetch all JSONs in one go (pipeline could be used, but json().mget is standard)
+        # Fetch all JSONs in one go (json().mget is standard)
         # Note: redis-py's json().mget might vary by version, usage path:
         # r.json().mget(keys) usually returns a list of objects.
         try:
             data = self.client.json().mget(keys, ".")
         except AttributeError:
             # Fallback for older clients or different implementations
-            pipe = self.client.pipeline()
-            for key in keys:
-                pipe.json().get(key)
-            data = pipe.execute()
+            data = self._pipeline_get(keys)
 
         # Filter out None values for missing keys
         valid_data = [item for item in data if item is not None]
 
         if not valid_data:
             return "[]"
+        return self._encode(valid_data, **options)
+
+    def mget_json_compressed(
+        self, keys: list[str], method: Compression = "gzip", **options: Any
+    ) -> tuple[bytes, dict[str, str]]:
+        """Retrieve multiple Redis JSON values as a compressed TOON array.
+
+        Same as :meth:`mget_json`, compressed for the wire with
+        :meth:`compress_payload`.
+
+        Args:
+            keys: List of Redis keys
+            method: 'gzip' or 'br' (Brotli, requires the ``brotli`` package)
+            **options: Encoding options passed to TOON encoder
+
+        Returns:
+            Tuple of the payload bytes and the headers to send with them
+        """
+        return self.compress_payload(self.mget_json(keys, **options), method)
+
+    def get_many(self, keys: list[str], **options: Any) -> str:
+        """Retrieve several Redis JSON values in one round-trip as a TOON array.
+
+        Issues one ``JSON.GET`` per key through a non-transactional pipeline,
+        which (unlike ``JSON.MGET``) also works when the keys live on different
+        cluster slots. Documents sharing one flat schema are emitted as a single
+        tabular block, as with :meth:`mget_json`.
+
+        Args:
+            keys: List of Redis keys
+            **options: Encoding options passed to TOON encoder
 
+        Returns:
+            TOON-encoded string representing the documents that exist
+        """
+        valid_data = [item for item in self._pipeline_get(keys) if item is not None]
+        if not valid_data:
+            return "[]"
         return self._encode(valid_data, **options)
 
     def hgetall(self, key: str, **options: Any) -> str | None:
@@ -133,6 +181,69 @@ class RedisToonWrapper:
 
         return self._encode(processed, **options)
 
+    def search_results_compressed(
+        self,
+        results: list[Any],
+        fields: list[str] | None = None,
+        method: Compression = "gzip",
+        **options: Any,
+    ) -> tuple[bytes, dict[str, str]]:
+        """Optimize a list of search results and compress it for the wire.
+
+        Same as :meth:`search_results`, compressed with :meth:`compress_payload`.
+
+        Args:
+            results: List of result objects (dicts or objects with __dict__)
+            fields: Optional list of fields to include (projection)
+            method: 'gzip' or 'br' (Brotli, requires the ``brotli`` package)
+            **options: Encoding options
+
+        Returns:
+            Tuple of the payload bytes and the headers to send with them
+        """
+        return self.compress_payload(self.search_results(results, fields, **options), method)
+
+    @staticmethod
+    def compress_payload(payload: str, method: Compression) -> tuple[bytes, dict[str, str]]:
+        """Compress a TOON payload for HTTP transfer.
+
+        Payloads under ``COMPRESSION_MIN_BYTES`` are returned as plain UTF-8.
+
+        Args:
+            payload: TOON-encoded string
+            method: 'gzip' or 'br' (Brotli, requires the ``brotli`` package)
+
+        Returns:
+            Tuple of the payload bytes and the headers to send with them
+            (``Content-Encoding`` is set only if the payload was compressed)
+
+        Raises:
+            ValueError: If the method is not supported
+            ImportError: If 'br' is requested and brotli is not installed
+        """
+        if method not in ("gzip", "br"):
+            msg = f"Unsupported compression '{method}' (expected 'gzip' or 'br')"
+            raise ValueError(msg)
+
+        data = payload.encode("utf-8")
+        if len(data) < COMPRESSION_MIN_BYTES:
+            return data, {}
+
+        if method == "br":
+            if not BROTLI_AVAILABLE:
+                msg = "brotli is required for 'br' compression. Install with: pip install brotli"
+                raise ImportError(msg)
+            return brotli.compress(data, quality=4), {"Content-Encoding": "br"}
+
+        return gzip.compress(data, mtime=0), {"Content-Encoding": "gzip"}
+
+    def _pipeline_get(self, keys: list[str]) -> list[Any]:
+        """Fetch JSON values for ``keys`` with a single pipelined round-trip."""
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.json().get(key)
+        return pipe.execute()
+
     def _encode(self, data: Any, **options: Any) -> str:
         """Helper to encode data with options."""
         # We construct ToonEncodeOptions manually to support advanced features
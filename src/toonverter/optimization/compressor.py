@@ -1,9 +1,58 @@
-from collections import Counter
+import random
+from collections import Counter, defaultdict
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from toonverter.core import ToonConverterError
 
 
+# Lists longer than SAMPLE_THRESHOLD are estimated from SAMPLE_SIZE items in should_compress()
+SAMPLE_THRESHOLD = 128
+SAMPLE_SIZE = 64
+
+# Lists of at least TABLE_MIN_ROWS dicts sharing one key order are processed column by column
+TABLE_MIN_ROWS = 8
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _table_keys(data: list[Any]) -> tuple[Any, ...] | None:
+    """Return the shared key order if data is a table: plain dicts with identical keys."""
+    if len(data) < TABLE_MIN_ROWS or set(map(type, data)) != {dict}:
+        return None
+    shapes = set(map(tuple, data))
+    if len(shapes) != 1:
+        return None
+    return shapes.pop() or None
+
+
+def _plan_table(
+    rows: list[dict[Any, Any]], keys: tuple[Any, ...], plan: list[tuple[int, Any, Any]], pos: int
+) -> int | None:
+    """Lay out a table's key and value slots in the order a row-by-row walk visits them.
+
+    Appends ``(position, key, None)`` for each key and ``(position, None, column)``
+    for each column of scalars; a column of nested tables is laid out in place.
+    Returns the number of slots per row, or None if a column holds anything else.
+    """
+    for key in keys:
+        column = [row[key] for row in rows]
+        plan.append((pos, key, None))
+        pos += 1
+        types = set(map(type, column))
+        if types <= _SCALAR_TYPES:
+            plan.append((pos, None, column))
+            pos += 1
+            continue
+        nested_keys = _table_keys(column)
+        if nested_keys is None:
+            return None
+        nested_pos = _plan_table(column, nested_keys, plan, pos)
+        if nested_pos is None:
+            return None
+        pos = nested_pos
+    return pos
+
+
 class CompressionError(ToonConverterError):
     pass
 
@@ -18,19 +67,7 @@ class SmartCompressor:
         counts: Counter[str] = Counter()
         self._scan(data, counts)
 
-        candidates = []
-        symbol_counter = 0
-
-        for string, count in counts.items():
-            if len(string) < self.min_length or count < self.min_occurrences:
-                continue
-            sym_len = len(self.prefix) + len(str(symbol_counter))
-            savings = (len(string) - sym_len) * count
-            overhead = len(string) + sym_len + 4
-            if savings > overhead:
-                candidates.append(string)
-                symbol_counter += 1
-
+        candidates = self._select_candidates(counts)
         candidates.sort()
         symbol_map = {}
         reverse_map = {}
@@ -44,6 +81,20 @@ class SmartCompressor:
 
         return {"$schema": "toon-sdc-v1", "$symbols": reverse_map, "$payload": compressed_payload}
 
+    def should_compress(self, data: Any) -> bool:
+        """Estimate whether compress() would replace any strings in data.
+
+        Lists longer than SAMPLE_THRESHOLD are not walked in full: a fixed-seed
+        sample of SAMPLE_SIZE items is scanned and the counts of strings that
+        repeat within the sample are scaled up to the full list length, so the
+        check costs the same for 200 records as for 200,000.
+        """
+        counts: defaultdict[str, float] = defaultdict(float)
+        hits: Counter[str] = Counter()
+        self._scan_sampled(data, counts, hits, 1.0)
+        repeated = {s: c for s, c in counts.items() if hits[s] >= self.min_occurrences}
+        return bool(self._select_candidates(repeated))
+
     def decompress(self, compressed_data: dict[str, Any]) -> Any:
         if compressed_data.get("$schema") != "toon-sdc-v1":
             if "$symbols" not in compressed_data or "$payload" not in compressed_data:
@@ -57,18 +108,95 @@ class SmartCompressor:
         if isinstance(data, str):
             counts[data] += 1
         elif isinstance(data, list):
-            for item in data:
-                self._scan(item, counts)
+            keys = _table_keys(data)
+            if keys is None or not self._scan_table(data, keys, counts):
+                for item in data:
+                    self._scan(item, counts)
         elif isinstance(data, dict):
             for key, value in data.items():
                 counts[key] += 1
                 self._scan(value, counts)
 
+    def _scan_table(
+        self, rows: list[dict[Any, Any]], keys: tuple[Any, ...], counts: Counter[str]
+    ) -> bool:
+        """Count a table's strings one column at a time.
+
+        Each column is counted with a single ``Counter.update``. New strings are
+        added to ``counts`` in the order a row-by-row walk would first meet them,
+        so candidate selection is unchanged. Returns False (counting nothing) if
+        a column holds values other than scalars or nested tables.
+        """
+        plan: list[tuple[int, Any, Any]] = []
+        width = _plan_table(rows, keys, plan, 0)
+        if width is None:
+            return False
+
+        found: Counter[Any] = Counter()
+        # Row-major index of each value's first occurrence: row * width + position
+        first: dict[str, int] = {}
+        last_row = (len(rows) - 1) * width
+        for pos, key, column in plan:
+            if column is None:
+                found[key] += len(rows)
+                if pos < first.get(key, last_row + width):
+                    first[key] = pos
+                continue
+            found.update(column)
+            # Walking the column backwards leaves each value at its earliest index
+            firsts = dict(zip(reversed(column), range(last_row + pos, -1, -width), strict=True))
+            for value, index in firsts.items():
+                if value.__class__ is str and index < first.get(value, last_row + width):
+                    first[value] = index
+
+        for string in sorted(first, key=first.__getitem__):
+            counts[string] += found[string]
+        return True
+
+    def _scan_sampled(
+        self, data: Any, counts: defaultdict[str, float], hits: Counter[str], weight: float
+    ) -> None:
+        if isinstance(data, str):
+            counts[data] += weight
+            hits[data] += 1
+        elif isinstance(data, list):
+            items = data
+            if len(data) > SAMPLE_THRESHOLD:
+                # Seeded by length so repeated calls on the same data agree
+                items = random.Random(len(data)).sample(data, SAMPLE_SIZE)
+                weight *= len(data) / SAMPLE_SIZE
+            for item in items:
+                self._scan_sampled(item, counts, hits, weight)
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                counts[key] += weight
+                hits[key] += 1
+                self._scan_sampled(value, counts, hits, weight)
+
+    def _select_candidates(self, counts: Mapping[str, float]) -> list[str]:
+        candidates = []
+        symbol_counter = 0
+
+        for string, count in counts.items():
+            if len(string) < self.min_length or count < self.min_occurrences:
+                continue
+            sym_len = len(self.prefix) + len(str(symbol_counter))
+            savings = (len(string) - sym_len) * count
+            overhead = len(string) + sym_len + 4
+            if savings > overhead:
+                candidates.append(string)
+                symbol_counter += 1
+
+        return candidates
+
     def _replace(self, data: Any, symbol_map: dict[str, str]) -> Any:
         if isinstance(data, str):
             return symbol_map.get(data, data)
 
         if isinstance(data, list):
+            keys = _table_keys(data)
+            if keys is not None:
+                return self._map_table(data, keys, symbol_map, self._replace)
             return [self._replace(item, symbol_map) for item in data]
 
         if isinstance(data, dict):
@@ -86,6 +214,9 @@ class SmartCompressor:
             return symbols.get(data, data)
 
         if isinstance(data, list):
+            keys = _table_keys(data)
+            if keys is not None:
+                return self._map_table(data, keys, symbols, self._resolve)
             return [self._resolve(item, symbols) for item in data]
 
         if isinstance(data, dict):
@@ -97,3 +228,31 @@ class SmartCompressor:
             return new_dict
 
         return data
+
+    def _map_table(
+        self,
+        rows: list[dict[Any, Any]],
+        keys: tuple[Any, ...],
+        mapping: dict[str, str],
+        transform: Callable[[Any, dict[str, str]], Any],
+    ) -> list[dict[Any, Any]]:
+        """Apply mapping to a table's keys and values column by column, then rebuild the rows.
+
+        Scalar columns are mapped with one ``map`` call and nested tables
+        recursively; other columns go through ``transform`` cell by cell.
+        """
+        get = mapping.get
+        columns: list[list[Any]] = []
+        for key in keys:
+            column = [row[key] for row in rows]
+            if set(map(type, column)) <= _SCALAR_TYPES:
+                columns.append(list(map(get, column, column)))
+                continue
+            nested_keys = _table_keys(column)
+            if nested_keys is not None:
+                columns.append(self._map_table(column, nested_keys, mapping, transform))
+            else:
+                columns.append([transform(value, mapping) for value in column])
+
+        new_keys = [get(key, key) for key in keys]
+        return [dict(zip(new_keys, values, strict=True)) for values in zip(*columns, strict=True)]
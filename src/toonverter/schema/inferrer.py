@@ -1,6 +1,8 @@
 """Schema Inference Engine."""
 
-from typing import Any
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any, cast
 
 from .models import SchemaField
 
@@ -11,41 +13,11 @@ class SchemaInferrer:
     def infer(self, data: Any) -> SchemaField:
         """Infer schema from a single data instance.
 
-        Recursive function that maps Python types to SchemaFields.
+        Data is reduced to a structural fingerprint (value types, keys and
+        item shapes) first, so repeated shapes reuse a cached schema. The
+        returned schema is a fresh copy and safe to mutate or merge.
         """
-        if data is None:
-            return SchemaField(type="null", nullable=True)
-
-        if isinstance(data, bool):
-            return SchemaField(type="boolean")
-
-        if isinstance(data, int):
-            return SchemaField(type="integer")
-
-        if isinstance(data, float):
-            return SchemaField(type="float")
-
-        if isinstance(data, str):
-            return SchemaField(type="string")
-
-        if isinstance(data, list):
-            if not data:
-                return SchemaField(type="array", items=SchemaField(type="unknown"))
-
-            # Infer schema for all items and merge them
-            item_schema = self.infer(data[0])
-            for item in data[1:]:
-                item_schema = item_schema.merge(self.infer(item))
-
-            return SchemaField(type="array", items=item_schema)
-
-        if isinstance(data, dict):
-            properties = {}
-            for key, value in data.items():
-                properties[key] = self.infer(value)
-            return SchemaField(type="object", properties=properties)
-
-        return SchemaField(type="unknown", description=str(type(data)))
+        return _copy_schema(_infer_from_shape(_fingerprint(data)))
 
     def infer_from_stream(self, iterator: Any, limit: int = 1000) -> SchemaField:
         """Infer schema from a stream of data.
@@ -66,3 +38,97 @@ class SchemaInferrer:
                 break
 
         return current_schema
+
+
+def _fingerprint(data: Any) -> Hashable:
+    """Reduce data to a hashable key that fully determines its inferred schema.
+
+    Primitives map to their type. Objects keep their keys in order (non-string
+    keys are tagged with their type so that e.g. ``1`` and ``True`` stay
+    distinct). Arrays keep their item shapes in order, run-length encoded, since
+    merging is order-dependent.
+    """
+    if isinstance(data, dict):
+        return (
+            dict,
+            tuple(
+                (key if key.__class__ is str else (key.__class__, key), _fingerprint(value))
+                for key, value in data.items()
+            ),
+        )
+
+    if isinstance(data, list):
+        runs: list[list[Any]] = []
+        for item in data:
+            shape = _fingerprint(item)
+            if runs and runs[-1][0] == shape:
+                runs[-1][1] += 1
+            else:
+                runs.append([shape, 1])
+        return (list, tuple((shape, count) for shape, count in runs))
+
+    # Classes are hashable; typeshed's type[Any] just doesn't say so
+    return cast("Hashable", type(data))
+
+
+@lru_cache(maxsize=4096)
+def _infer_from_shape(shape: Hashable) -> SchemaField:
+    """Cached schema for a fingerprint; shared, so callers must copy it."""
+    return _build_schema(shape)
+
+
+def _build_schema(shape: Any) -> SchemaField:
+    """Build a new schema from a fingerprint.
+
+    Recursive function that maps Python types to SchemaFields.
+    """
+    if isinstance(shape, tuple):
+        kind, body = shape
+
+        if kind is list:
+            if not body:
+                return SchemaField(type="array", items=SchemaField(type="unknown"))
+
+            # Infer schema for all items and merge them
+            item_schema = None
+            for item_shape, count in body:
+                for _ in range(count):
+                    schema = _build_schema(item_shape)
+                    item_schema = schema if item_schema is None else item_schema.merge(schema)
+
+            return SchemaField(type="array", items=item_schema)
+
+        properties = {}
+        for key, value_shape in body:
+            properties[key if isinstance(key, str) else key[1]] = _build_schema(value_shape)
+        return SchemaField(type="object", properties=properties)
+
+    if shape is type(None):
+        return SchemaField(type="null", nullable=True)
+
+    if issubclass(shape, bool):
+        return SchemaField(type="boolean")
+
+    if issubclass(shape, int):
+        return SchemaField(type="integer")
+
+    if issubclass(shape, float):
+        return SchemaField(type="float")
+
+    if issubclass(shape, str):
+        return SchemaField(type="string")
+
+    return SchemaField(type="unknown", description=str(shape))
+
+
+def _copy_schema(schema: SchemaField) -> SchemaField:
+    """Copy a schema tree so the cached original is never mutated."""
+    return SchemaField(
+        type=schema.type,
+        nullable=schema.nullable,
+        required=schema.required,
+        items=_copy_schema(schema.items) if schema.items is not None else None,
+        properties={key: _copy_schema(value) for key, value in schema.properties.items()},
+        description=schema.description,
+        union_types=[_copy_schema(t) for t in schema.union_types],
+    )
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 # Supported data types in TOON schema
@@ -36,6 +40,10 @@ class SchemaField:
     properties: dict[str, SchemaField] = field(default_factory=dict)
     description: str | None = None
     union_types: list[SchemaField] = field(default_factory=list)
+    # Validation functions built by SchemaValidator.compile(), keyed by strict
+    _compiled: dict[bool, Callable[[Any], list[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize schema to dictionary."""
@@ -86,6 +94,10 @@ class SchemaField:
 
         This is the core logic for schema inference.
         """
+        # Both sides may be updated in place, so compiled validators are stale
+        self._compiled.clear()
+        other._compiled.clear()
+
         # 1. Handle Unknowns (widening)
         if self.type == "unknown":
             return other
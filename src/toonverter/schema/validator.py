@@ -1,10 +1,15 @@
 """Schema Validator."""
 
+from collections.abc import Callable
 from typing import Any
 
 from .models import SchemaField
 
 
+# Compiled check for one schema node: (data, path, errors) -> None
+_Check = Callable[[Any, str, list[str]], None]
+
+
 class ValidationError(Exception):
     """Base class for validation errors."""
 
@@ -18,76 +23,132 @@ class SchemaValidator:
         Returns:
             List of error messages. Empty list implies valid.
         """
-        errors: list[str] = []
-        self._validate_recursive(data, schema, "$", errors, strict)
-        return errors
+        return self.compile(schema, strict=strict)(data)
+
+    def compile(self, schema: SchemaField, strict: bool = False) -> Callable[[Any], list[str]]:
+        """Compile a schema into a reusable validation function.
+
+        The schema tree is translated once into nested checks with the type
+        dispatch already resolved, so validating many documents (or large
+        arrays) does not re-inspect the schema per value. The function is
+        cached on ``schema`` and returned again by later calls; ``merge()``
+        discards it, other in-place changes to ``schema`` are not seen.
+
+        Returns:
+            Function taking data and returning its list of error messages.
+        """
+        cached = schema._compiled.get(strict)
+        if cached is not None:
+            return cached
+
+        check = _compile_node(schema, strict)
+
+        def validate(data: Any) -> list[str]:
+            errors: list[str] = []
+            check(data, "$", errors)
+            return errors
+
+        schema._compiled[strict] = validate
+        return validate
+
+
+# Strict type checking to avoid bool matching int
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda data: isinstance(data, str),
+    "integer": lambda data: isinstance(data, int) and not isinstance(data, bool),
+    "float": lambda data: isinstance(data, (float, int)) and not isinstance(data, bool),
+    "boolean": lambda data: isinstance(data, bool),
+    "array": lambda data: isinstance(data, list),
+    "object": lambda data: isinstance(data, dict),
+}
+
+
+def _compile_node(schema: SchemaField, strict: bool) -> _Check:
+    """Build the check for one schema node and, recursively, its children."""
+    schema_type = schema.type
+    null_ok = schema.nullable or schema_type == "null"
+    body = _compile_body(schema, strict)
 
-    def _validate_recursive(
-        self, data: Any, schema: SchemaField, path: str, errors: list[str], strict: bool
-    ) -> None:
+    def check(data: Any, path: str, errors: list[str]) -> None:
         # 1. Null check
         if data is None:
-            if not schema.nullable and schema.type != "null":
-                errors.append(f"{path}: Expected {schema.type}, got null")
+            if not null_ok:
+                errors.append(f"{path}: Expected {schema_type}, got null")
             return
+        if body is not None:
+            body(data, path, errors)
 
-        # 2. Type check
-        if schema.type == "unknown":
-            return  # Unknown accepts anything
+    return check
 
-        if schema.type == "union":
+
+def _compile_body(schema: SchemaField, strict: bool) -> _Check | None:
+    """Build the non-null part of a node's check; None accepts any value."""
+    schema_type = schema.type
+
+    # 2. Type check
+    if schema_type == "unknown":
+        return None  # Unknown accepts anything
+
+    if schema_type == "union":
+        subtypes = [_compile_node(subtype, strict) for subtype in schema.union_types]
+
+        def check_union(data: Any, path: str, errors: list[str]) -> None:
             # Check if data matches ANY of the union types
-            valid_union = False
-            for subtype in schema.union_types:
+            for subtype in subtypes:
                 sub_errors: list[str] = []
-                self._validate_recursive(data, subtype, path, sub_errors, strict)
+                subtype(data, path, sub_errors)
                 if not sub_errors:
-                    valid_union = True
-                    break
-            if not valid_union:
-                errors.append(f"{path}: Data does not match any of the union types")
-            return
+                    return
+            errors.append(f"{path}: Data does not match any of the union types")
 
-        # Strict type checking to avoid bool matching int
-        is_valid = False
-        if schema.type == "string":
-            is_valid = isinstance(data, str)
-        elif schema.type == "integer":
-            is_valid = isinstance(data, int) and not isinstance(data, bool)
-        elif schema.type == "float":
-            is_valid = isinstance(data, (float, int)) and not isinstance(data, bool)
-        elif schema.type == "boolean":
-            is_valid = isinstance(data, bool)
-        elif schema.type == "array":
-            is_valid = isinstance(data, list)
-        elif schema.type == "object":
-            is_valid = isinstance(data, dict)
-        else:
-            # Fallback for custom types if any
-            is_valid = True
-
-        if not is_valid:
-            errors.append(f"{path}: Expected {schema.type}, got {type(data).__name__}")
-            return
+        return check_union
+
+    is_valid = _TYPE_CHECKS.get(schema_type)
+    if is_valid is None:
+        # Fallback for custom types if any
+        return None
 
-        # 3. Recursive checks
-        if schema.type == "array":
-            if schema.items:
+    # 3. Recursive checks
+    if schema_type == "array":
+        items = _compile_node(schema.items, strict) if schema.items else None
+
+        def check_array(data: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(data, list):
+                errors.append(f"{path}: Expected array, got {type(data).__name__}")
+                return
+            if items is not None:
                 for i, item in enumerate(data):
-                    self._validate_recursive(item, schema.items, f"{path}[{i}]", errors, strict)
+                    items(item, f"{path}[{i}]", errors)
+
+        return check_array
+
+    if schema_type == "object":
+        properties = {key: _compile_node(prop, strict) for key, prop in schema.properties.items()}
+        required = [key for key, prop in schema.properties.items() if prop.required]
+
+        def check_object(data: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(data, dict):
+                errors.append(f"{path}: Expected object, got {type(data).__name__}")
+                return
 
-        if schema.type == "object":
             # Check required fields
-            for key, prop_schema in schema.properties.items():
-                if prop_schema.required and key not in data:
+            for key in required:
+                if key not in data:
                     errors.append(f"{path}: Missing required field '{key}'")
 
             # Check property types
             for key, value in data.items():
-                if key in schema.properties:
-                    self._validate_recursive(
-                        value, schema.properties[key], f"{path}.{key}", errors, strict
-                    )
+                prop_check = properties.get(key)
+                if prop_check is not None:
+                    prop_check(value, f"{path}.{key}", errors)
                 elif strict:
                     # Strict mode: no extra fields allowed
                     errors.append(f"{path}: Unknown field '{key}'")
+
+        return check_object
+
+    def check_type(data: Any, path: str, errors: list[str]) -> None:
+        if not is_valid(data):
+            errors.append(f"{path}: Expected {schema_type}, got {type(data).__name__}")
+
+    return check_type
@@ -1,10 +1,11 @@
 """Utilities module."""
 
-from .io import read_file, write_file
+from .io import iter_json_array, read_file, write_file
 from .validation import validate_data_not_empty, validate_file_exists, validate_format_name
 
 
 __all__ = [
+    "iter_json_array",
     "read_file",
     "validate_data_not_empty",
     "validate_file_exists",
@@ -1,13 +1,28 @@
 """File I/O utilities."""
 
+import json
+import mmap
+import re
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 from toonverter.core.exceptions import FileOperationError
 
 
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_ITEM_END = frozenset(" \t\n\r,]")
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+
 def read_file(file_path: str) -> str:
     """Read file content.
 
+    Files of ``MMAP_THRESHOLD`` bytes or more are memory-mapped and decoded
+    directly from the mapping, skipping the intermediate ``bytes`` copy.
+
     Args:
         file_path: Path to file
 
@@ -19,26 +34,127 @@ def read_file(file_path: str) -> str:
     """
     try:
         path = Path(file_path)
-        return path.read_text(encoding="utf-8")
+        with path.open("rb") as f:
+            if path.stat().st_size < MMAP_THRESHOLD:
+                content = f.read().decode("utf-8")
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = str(mapped, "utf-8")
+        # Match text-mode reading, which translates \r\n and \r to \n
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
     except Exception as e:
         msg = f"Failed to read file {file_path}: {e}"
         raise FileOperationError(msg) from e
 
 
-def write_file(file_path: str, content: str) -> None:
+def write_file(file_path: str, content: str) -> int:
     """Write content to file.
 
+    Content is written as UTF-8 with newlines left untranslated.
+
     Args:
         file_path: Path to file
         content: Content to write
 
+    Returns:
+        Number of bytes written
+
     Raises:
         FileOperationError: If writing fails
     """
     try:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        data = content.encode("utf-8")
+        path.write_bytes(data)
+        return len(data)
     except Exception as e:
         msg = f"Failed to write file {file_path}: {e}"
         raise FileOperationError(msg) from e
+
+
+def iter_json_array(file_path: str, chunk_size: int = 65536) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array one at a time.
+
+    The file is read in chunks and each item is decoded as soon as it is
+    complete, so memory stays at roughly one item plus one chunk instead of
+    the whole document.
+
+    Args:
+        file_path: Path to a JSON file whose root value is an array
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        Decoded array items, in order
+
+    Raises:
+        ValueError: If the document is not a JSON array or is malformed
+    """
+    decoder = json.JSONDecoder()
+    # What the parser expects next: "[", an item or "]", "," or "]", an item, nothing
+    state = "open"
+
+    with Path(file_path).open(encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+        read_size = chunk_size
+
+        while True:
+            pos = _JSON_WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+            need_more = pos == len(buf)
+
+            if need_more:
+                pass
+            elif state == "open":
+                if buf[pos] != "[":
+                    msg = "JSON document is not an array"
+                    raise ValueError(msg)
+                pos += 1
+                state = "first"
+            elif state in ("first", "next") and buf[pos] == "]":
+                pos += 1
+                state = "end"
+            elif state == "next":
+                if buf[pos] != ",":
+                    msg = f"Expected ',' or ']' between array items, got {buf[pos]!r}"
+                    raise ValueError(msg)
+                pos += 1
+                state = "item"
+            elif state == "end":
+                msg = "Extra data after JSON array"
+                raise ValueError(msg)
+            else:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # Item spans past the buffer; read more, growing the read
+                    # size so very large items are not re-parsed too often
+                    need_more = True
+                    read_size *= 2
+                else:
+                    # A number cut at the buffer edge ("1" of "12", "1." of
+                    # "1.5") decodes early, so only trust an item followed
+                    # by a separator
+                    if not eof and (end == len(buf) or buf[end] not in _JSON_ITEM_END):
+                        need_more = True
+                    else:
+                        yield item
+                        pos = end
+                        state = "next"
+                        read_size = chunk_size
+
+            if need_more:
+                if eof:
+                    if state == "end":
+                        return
+                    msg = "Unexpected end of JSON array"
+                    raise ValueError(msg)
+                chunk = f.read(read_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
@@ -8,7 +8,13 @@ pytest.importorskip("instructor")
 
 from pydantic import BaseModel
 
-from toonverter.integrations.instructor_integration import response_to_toon, toon_to_response
+from toonverter.integrations.instructor_integration import (
+    bulk_responses_to_toon,
+    bulk_toon_to_responses,
+    response_to_toon,
+    stream_responses_to_toon,
+    toon_to_response,
+)
 
 
 class UserResponse(BaseModel):
@@ -56,3 +62,29 @@ class TestInstructorResponses:
         assert "User1" in toon
         assert "User2" in toon
         assert "User3" in toon
+
+    def test_bulk_responses_without_validation(self):
+        """Test trusted bulk data can skip validation."""
+        responses = [
+            UserResponse(name="User1", age=20, email="user1@example.com"),
+            UserResponse(name="User2", age=30, email="user2@example.com"),
+        ]
+        toon = bulk_responses_to_toon(responses)
+
+        restored = bulk_toon_to_responses(toon, UserResponse, validate=False)
+
+        assert restored == bulk_toon_to_responses(toon, UserResponse)
+        assert all(isinstance(r, UserResponse) for r in restored)
+
+    def test_stream_responses_from_generator(self):
+        """Test streaming pulls chunks from a lazy iterable."""
+        responses = [
+            UserResponse(name=f"User{i}", age=20 + i, email=f"user{i}@example.com")
+            for i in range(5)
+        ]
+
+        chunks = list(stream_responses_to_toon(iter(responses), chunk_size=2))
+
+        assert chunks == list(stream_responses_to_toon(responses, chunk_size=2))
+        assert len(chunks) == 3
+        assert [len(bulk_toon_to_responses(c, UserResponse)) for c in chunks] == [2, 2, 1]
@@ -6,7 +6,11 @@ import pytest
 # Skip if llama-index not installed
 pytest.importorskip("llama_index")
 
-from toonverter.integrations.llamaindex_integration import llamaindex_to_toon, toon_to_llamaindex
+from toonverter.integrations.llamaindex_integration import (
+    extract_metadata_to_toon,
+    llamaindex_to_toon,
+    toon_to_llamaindex,
+)
 
 
 class TestLlamaIndexNodes:
@@ -59,3 +63,35 @@ class TestLlamaIndexNodes:
             assert "Node 3" in toon
         except ImportError:
             pytest.skip("LlamaIndex not available")
+
+
+class TestLlamaIndexMetadata:
+    """Test metadata extraction."""
+
+    def test_extract_scalar_metadata(self):
+        """Test metadata sharing one set of scalar keys is encoded as a table."""
+        from llama_index.core import Document
+
+        docs = [
+            Document(text=f"Doc {i}", metadata={"filename": f"doc{i}.txt", "page": i})
+            for i in range(3)
+        ]
+
+        toon = extract_metadata_to_toon(docs)
+
+        assert toon.splitlines()[0] == "[3]{filename,page}:"
+        assert "doc2.txt,2" in toon
+
+    def test_extract_non_scalar_metadata(self):
+        """Test non-scalar metadata values are converted to strings."""
+        from llama_index.core import Document
+
+        docs = [
+            Document(text="A", metadata={"filename": "a.txt", "tags": ("x", "y")}),
+            Document(text="B", metadata={"filename": "b.txt", "tags": ("z",)}),
+        ]
+
+        toon = extract_metadata_to_toon(docs)
+
+        assert "('x', 'y')" in toon
+        assert "a.txt" in toon
@@ -1,9 +1,11 @@
 """Tests for Redis integration."""
 
+import gzip
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from toonverter.integrations import redis_integration
 from toonverter.integrations.redis_integration import RedisToonWrapper
 
 
@@ -71,6 +73,25 @@ class TestRedisIntegration:
         assert "[2]{a}:" in result or "a: 1" in result  # Depending on format decision
         assert pipeline.json.return_value.get.call_count == 2
 
+    def test_get_many_pipelined(self, mock_redis):
+        """Test get_many fetches all keys through one pipeline."""
+        wrapper = RedisToonWrapper(mock_redis)
+
+        pipeline = MagicMock()
+        mock_redis.pipeline.return_value = pipeline
+        pipeline.execute.return_value = [
+            {"id": 1, "role": "admin"},
+            None,
+            {"id": 3, "role": "user"},
+        ]
+
+        result = wrapper.get_many(["k1", "missing", "k3"])
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipeline.json.return_value.get.call_count == 3
+        pipeline.execute.assert_called_once()
+        assert "[2]{id,role}:" in result
+
     def test_hgetall_decoding(self, mock_redis):
         """Test hash retrieval with byte decoding."""
         wrapper = RedisToonWrapper(mock_redis)
@@ -133,3 +154,35 @@ class TestRedisIntegration:
 
         # Also test search_results with empty input
         assert wrapper.search_results([]) == "[]"
+
+    def test_search_results_gzip(self, mock_redis):
+        """Test gzip compression of a large search result payload."""
+        wrapper = RedisToonWrapper(mock_redis)
+        results = [{"id": i, "title": f"Document {i}"} for i in range(200)]
+
+        payload, headers = wrapper.search_results_compressed(results, method="gzip")
+
+        assert headers == {"Content-Encoding": "gzip"}
+        assert gzip.decompress(payload).decode("utf-8") == wrapper.search_results(results)
+
+    def test_mget_json_small_payload_not_compressed(self, mock_redis):
+        """Test payloads under the threshold are returned as plain bytes."""
+        wrapper = RedisToonWrapper(mock_redis)
+        mock_redis.json.return_value.mget.return_value = [{"a": 1}]
+
+        payload, headers = wrapper.mget_json_compressed(["k1"], method="gzip")
+
+        assert headers == {}
+        assert payload == wrapper.mget_json(["k1"]).encode("utf-8")
+
+    def test_compress_payload_brotli_missing(self, monkeypatch):
+        """Test 'br' compression without brotli installed."""
+        monkeypatch.setattr(redis_integration, "BROTLI_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="brotli"):
+            RedisToonWrapper.compress_payload("x" * 2048, "br")
+
+    def test_compress_payload_unknown_method(self):
+        """Test unsupported compression methods are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            RedisToonWrapper.compress_payload("x", "zstd")
@@ -1,10 +1,18 @@
 """Tests for semantic deduplication."""
 
+import types
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
-from toonverter.analysis.deduplication import ExactDeduplicator, SemanticDeduplicator
+from toonverter.analysis.deduplication import (
+    ExactDeduplicator,
+    SemanticDeduplicator,
+    _lsh_bands,
+    _similar_pairs,
+    _similar_pairs_torch,
+)
 
 
 def test_simple_deduplication():
@@ -254,3 +262,179 @@ def test_semantic_deduplicator_no_valid_texts(mock_sentence_transformer, mock_co
 
     assert result == [1, 2, 3]
     mock_sentence_transformer.return_value.encode.assert_not_called()
+
+
+def test_semantic_deduplicator_chained_similarity(
+    mock_sentence_transformer, mock_cosine_similarity
+):
+    """An item only similar to an already-removed duplicate is kept."""
+    data = ["A", "A_dup", "A_dup_dup"]
+
+    mock_model_instance = mock_sentence_transformer.return_value
+    mock_model_instance.encode.return_value = [[1], [0.95], [0.5]]
+    # A ~ A_dup and A_dup ~ A_dup_dup, but A is not similar to A_dup_dup
+    mock_cosine_similarity.return_value = [[1.0, 0.95, 0.5], [0.95, 1.0, 0.95], [0.5, 0.95, 1.0]]
+
+    deduplicator = SemanticDeduplicator(threshold=0.9)
+    result = deduplicator.optimize(data)
+
+    assert result == ["A", "A_dup_dup"]
+
+
+class _FakeIndexFlatIP:
+    """Exact inner-product index with the FAISS search interface."""
+
+    def __init__(self, dim):
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+
+    def add(self, vectors):
+        self.vectors = np.vstack([self.vectors, vectors])
+
+    def search(self, queries, k):
+        scores = queries @ self.vectors.T
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(scores, order, axis=1), order
+
+
+def test_semantic_deduplicator_uses_faiss_for_large_lists(
+    mock_sentence_transformer, mock_cosine_similarity
+):
+    """Lists above ann_min_items are compared through a FAISS index."""
+    data = ["A", "A_dup", "B", "B_dup", "C"]
+
+    mock_model_instance = mock_sentence_transformer.return_value
+    mock_model_instance.encode.return_value = [[1, 0], [0.99, 0.05], [0, 1], [0.05, 0.99], [-1, 0]]
+
+    fake_faiss = types.SimpleNamespace(IndexFlatIP=_FakeIndexFlatIP)
+    with patch.dict("sys.modules", {"faiss": fake_faiss}):
+        deduplicator = SemanticDeduplicator(threshold=0.9, ann_min_items=2, ann_neighbors=2)
+        result = deduplicator.optimize(data)
+
+    assert result == ["A", "B", "C"]
+    mock_cosine_similarity.assert_not_called()
+
+
+def test_semantic_deduplicator_faiss_missing_falls_back(
+    mock_sentence_transformer, mock_cosine_similarity
+):
+    """Without faiss, large lists use the dense similarity matrix."""
+    data = ["A", "A_dup", "B"]
+
+    mock_model_instance = mock_sentence_transformer.return_value
+    mock_model_instance.encode.return_value = [[1, 0], [0.99, 0.01], [0, 1]]
+    mock_cosine_similarity.return_value = [[1.0, 0.99, 0.0], [0.99, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+    with patch.dict("sys.modules", {"faiss": None}):
+        deduplicator = SemanticDeduplicator(threshold=0.9, ann_min_items=2)
+        result = deduplicator.optimize(data)
+
+    assert result == ["A", "B"]
+    mock_cosine_similarity.assert_called_once()
+
+
+def test_semantic_deduplicator_stores_half_precision_embeddings(
+    mock_sentence_transformer, mock_cosine_similarity
+):
+    """Cached embeddings use embedding_dtype; similarity gets float32 input."""
+    data = ["A", "B"]
+
+    mock_model_instance = mock_sentence_transformer.return_value
+    mock_model_instance.encode.return_value = [[1.0, 0.0], [0.0, 1.0]]
+    mock_cosine_similarity.return_value = [[1.0, 0.0], [0.0, 1.0]]
+
+    deduplicator = SemanticDeduplicator()
+    deduplicator.optimize(data)
+
+    assert deduplicator._embedding_cache["A"].dtype == np.float16
+    (embeddings,), _ = mock_cosine_similarity.call_args
+    assert embeddings.dtype == np.float32
+
+
+# --- Tests for MinHash Mode ---
+
+
+def test_minhash_mode_does_not_load_model(mock_sentence_transformer):
+    """MinHash mode never constructs a SentenceTransformer."""
+    deduplicator = SemanticDeduplicator(mode="minhash")
+
+    assert deduplicator.model is None
+    mock_sentence_transformer.assert_not_called()
+
+
+def test_minhash_mode_removes_near_duplicates(mock_sentence_transformer):
+    """Exact and near-duplicate strings are dropped; distinct ones and non-text items are kept."""
+    data = [
+        "The quick brown fox jumps over the lazy dog",
+        "The quick brown fox jumps over the lazy dog!",
+        "the quick brown fox jumps over the lazy dog",
+        "A completely different sentence about databases",
+        42,
+        "Another unrelated line on token compression",
+    ]
+
+    deduplicator = SemanticDeduplicator(mode="minhash", threshold=0.8)
+    result = deduplicator.optimize(data)
+
+    assert result == [
+        "The quick brown fox jumps over the lazy dog",
+        "A completely different sentence about databases",
+        42,
+        "Another unrelated line on token compression",
+    ]
+
+
+def test_lsh_bands_favour_recall():
+    """Band/row choices catch pairs at the threshold with high probability."""
+    for threshold in (0.5, 0.8, 0.9):
+        bands, rows = _lsh_bands(128, threshold)
+        assert bands * rows <= 128
+        assert 1 - (1 - threshold**rows) ** bands >= 0.95
+
+
+# --- Tests for Device Placement ---
+
+
+def test_semantic_deduplicator_passes_device_to_model(mock_sentence_transformer):
+    """The requested device is used to load the model."""
+    deduplicator = SemanticDeduplicator(device="cpu")
+
+    assert deduplicator.device == "cpu"
+    mock_sentence_transformer.assert_called_once_with("all-MiniLM-L6-v2", device="cpu")
+
+
+def test_accelerator_device_computes_similarity_with_torch(
+    mock_sentence_transformer, mock_cosine_similarity
+):
+    """On a non-CPU device, similarities are computed by torch instead of sklearn."""
+    mock_sentence_transformer.return_value.encode.return_value = [
+        [1.0, 0.0],
+        [0.99, 0.1],
+        [0.0, 1.0],
+    ]
+
+    def on_cpu(embeddings, threshold, device):
+        assert device == "cuda"
+        return _similar_pairs_torch(embeddings, threshold, "cpu")
+
+    with patch("toonverter.analysis.deduplication._similar_pairs_torch", side_effect=on_cpu):
+        result = SemanticDeduplicator(device="cuda").optimize(["A", "A2", "B"])
+
+    assert result == ["A", "B"]
+    mock_cosine_similarity.assert_not_called()
+
+
+def test_similar_pairs_torch_matches_dense():
+    """Blocked torch similarity finds the same pairs as the dense matrix."""
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(300, 8)).astype(np.float32)
+    embeddings[100:150] = embeddings[:50] + 0.01
+
+    expected = [(i, row.tolist()) for i, row in _similar_pairs(cosine_similarity(embeddings), 0.9)]
+    actual = [
+        (i, row.tolist()) for i, row in _similar_pairs_torch(embeddings, 0.9, "cpu", block_rows=64)
+    ]
+
+    assert actual == expected
+    assert len(actual) >= 50
@@ -0,0 +1,70 @@
+"""Tests for encoded size calculation."""
+
+import json
+from datetime import date
+
+import pytest
+
+import toonverter as toon
+from toonverter.analysis.size import json_encoded_size
+from toonverter.core.exceptions import EncodingError
+
+
+SAMPLES = [
+    {"id": 1, "name": "Alice", "tags": ["a", "b"], "score": 0.1, "active": True, "x": None},
+    [[], {}, "", -0.0, 1e20, False, "tab\there", "ünï 😀", '"quoted"'],
+    {1: "int key", 2.5: "float key", False: "bool key", None: "null key"},
+    [float("nan"), float("inf"), {"when": date(2024, 1, 2)}],
+    "plain string",
+    42,
+]
+
+
+@pytest.mark.parametrize("data", SAMPLES)
+@pytest.mark.parametrize(
+    ("separators", "ensure_ascii"),
+    [((", ", ": "), True), ((",", ":"), False), ((",", ":"), True)],
+)
+def test_json_encoded_size_matches_dumps(data, separators, ensure_ascii):
+    """Size equals the length of the json.dumps output."""
+    expected = len(
+        toon.encode(data, to_format="json")
+        if separators == (", ", ": ")
+        else json.dumps(data, default=str, separators=separators, ensure_ascii=ensure_ascii)
+    )
+
+    assert json_encoded_size(data, separators=separators, ensure_ascii=ensure_ascii) == expected
+
+
+def test_json_encoded_size_unsupported_type():
+    """Unserializable values raise EncodingError."""
+    with pytest.raises(EncodingError):
+        json_encoded_size({"x": object()})
+
+
+def test_json_encoded_size_circular_reference():
+    """Circular references raise EncodingError instead of looping."""
+    data: list = []
+    data.append(data)
+
+    with pytest.raises(EncodingError):
+        json_encoded_size(data)
+
+
+@pytest.mark.parametrize(
+    ("to_format", "options"),
+    [
+        ("json", {}),
+        ("json", {"compact": True}),
+        ("json", {"compact": True, "ensure_ascii": True}),
+        ("json", {"indent": 4}),
+        ("toon", {}),
+    ],
+)
+def test_encoded_size_matches_encode(to_format, options):
+    """The facade agrees with len(encode(...)) for every format and option set."""
+    data = {"users": [{"id": 1, "name": "Zoë"}, {"id": 2, "name": "Bob"}]}
+
+    assert toon.encoded_size(data, to_format, **options) == len(
+        toon.encode(data, to_format=to_format, **options)
+    )
@@ -1,6 +1,12 @@
 """Comprehensive tests for token analyzer."""
 
-from toonverter.analysis.analyzer import TiktokenCounter, analyze_text, count_tokens
+from toonverter.analysis.analyzer import (
+    TiktokenCounter,
+    _get_counter,
+    analyze_text,
+    count_tokens,
+    count_tokens_batch,
+)
 
 
 class TestTiktokenCounter:
@@ -86,6 +92,24 @@ class TestTiktokenCounter:
         assert analysis.model == "gpt-4"
         assert analysis.encoding == "cl100k_base"
 
+    def test_count_tokens_batch_matches_single(self):
+        """Test batch counting agrees with counting texts one by one."""
+        counter = TiktokenCounter()
+        texts = ["Hello, world!", "", '{"name": "Alice"}']
+
+        assert counter.count_tokens_batch(texts) == [counter.count_tokens(t) for t in texts]
+        assert counter.count_tokens_batch([]) == []
+
+    def test_analyze_batch_matches_single(self):
+        """Test batch analysis agrees with analyzing texts one by one."""
+        counter = TiktokenCounter()
+        texts = ['{"name": "Alice"}', "name: Alice"]
+        formats = ["json", "toon"]
+
+        batch = counter.analyze_batch(texts, formats)
+
+        assert batch == [counter.analyze(t, f) for t, f in zip(texts, formats, strict=True)]
+
     def test_analyze_includes_metadata(self):
         """Test analyze includes metadata."""
         counter = TiktokenCounter()
@@ -166,6 +190,19 @@ class TestConvenienceFunctions:
         count = count_tokens("Hello, world!", model="gpt-3.5-turbo")
         assert count > 0
 
+    def test_count_tokens_batch_function(self):
+        """Test count_tokens_batch agrees with count_tokens."""
+        texts = ["Hello, world!", '{"name": "Alice"}']
+
+        assert count_tokens_batch(texts) == [count_tokens(t) for t in texts]
+        assert count_tokens_batch(texts, num_threads=1) == count_tokens_batch(texts)
+
+    def test_convenience_functions_share_counter(self):
+        """Test the convenience functions reuse one counter per model."""
+        assert _get_counter("gpt-4") is _get_counter("gpt-4")
+        assert _get_counter("gpt-4") is not _get_counter("text-davinci-003")
+        assert count_tokens("Hello, world!") == _get_counter("gpt-4").count_tokens("Hello, world!")
+
     def test_analyze_text_function(self):
         """Test analyze_text convenience function."""
         analysis = analyze_text('{"name": "Alice"}', "json")
@@ -1,5 +1,10 @@
 """Unit tests for public API."""
 
+import subprocess
+import sys
+
+import pytest
+
 import toonverter as toon
 
 
@@ -93,6 +98,46 @@ class TestEncodeDecode:
         result = toon.encode(data, to_format="yaml")
         assert "key" in result
 
+    def test_encode_reuses_options_for_repeated_kwargs(self):
+        """Repeated keyword options build their options object only once."""
+        data = {"items": [1, 2, 3]}
+        first = toon.encode(data, indent=4, delimiter="|")
+        hits = toon._cached_encode_options.cache_info().hits
+        assert toon.encode(data, delimiter="|", indent=4) == first
+        assert toon._cached_encode_options.cache_info().hits == hits + 1
+
+    def test_encode_options_are_not_shared_between_calls(self, monkeypatch):
+        """An adapter mutating its options doesn't affect later calls."""
+        adapter = toon.registry.get("json")
+        encode_json = adapter.encode
+
+        def mutating_encode(data, options):
+            result = encode_json(data, options)
+            options.indent = 8
+            return result
+
+        monkeypatch.setattr(adapter, "encode", mutating_encode)
+        first = toon.encode({"a": [1]}, to_format="json", indent=4)
+        assert toon.encode({"a": [1]}, to_format="json", indent=4) == first
+
+    def test_encode_options_cache_keeps_bool_and_int_apart(self, monkeypatch):
+        """``True`` and ``1`` are equal and hash alike but are different options."""
+        adapter = toon.registry.get("json")
+        received = []
+        monkeypatch.setattr(adapter, "encode", lambda data, options: received.append(options))
+
+        toon.encode({}, to_format="json", indent=1)
+        toon.encode({}, to_format="json", indent=True)
+
+        assert [type(options.indent) for options in received] == [int, bool]
+
+    def test_encode_with_unhashable_option(self):
+        """Options that can't be cache keys still encode."""
+        from toonverter.optimization.policy import OptimizationPolicy
+
+        data = {"key": "value"}
+        assert toon.encode(data, optimization_policy=OptimizationPolicy()) == toon.encode(data)
+
     def test_decode_from_json(self):
         """Test decoding from JSON."""
         result = toon.decode('{"key": "value"}', from_format="json")
@@ -149,6 +194,14 @@ class TestLoadSave:
         toon.save(data, str(path), format="json", indent=2)
         assert path.exists()
 
+    def test_save_returns_bytes_written(self, tmp_path):
+        """Test save reports the size of the written file."""
+        path = tmp_path / "test.toon"
+
+        size = toon.save({"name": "Zoë"}, str(path), format="toon")
+
+        assert size == len(path.read_bytes())
+
 
 class TestConvert:
     """Test convert function."""
@@ -171,6 +224,7 @@ class TestConvert:
         assert target.exists()
         assert result.source_tokens > 0
         assert result.target_tokens > 0
+        assert result.metadata["target_bytes"] == len(target.read_bytes())
 
     def test_convert_failure(self):
         """Test convert handles errors."""
@@ -179,6 +233,101 @@ class TestConvert:
         assert result.success is False
         assert result.error is not None
 
+    def test_convert_streaming_jsonl_to_toon(self, tmp_path):
+        """Test streaming a JSON Lines file into a TOON array."""
+        import json
+
+        records = [{"id": i, "name": f"User{i}"} for i in range(5)]
+        source = tmp_path / "source.jsonl"
+        target = tmp_path / "target.toon"
+        source.write_text("".join(json.dumps(r) + "\n" for r in records) + "\n")
+
+        result = toon.convert(str(source), str(target), "jsonl", "toon", streaming=True)
+
+        assert result.success is True
+        assert result.metadata == {
+            "streamed": True,
+            "records": 5,
+            "source_bytes": len(source.read_bytes()),
+            "target_bytes": len(target.read_bytes()),
+        }
+        assert toon.decode(target.read_text()) == records
+
+    def test_convert_streaming_jsonl_mixed_records(self, tmp_path):
+        """Test streaming non-uniform JSON Lines records into list form."""
+        import json
+
+        records = [1, "two", 3.5]
+        source = tmp_path / "source.jsonl"
+        target = tmp_path / "target.toon"
+        source.write_text("\n".join(json.dumps(r) for r in records))
+
+        result = toon.convert(str(source), str(target), "jsonl", "toon", streaming=True)
+
+        assert result.success is True
+        assert toon.decode(target.read_text()) == records
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            [{"a": 1}, {"b": 2, "c": "x"}],
+            [{"id": 1, "meta": {"tags": ["x", "y"]}}, {"id": 2, "meta": {"score": 0.5}}],
+            [{"rows": [{"k": 1}, {"k": 2}], "n": 2}, {}, {"nested": {"deeper": {"v": [1, 2]}}}],
+        ],
+    )
+    def test_convert_streaming_non_uniform_records(self, tmp_path, records):
+        """Test streamed non-uniform and nested records decode back to the input."""
+        import json
+
+        source = tmp_path / "source.jsonl"
+        target = tmp_path / "target.toon"
+        source.write_text("\n".join(json.dumps(r) for r in records))
+
+        result = toon.convert(str(source), str(target), "jsonl", "toon", streaming=True)
+
+        assert result.success is True
+        assert toon.decode(target.read_text()) == records
+
+    def test_convert_streaming_json_array_to_toon(self, tmp_path):
+        """Test streaming the items of a JSON array file into a TOON array."""
+        import json
+
+        records = [{"id": i, "name": f"User{i}"} for i in range(5)]
+        source = tmp_path / "source.json"
+        target = tmp_path / "target.toon"
+        source.write_text(json.dumps(records, indent=2))
+
+        result = toon.convert(str(source), str(target), "json", "toon", streaming=True)
+
+        assert result.success is True
+        assert result.metadata["records"] == 5
+        assert result.metadata["source_bytes"] == len(source.read_bytes())
+        assert toon.decode(target.read_text()) == records
+
+    def test_convert_streaming_json_object_root(self, tmp_path):
+        """Test streaming a JSON document whose root is not an array fails."""
+        source = tmp_path / "source.json"
+        source.write_text('{"a": 1}')
+
+        result = toon.convert(
+            str(source), str(tmp_path / "out.toon"), "json", "toon", streaming=True
+        )
+
+        assert result.success is False
+        assert "not an array" in result.error
+
+    def test_convert_streaming_unsupported_formats(self, tmp_path):
+        """Test streaming conversion rejects unsupported format pairs."""
+        source = tmp_path / "source.json"
+        source.write_text("{}")
+
+        result = toon.convert(
+            str(source), str(tmp_path / "out.yaml"), "json", "yaml", streaming=True
+        )
+
+        assert result.success is False
+        assert "not supported" in result.error
+
 
 class TestAnalyze:
     """Test analyze function."""
@@ -205,6 +354,18 @@ class TestAnalyze:
 
         assert report is not None
 
+    def test_analyze_with_precomputed_encodings(self):
+        """Test analyze tokenizes caller-supplied encodings as given."""
+        data = {"key": "value"}
+        toon_str = toon.encode(data)
+
+        report = toon.analyze(
+            data, compare_formats=["json", "toon"], precomputed_encodings={"toon": toon_str}
+        )
+
+        assert report.format_results["toon"].serialized == toon_str
+        assert report.format_results["json"].serialized is not None
+
 
 class TestEdgeCases:
     """Test edge cases."""
@@ -234,3 +395,30 @@ class TestEdgeCases:
         # Note: This depends on implementation
         assert toon.is_supported("json") is True
         assert toon.is_supported("TOON") is True or toon.is_supported("toon") is True
+
+
+class TestLazyImports:
+    """Test optional heavy dependencies are not imported with the package."""
+
+    def test_import_does_not_load_optional_frameworks(self):
+        """Test importing toonverter skips torch, sklearn, redis and integrations."""
+        heavy = ["torch", "sentence_transformers", "sklearn", "PIL", "redis", "pandas"]
+        code = f"import sys, toonverter; print([m for m in {heavy!r} if m in sys.modules])"
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_redis_wrapper_resolved_on_access(self):
+        """Test RedisToonWrapper is still available from both packages."""
+        from toonverter.integrations import RedisToonWrapper, redis_integration
+
+        assert toon.RedisToonWrapper is redis_integration.RedisToonWrapper
+        assert RedisToonWrapper is redis_integration.RedisToonWrapper
+
+    def test_unknown_attribute_raises(self):
+        """Test missing names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = toon.not_a_real_name
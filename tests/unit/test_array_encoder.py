@@ -231,6 +231,34 @@ class TestEncodeTabular:
         assert result[0] == "data[1|]{a|b}:"
         assert result[1] == "  1|2"
 
+    def test_encode_tabular_column_type_changes(self):
+        """Test rows whose value types differ from the first row still encode correctly."""
+        arr = [
+            {"id": 1, "ok": True, "name": "Alice", "score": 1.5, "note": None},
+            {"id": 2.5, "ok": None, "name": 7, "score": 2, "note": "true"},
+            {"id": True, "ok": 0, "name": "", "score": float("nan"), "note": False},
+        ]
+        result = self.encoder.encode_tabular("rows", arr, 0)
+
+        assert result[1:] == [
+            "  1,true,Alice,1.5,null",
+            '  2.5,null,7,2,"true"',
+            '  true,0,"",null,false',
+        ]
+
+    def test_encode_tabular_key_order_follows_first_row(self):
+        """Test later rows with reordered keys are written in the header's order."""
+        arr = [{"id": 1, "name": "Alice"}, {"name": "Bob", "id": 2}]
+        result = self.encoder.encode_tabular("users", arr, 0)
+
+        assert result[1:] == ["  1,Alice", "  2,Bob"]
+
+    def test_encode_tabular_single_field(self):
+        """Test a single-column table."""
+        result = self.encoder.encode_root_array_tabular([{"id": 1}, {"id": 2}])
+
+        assert result == ["[2]{id}:", "  1", "  2"]
+
 
 class TestEncodeValue:
     """Test value encoding."""
@@ -315,3 +343,9 @@ class TestEdgeCases:
         result = self.encoder.detect_array_form(arr)
         # Empty dicts have same keys (none), so should be tabular
         assert result == ArrayForm.TABULAR
+
+    def test_encode_tabular_empty_dicts(self):
+        """Test encoding tabular array of empty dicts gives one empty row each."""
+        result = self.encoder.encode_tabular("data", [{}, {}], 0)
+
+        assert result == ["data[2]{}:", "  ", "  "]
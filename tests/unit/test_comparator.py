@@ -79,6 +79,27 @@ class TestFormatComparator:
         report = self.comparator.compare_formats(data, ["json", "yaml"], options)
         assert len(report.analyses) == 2
 
+    def test_compare_formats_retains_encoded_text(self):
+        """Test each analysis keeps its encoded text and byte size."""
+        data = {"name": "Zoë", "age": 30}
+        report = self.comparator.compare_formats(data, ["json", "toon"])
+
+        for fmt, analysis in report.format_results.items():
+            assert analysis.serialized == registry.get(fmt).encode(data)
+            assert analysis.byte_size == len(analysis.serialized.encode("utf-8"))
+
+    def test_compare_formats_uses_precomputed_encodings(self):
+        """Test precomputed text is analyzed instead of re-encoding the data."""
+        data = {"name": "Alice", "age": 30}
+        compact_json = '{"name":"Alice","age":30}'
+
+        report = self.comparator.compare_formats(
+            data, ["json", "toon"], precomputed_encodings={"json": compact_json}
+        )
+
+        assert report.format_results["json"].serialized == compact_json
+        assert report.format_results["toon"].serialized == registry.get("toon").encode(data)
+
     def test_generate_recommendations_returns_list(self):
         """Test _generate_recommendations returns list."""
         from toonverter.core.types import TokenAnalysis
@@ -201,3 +222,21 @@ class TestCompareFunction:
 
         report = compare(data, ["json"], encode_options=options)
         assert report is not None
+
+
+class TestComparisonReport:
+    """Test ComparisonReport helpers."""
+
+    def test_format_results_maps_format_to_analysis(self):
+        """Test format_results is keyed by format name."""
+        from toonverter.core.types import ComparisonReport, TokenAnalysis
+
+        json_analysis = TokenAnalysis(format="json", token_count=100, byte_size=240)
+        toon_analysis = TokenAnalysis(format="toon", token_count=50, byte_size=120)
+        report = ComparisonReport(
+            analyses=[json_analysis, toon_analysis], best_format="toon", worst_format="json"
+        )
+
+        assert list(report.format_results) == ["json", "toon"]
+        assert report.format_results["json"] is json_analysis
+        assert report.format_results["toon"].byte_size == 120
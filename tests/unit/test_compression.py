@@ -1,5 +1,8 @@
 """Tests for Smart Dictionary Compression."""
 
+import json
+import sys
+
 from toonverter.optimization import SmartCompressor
 
 
@@ -63,3 +66,79 @@ class TestSmartCompressor:
         # Should not define symbols for "short"
         assert "short" not in compressed["$symbols"].values()
         assert compressed["$payload"] == data
+
+    def test_should_compress_small_data_matches_compress(self):
+        compressor = SmartCompressor()
+        repetitive = [{"department": "engineering"}, {"department": "engineering"}] * 3
+        unique = [{"id": 1}, {"id": 2}]
+
+        assert compressor.should_compress(repetitive) is True
+        assert compressor.should_compress(unique) is False
+        assert compressor.compress(unique)["$symbols"] == {}
+
+    def test_should_compress_samples_large_lists(self, monkeypatch):
+        compressor = SmartCompressor()
+        data = {"users": [{"role": "administrator", "id": i} for i in range(1000)]}
+        scanned = []
+        original = compressor._scan_sampled
+
+        def spy(item, counts, hits, weight):
+            scanned.append(item)
+            original(item, counts, hits, weight)
+
+        monkeypatch.setattr(compressor, "_scan_sampled", spy)
+
+        assert compressor.should_compress(data) is True
+        records = [item for item in scanned if isinstance(item, dict) and "id" in item]
+        assert len(records) == 64
+
+    def test_should_compress_large_unique_list(self):
+        compressor = SmartCompressor()
+        data = [f"unique-value-{i}" for i in range(500)]
+
+        assert compressor.should_compress(data) is False
+        assert compressor.should_compress(data) is False
+
+    def _table(self):
+        return [
+            {
+                "name": f"user-{i % 7}",
+                "role": ["administrator", "developer"][i % 2],
+                "active": i % 3 == 0,
+                "preferences": {"theme": ["darkmode", "lightmode"][i % 2], "size": i},
+            }
+            for i in range(40)
+        ]
+
+    def test_table_matches_row_by_row(self, monkeypatch):
+        compressor = SmartCompressor(min_length=2)
+        data = {"users": self._table(), "owner": "administrator"}
+
+        columnar = compressor.compress(data)
+        monkeypatch.setattr(sys.modules[SmartCompressor.__module__], "TABLE_MIN_ROWS", 10**9)
+        row_by_row = compressor.compress(data)
+
+        # Same symbols, same numbering and same key order
+        assert json.dumps(columnar) == json.dumps(row_by_row)
+        assert compressor.decompress(columnar) == data
+
+    def test_table_with_mixed_key_order_roundtrips(self):
+        compressor = SmartCompressor()
+        rows = self._table()
+        rows[5] = dict(reversed(list(rows[5].items())))
+
+        compressed = compressor.compress(rows)
+
+        assert list(compressed["$payload"][5]) == list(
+            map({v: k for k, v in compressed["$symbols"].items()}.get, rows[5], rows[5])
+        )
+        assert json.dumps(compressor.decompress(compressed)) == json.dumps(rows)
+
+    def test_table_with_list_column_roundtrips(self):
+        compressor = SmartCompressor()
+        rows = [{"tags": ["important", "reviewed"][: i % 3], "kind": "document"} for i in range(20)]
+
+        compressed = compressor.compress(rows)
+
+        assert "document" in compressed["$symbols"].values()
+        assert compressor.decompress(compressed) == rows
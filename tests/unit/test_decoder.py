@@ -3,6 +3,7 @@
 import pytest
 
 from toonverter.decoders import ToonDecoder, decode
+from toonverter.decoders.lexer import TokenType, ToonLexer
 
 
 class TestToonDecoder:
@@ -76,6 +77,20 @@ class TestToonDecoder:
         result = decoder.decode(toon_str)
         assert result == expected
 
+    def test_decode_list_array_followed_by_field(self):
+        """Test fields after a list-form array stay in the enclosing object."""
+        assert decode("a[2]:\n  - 1\n  - 2\nb: 1") == {"a": [1, 2], "b": 1}
+        assert decode("m:\n  a[1]:\n    - 1\n  b: 2\nc: 3") == {"m": {"a": [1], "b": 2}, "c": 3}
+
+    def test_decode_list_item_nested_first_field(self):
+        """Test list item objects whose first field is an object or array."""
+        toon_str = "[2]:\n  - meta:\n      x: 1\n    id: 7\n  - rows[2]:\n      - 1\n      - 2"
+        assert decode(toon_str) == [{"meta": {"x": 1}, "id": 7}, {"rows": [1, 2]}]
+
+    def test_decode_empty_object_list_item(self):
+        """Test a bare hyphen decodes to an empty object."""
+        assert decode("[2]:\n  -\n  - a: 1") == [{}, {"a": 1}]
+
     def test_convenience_function(self):
         """Test convenience decode function."""
         result = decode("{name:Alice}")
@@ -88,3 +103,55 @@ class TestToonDecoder:
         encoded = encode(sample_dict)
         decoded = decode(encoded)
         assert decoded == sample_dict
+
+
+class TestToonLexer:
+    """Test suite for the TOON line lexer."""
+
+    def _line_tokens(self, text):
+        return [
+            (t.type, t.value, t.column)
+            for t in ToonLexer(text).tokenize()
+            if t.type not in (TokenType.NEWLINE, TokenType.EOF)
+        ]
+
+    def test_tokenize_list_item(self):
+        """Test a list item line is split into marker, key and value tokens."""
+        assert self._line_tokens("- item_42: value_42") == [
+            (TokenType.DASH, "-", 0),
+            (TokenType.IDENTIFIER, "item_42", 2),
+            (TokenType.COLON, ":", 9),
+            (TokenType.IDENTIFIER, "value_42", 11),
+        ]
+
+    def test_tokenize_literals(self):
+        """Test numbers, booleans and null are typed; word-like values are identifiers."""
+        tokens = self._line_tokens("[3]: -1.5,42,true,null,nan,inf.0,x-1")
+        values = [(t, v) for t, v, _ in tokens if t is not TokenType.COMMA][4:]
+        assert values == [
+            (TokenType.NUMBER, -1.5),
+            (TokenType.NUMBER, 42),
+            (TokenType.BOOLEAN, True),
+            (TokenType.NULL, None),
+            (TokenType.IDENTIFIER, "nan"),
+            (TokenType.IDENTIFIER, "inf.0"),
+            (TokenType.IDENTIFIER, "x-1"),
+        ]
+
+    def test_tokenize_quoted_string_escapes(self):
+        """Test escape sequences inside quoted strings."""
+        tokens = self._line_tokens(r'key: "a, \"b\"\n\\c"')
+        assert tokens[-1] == (TokenType.QUOTED_STRING, 'a, "b"\n\\c', 5)
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ('key: "open', "Unterminated quoted string"),
+            ('key: "bad \\x"', "Invalid escape sequence"),
+            ('key: "end\\', "Unterminated escape sequence"),
+        ],
+    )
+    def test_tokenize_quoted_string_errors(self, text, message):
+        """Test malformed quoted strings are rejected."""
+        with pytest.raises(ValueError, match=message):
+            ToonLexer(text).tokenize()
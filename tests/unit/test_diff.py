@@ -111,6 +111,39 @@ class TestToonDiffer:
         assert change.old_value == "int"
         assert change.new_value == "str"
 
+    def test_diff_equal_numbers_of_different_types(self):
+        differ = ToonDiffer()
+        obj1 = {"a": {"b": [1, True]}}
+        obj2 = {"a": {"b": [1.0, 1]}}
+        result = differ.diff(obj1, obj2)
+        assert [(c.path, c.type) for c in result.changes] == [
+            ("$.a.b[0]", ChangeType.TYPE_CHANGE),
+            ("$.a.b[1]", ChangeType.TYPE_CHANGE),
+        ]
+
+    def test_diff_list_changes_in_order(self):
+        differ = ToonDiffer()
+        obj1 = [{"x": 1}, 2]
+        obj2 = [{"x": 5}, 3, 4, 5]
+        result = differ.diff(obj1, obj2)
+        assert [c.path for c in result.changes] == ["$[0].x", "$[1]", "$[2]", "$[3]"]
+
+    def test_diff_deeply_nested(self):
+        differ = ToonDiffer()
+
+        def build(leaf):
+            root = current = {}
+            for _ in range(5000):
+                current["x"] = {}
+                current = current["x"]
+            current["v"] = leaf
+            return root
+
+        assert differ.diff(build(1), build(1)).match
+        result = differ.diff(build(1), build(2))
+        assert len(result.changes) == 1
+        assert result.changes[0].path.endswith(".x.v")
+
 
 class TestDiffFormatter:
     @pytest.fixture
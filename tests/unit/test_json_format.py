@@ -7,7 +7,8 @@ import pytest
 
 from toonverter.core.exceptions import DecodingError, EncodingError
 from toonverter.core.types import DecodeOptions, EncodeOptions
-from toonverter.formats.json_format import DateTimeEncoder
+from toonverter.formats import json_format
+from toonverter.formats.json_format import DateTimeEncoder, json_loads
 from toonverter.formats.json_format import JsonFormatAdapter as JSONFormat
 
 
@@ -365,3 +366,36 @@ class TestJSONEdgeCases:
         encoded = self.adapter.encode(data, None)
         decoded = self.adapter.decode(encoded, None)
         assert decoded == data
+
+
+class TestJsonLoads:
+    """Test the json_loads helper."""
+
+    def test_accepts_bytes(self):
+        """Test parsing UTF-8 bytes directly."""
+        assert json_loads('{"name": "Zoë", "n": [1, 2.5]}'.encode()) == {
+            "name": "Zoë",
+            "n": [1, 2.5],
+        }
+
+    def test_falls_back_for_stdlib_only_input(self):
+        """Test documents only the standard library accepts still parse."""
+        decoded = json_loads('{"nan": NaN, "big": 123456789012345678901234567890}')
+        assert decoded["big"] == 123456789012345678901234567890
+        assert decoded["nan"] != decoded["nan"]
+
+    def test_big_int_is_exact(self):
+        """Test integers beyond 64 bits are not rounded to floats."""
+        big = 123456789012345678901234567890
+        assert json_loads('{"id": 123456789012345678901234567890}') == {"id": big}
+        assert JSONFormat().decode('{"id": 123456789012345678901234567890}') == {"id": big}
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """Test invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads('{"unclosed": ')
+
+    def test_without_orjson(self, monkeypatch):
+        """Test the standard library is used when orjson is not installed."""
+        monkeypatch.setattr(json_format, "ORJSON_AVAILABLE", False)
+        assert json_loads(b'{"a": [true, null]}') == {"a": [True, None]}
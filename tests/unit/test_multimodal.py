@@ -70,6 +70,7 @@ class TestCostEstimator:
 
 
 # Mocking PIL/numpy for Processor tests if not installed
+@patch("toonverter.multimodal.processor.PYVIPS_AVAILABLE", False)
 @patch("toonverter.multimodal.processor.VISION_AVAILABLE", True)
 @patch("toonverter.multimodal.processor.Image")
 @patch("toonverter.multimodal.processor.np")
@@ -183,6 +184,70 @@ class TestSmartImageProcessor:
         assert optimized == mock_img_instance
 
 
+@patch("toonverter.multimodal.processor.VISION_AVAILABLE", True)
+@patch("toonverter.multimodal.processor.PYVIPS_AVAILABLE", True)
+@patch("toonverter.multimodal.processor._load_pyvips")
+class TestSmartImageProcessorVips:
+    @staticmethod
+    def _thumbnail(unique_colors):
+        """100x10 sRGB thumbnail with the given number of distinct colours."""
+        np = pytest.importorskip("numpy")
+        pixels = np.zeros((1000, 3), dtype=np.uint8)
+        pixels[:unique_colors, 0] = np.arange(unique_colors) % 256
+        pixels[:unique_colors, 1] = np.arange(unique_colors) // 256
+        thumb = MagicMock(width=100, height=10, bands=3)
+        thumb.colourspace.return_value = thumb
+        thumb.hasalpha.return_value = False
+        thumb.write_to_memory.return_value = pixels.tobytes()
+        return thumb
+
+    def test_process_photo_with_tile_snap(self, mock_load):
+        from toonverter.multimodal import SmartImageProcessor
+
+        source = MagicMock(width=515, height=600)
+        resized = source.resize.return_value
+        resized.thumbnail_image.return_value = self._thumbnail(600)
+        resized.hasalpha.return_value = False
+        resized.jpegsave_buffer.return_value = b"jpeg"
+        mock_load.return_value.Image.new_from_buffer.return_value = source
+
+        data, mime = SmartImageProcessor().process(b"raw", target_provider="openai")
+
+        assert (data, mime) == (b"jpeg", "image/jpeg")
+        mock_load.return_value.Image.new_from_buffer.assert_called_once_with(b"raw", "")
+        # Same size as the Pillow path: 512 x int(600 * 512 / 515)
+        source.resize.assert_called_once_with(512 / 515, vscale=596 / 600, kernel="lanczos3")
+        # Classified after the resize, without EXIF auto-rotation
+        resized.thumbnail_image.assert_called_once_with(
+            100, height=100, size="down", no_rotate=True
+        )
+        resized.jpegsave_buffer.assert_called_once_with(Q=85, optimize_coding=True, strip=True)
+
+    def test_process_chart_without_resize(self, mock_load):
+        from toonverter.multimodal import SmartImageProcessor
+
+        source = MagicMock(width=570, height=570)
+        source.thumbnail_image.return_value = self._thumbnail(10)
+        source.pngsave_buffer.return_value = b"png"
+        mock_load.return_value.Image.new_from_buffer.return_value = source
+
+        data, mime = SmartImageProcessor().process(b"raw", target_provider="openai")
+
+        assert (data, mime) == (b"png", "image/png")
+        source.resize.assert_not_called()
+
+    def test_falls_back_to_pillow_without_libvips(self, mock_load):
+        from toonverter.multimodal import SmartImageProcessor
+
+        mock_load.return_value = None
+        processor = SmartImageProcessor()
+
+        with patch("toonverter.multimodal.processor.Image") as mock_image:
+            mock_image.open.side_effect = RuntimeError("pillow path")
+            with pytest.raises(RuntimeError, match="pillow path"):
+                processor.process(b"raw")
+
+
 class TestVendorAdapters:
     def test_openai_adapter(self):
         from toonverter.multimodal.vendors import OpenAIAdapter
@@ -89,6 +89,32 @@ class TestSchemaInference:
         assert merged2.type == "array"
         assert merged2.items.type == "integer"
 
+    def test_infer_reuses_schema_for_repeated_shape(self):
+        from toonverter.schema.inferrer import _infer_from_shape
+
+        inferrer = SchemaInferrer()
+        inferrer.infer({"id": 1, "tags": ["a"], "meta": {"ok": True}})
+        hits = _infer_from_shape.cache_info().hits
+
+        schema = inferrer.infer({"id": 2, "tags": ["b"], "meta": {"ok": False}})
+        assert _infer_from_shape.cache_info().hits == hits + 1
+        assert schema.properties["meta"].properties["ok"].type == "boolean"
+
+    def test_infer_returns_independent_copies(self):
+        inferrer = SchemaInferrer()
+        first = inferrer.infer({"name": "Alice"})
+        first.properties["name"].required = False
+        first.merge(SchemaField(type="null"))
+
+        second = inferrer.infer({"name": "Bob"})
+        assert second.properties["name"].required is True
+        assert second.nullable is False
+
+    def test_infer_distinguishes_key_types(self):
+        inferrer = SchemaInferrer()
+        assert list(inferrer.infer({1: "a"}).properties) == [1]
+        assert list(inferrer.infer({True: "a"}).properties) == [True]
+
 
 class TestSchemaValidation:
     def test_validate_simple(self):
@@ -149,6 +175,38 @@ class TestSchemaValidation:
         assert len(errors) == 1
         assert "Expected integer" in errors[0]
 
+    def test_compile_reuses_validator(self):
+        schema = SchemaField(
+            type="array",
+            items=SchemaField(type="object", properties={"id": SchemaField(type="integer")}),
+        )
+        validate = SchemaValidator().compile(schema, strict=True)
+
+        assert validate([{"id": 1}, {"id": 2}]) == []
+        assert validate([{"id": "x", "extra": 1}]) == [
+            "$[0].id: Expected integer, got str",
+            "$[0]: Unknown field 'extra'",
+        ]
+
+    def test_compile_caches_on_schema(self):
+        schema = SchemaField(type="object", properties={"id": SchemaField(type="integer")})
+        validate = SchemaValidator().compile(schema)
+
+        # Cached per schema and strictness, across validator instances
+        assert SchemaValidator().compile(schema) is validate
+        assert SchemaValidator().compile(schema, strict=True) is not validate
+
+    def test_merge_discards_compiled_validator(self):
+        schema = SchemaField(type="object", properties={"id": SchemaField(type="integer")})
+        other = SchemaField(type="object", properties={"name": SchemaField(type="string")})
+        validator = SchemaValidator()
+        assert validator.validate({"name": "x"}, schema) == ["$: Missing required field 'id'"]
+
+        # merge() marks "id" optional in place
+        schema.merge(other)
+
+        assert validator.validate({"name": "x"}, schema) == []
+
 
 class TestSchemaSerialization:
     def test_roundtrip_simple(self):
@@ -1,10 +1,12 @@
 """Tests for the Streaming Encoder."""
 
+import operator
 from typing import Any
 
 import pytest
 
-from toonverter.encoders.stream_encoder import StreamList, ToonStreamEncoder
+from toonverter.decoders.toon_decoder import decode
+from toonverter.encoders.stream_encoder import StreamList, ToonStreamEncoder, buffered
 from toonverter.encoders.toon_encoder import ToonEncoder
 
 
@@ -97,20 +99,10 @@ class TestToonStreamEncoder:
     ) -> None:
         """Test list containing objects."""
         data = [{"id": 1, "val": "a"}, {"id": 2, "val": "b"}]
-        stream_gen = stream_encoder.iterencode(data)
-        actual = "".join(stream_gen)
-
-        # Verify structure
-        # [2]:
-        # -
-        # >   id: 1
-        # >   val: a
-        # -
-        # >   id: 2
-        # >   val: b
+        actual = "".join(stream_encoder.iterencode(data))
 
-        assert "[2]:" in actual
-        assert "  id: 1" in actual  # Indented key
+        # First field on the hyphen line, the rest one level deeper
+        assert actual == "[2]:\n  - id: 1\n    val: a\n  - id: 2\n    val: b"
 
     def test_deeply_nested_structure(
         self, stream_encoder: ToonStreamEncoder, standard_encoder: ToonEncoder
@@ -183,3 +175,62 @@ class TestToonStreamEncoder:
         stream_gen = stream_encoder.iterencode(stream_list)
         result = "".join(stream_gen)
         assert "[0]:" in result
+
+    def test_stream_list_length_hint(self) -> None:
+        """Test StreamList iterates its items and reports its length as a hint."""
+        stream_list = StreamList(iterator=iter(["a", "b", "c"]), length=3)
+
+        assert operator.length_hint(stream_list) == 3
+        assert list(stream_list) == ["a", "b", "c"]
+
+    def test_root_list_header_on_own_line(self, stream_encoder: ToonStreamEncoder) -> None:
+        """Test root array items start on the line after the header."""
+        result = "".join(stream_encoder.iterencode(StreamList(iterator=iter([1, 2]), length=2)))
+        assert result == "[2]:\n  - 1\n  - 2"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [{"a": 1}, {"b": 2, "c": "x"}],
+            [{"id": 1, "meta": {"tags": ["x", "y"], "score": 0.5}}, {"id": 2}],
+            [{"meta": {"x": 1, "y": [1, 2]}, "b": 2}, {"rows": [{"k": 1}, {"j": 2}]}],
+            {"items": [{"a": [{"b": 1}, {"c": [1, {"d": 2}]}]}, {}], "after": True},
+            [[1, 2], [{"a": 1}], {}],
+        ],
+    )
+    def test_list_items_round_trip(self, stream_encoder: ToonStreamEncoder, data: Any) -> None:
+        """Test non-uniform and nested records decode back to the input."""
+        assert decode("".join(stream_encoder.iterencode(data))) == data
+
+    def test_list_item_nested_first_field(self, stream_encoder: ToonStreamEncoder) -> None:
+        """Test a nested first field is indented two levels below the hyphen."""
+        actual = "".join(stream_encoder.iterencode([{"meta": {"x": 1}, "id": 7}]))
+        assert actual == "[1]:\n  - meta:\n      x: 1\n    id: 7"
+
+    def test_iterencode_tabular_matches_standard(
+        self, stream_encoder: ToonStreamEncoder, standard_encoder: ToonEncoder
+    ) -> None:
+        """Test tabular streaming matches the standard root tabular encoding."""
+        rows = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob, Jr."}]
+
+        actual = "".join(stream_encoder.iterencode_tabular(iter(rows), 2, ["id", "name"]))
+
+        assert actual == standard_encoder.encode(rows)
+
+    def test_iterencode_bytes_matches_iterencode(self, stream_encoder: ToonStreamEncoder) -> None:
+        """Test byte blocks decode to the same text as the string stream."""
+        data = {"users": [{"id": i, "name": f"Usér {i}"} for i in range(50)]}
+
+        blocks = list(stream_encoder.iterencode_bytes(data, flush_size=256))
+
+        assert b"".join(blocks).decode("utf-8") == "".join(stream_encoder.iterencode(data))
+        assert all(len(block) >= 256 for block in blocks[:-1])
+        assert len(blocks) > 1
+
+    def test_buffered_skips_empty_chunks(self) -> None:
+        """Test empty chunks alone produce no block."""
+        assert list(buffered(iter(["", ""]))) == []
+
+    def test_buffered_empty(self) -> None:
+        """Test buffering an empty stream yields nothing."""
+        assert list(buffered(iter([]))) == []
@@ -111,6 +111,19 @@ class TestStringEncoderEncoding:
         assert self.encoder.encode("helloworld") == "helloworld"
         assert self.encoder.encode("test123") == "test123"
 
+    def test_number_like_prefix_does_not_need_quotes(self):
+        """Test strings that only start like numbers or reserved words stay bare."""
+        assert self.encoder.encode("12a") == "12a"
+        assert self.encoder.encode("1.5.") == "1.5."
+        assert self.encoder.encode("nulls") == "nulls"
+        assert self.encoder.encode("truely") == "truely"
+
+    def test_other_delimiters_do_not_need_quotes(self):
+        """Test only the active delimiter forces quoting."""
+        assert self.encoder.encode("a|b") == "a|b"
+        assert StringEncoder(Delimiter.PIPE).encode("a,b") == "a,b"
+        assert StringEncoder(Delimiter.PIPE).encode("a|b") == '"a|b"'
+
 
 class TestStringEncoderDecoding:
     """Test string decoding functionality."""
@@ -1,11 +1,12 @@
 """Comprehensive tests for utility modules."""
 
+import json
 from pathlib import Path
 
 import pytest
 
 from toonverter.core.exceptions import FileOperationError, ValidationError
-from toonverter.utils.io import read_file, write_file
+from toonverter.utils.io import iter_json_array, read_file, write_file
 from toonverter.utils.validation import (
     validate_data_not_empty,
     validate_file_exists,
@@ -46,6 +47,16 @@ class TestFileIO:
 
         assert result == content
 
+    def test_write_file_returns_byte_count(self, tmp_path):
+        """Test write_file returns the number of UTF-8 bytes written."""
+        file_path = tmp_path / "unicode.txt"
+        content = "Hello 世界 🌍\n"
+
+        written = write_file(str(file_path), content)
+
+        assert written == len(content.encode("utf-8"))
+        assert file_path.read_bytes() == content.encode("utf-8")
+
     def test_read_nonexistent_file_raises_error(self):
         """Test reading nonexistent file raises error."""
         with pytest.raises(FileOperationError, match="Failed to read file"):
@@ -65,6 +76,22 @@ class TestFileIO:
         result = read_file(str(file_path))
         assert result == ""
 
+    def test_read_file_translates_newlines(self, tmp_path):
+        """Test CRLF and CR line endings are read as LF."""
+        file_path = tmp_path / "crlf.txt"
+        file_path.write_bytes(b"a\r\nb\rc\n")
+
+        assert read_file(str(file_path)) == "a\nb\nc\n"
+
+    def test_read_large_file_memory_mapped(self, tmp_path, monkeypatch):
+        """Test files above the mmap threshold are read in full."""
+        monkeypatch.setattr("toonverter.utils.io.MMAP_THRESHOLD", 16)
+        file_path = tmp_path / "large.toon"
+        content = "key: 世界\r\n" * 100
+        file_path.write_bytes(content.encode("utf-8"))
+
+        assert read_file(str(file_path)) == content.replace("\r\n", "\n")
+
     def test_write_file_multiline(self, tmp_path):
         """Test writing multiline content."""
         file_path = tmp_path / "multiline.txt"
@@ -75,6 +102,38 @@ class TestFileIO:
 
         assert result == content
 
+    def test_iter_json_array_small_chunks(self, tmp_path):
+        """Test array items are decoded across chunk boundaries."""
+        items = [{"id": 1, "tags": ["a", "b"]}, 12345, -1.5e10, "x, ]", None, []]
+        file_path = tmp_path / "items.json"
+        file_path.write_text(" [\n" + ",\n".join(json.dumps(i) for i in items) + "\n] \n")
+
+        assert list(iter_json_array(str(file_path), chunk_size=3)) == items
+
+    def test_iter_json_array_empty(self, tmp_path):
+        """Test an empty array yields nothing."""
+        file_path = tmp_path / "empty.json"
+        file_path.write_text("[ ]")
+
+        assert list(iter_json_array(str(file_path))) == []
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            ('{"a": 1}', "not an array"),
+            ("[1, 2", "Unexpected end"),
+            ("[1 2]", "Expected ','"),
+            ("[1] 2", "Extra data"),
+        ],
+    )
+    def test_iter_json_array_invalid(self, tmp_path, content, message):
+        """Test non-array and malformed documents raise ValueError."""
+        file_path = tmp_path / "bad.json"
+        file_path.write_text(content)
+
+        with pytest.raises(ValueError, match=message):
+            list(iter_json_array(str(file_path), chunk_size=2))
+
 
 class TestFileValidation:
     """Test file validation utilities."""